@@ -1,27 +1,73 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Query, Response
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, BackgroundTasks, FastAPI, HTTPException, UploadFile, File, Query, Request, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.encoders import jsonable_encoder
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+try:
+    import fcntl
+except ModuleNotFoundError:  # Windows: the id counter and state locks fall back to in-process locks
+    fcntl = None
 from starlette.staticfiles import StaticFiles
-from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
-from typing import List, Optional
-import sys
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
+from anyio import to_thread
+from contextlib import asynccontextmanager, contextmanager, suppress
+from typing import Iterator, List, Optional
+import asyncio
+import atexit
+import copy
+import inspect
+import logging
+import queue
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from itertools import chain, islice
+from operator import itemgetter
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-import base64
 import csv
-from datetime import datetime, date, timedelta
+import hashlib
+import heapq
+from html import escape
+from datetime import datetime, date, timedelta, timezone
+from decimal import Decimal
 import json
 import random
 
-sys.path.insert(0, str(Path(__file__).parent))
 
-from src.models.schemas import ImageRequest, ImageResponse, ErrorResponse
+def _configure_logging() -> None:
+    """Route log records through a QueueHandler; a QueueListener thread does the blocking stream writes."""
+    root = logging.getLogger()
+    if any(isinstance(h, QueueHandler) for h in root.handlers):
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+_configure_logging()
+logger = logging.getLogger("healthops")
+
+
+from src.models.schemas import ErrorResponse
 from src.models.data_schemas import (
     CaregiverResponse,
     ReferralResponse,
     DataStatsResponse,
     DashboardMetricsResponse,
 )
-from src.services.landingai_service import LandingAIService
+from src.services.registry import get_landingai_service
+from src.routers import landingai as landingai_router
 from src.services.agent_workflow import AgentWorkflow
 try:
     from src.services.crew_workflow import HealthOpsCrewWorkflow
@@ -34,70 +80,191 @@ from src.services.sorting_agent import sorting_agent
 from database.db_service import DatabaseService
 
 
+if orjson is not None:
+    class DefaultJSONResponse(ORJSONResponse):
+        """ORJSONResponse that also encodes Decimal (psycopg2 NUMERIC), so DB rows can be returned directly."""
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(
+                content,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+else:
+    class DefaultJSONResponse(JSONResponse):
+        """Stdlib fallback; runs jsonable_encoder so directly returned rows with dates still serialize."""
+
+        def render(self, content) -> bytes:
+            return super().render(jsonable_encoder(content))
+
+
+def _json_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError
+
+
+def _json_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(jsonable_encoder(obj), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+
+
+_THREADPOOL_SIZE = int(os.getenv("HEALTHOPS_THREADPOOL_SIZE", "64"))
+
 landingai_service = None
 db_service = None
 agent_workflow = None
 crew_workflow = None
+# Resolved from the scheduling agent config in lifespan
+max_pending_referrals = 50
+# Pending-referrals SQL built from the rules engine's generated WHERE clause, as (rules file mtime_ns, query).
+# Keyed on the rules file so a reload-rules call handled by another worker is picked up here too.
+_pending_referrals_sql: Optional[tuple[Optional[int], str]] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global landingai_service, db_service, agent_workflow, crew_workflow
+    global landingai_service, db_service, agent_workflow, crew_workflow, max_pending_referrals
+    # CSV parsing, page streaming and DB calls all run in the threadpool; anyio's default is 40 tokens
+    to_thread.current_default_thread_limiter().total_tokens = _THREADPOOL_SIZE
     try:
-        landingai_service = LandingAIService()
-        print("Landing AI service initialized successfully")
+        landingai_service = get_landingai_service()
+        logger.info("Landing AI service initialized successfully")
     except Exception as e:
         landingai_service = None
-        print(f"Warning: Landing AI service not initialized - {e}")
+        logger.warning("Landing AI service not initialized - %s", e)
+    app.state.landingai_service = landingai_service
     
     db_service = DatabaseService()
     result = db_service.connect()
     if result['success']:
-        print("Database service initialized successfully")
+        logger.info("Database service initialized successfully")
     else:
-        print(f"Warning: Database connection failed - {result['message']}")
+        logger.warning("Database connection failed - %s", result['message'])
     
     agent_workflow = AgentWorkflow()
-    print("Agent Workflow initialized successfully")
+    max_pending_referrals = getattr(getattr(agent_workflow, "scheduling_agent", None), "max_pending_referrals", 50)
+    logger.info("Agent Workflow initialized successfully")
     
     if HealthOpsCrewWorkflow is None:
-        print(
-            "Warning: Crew AI workflow not available - "
-            f"{_crew_workflow_import_error}"
-        )
+        logger.warning("Crew AI workflow not available - %s", _crew_workflow_import_error)
         crew_workflow = None
     else:
         try:
             crew_workflow = HealthOpsCrewWorkflow()
-            print("Crew AI Workflow initialized successfully")
+            logger.info("Crew AI Workflow initialized successfully")
         except Exception as e:
-            print(f"Warning: Crew AI initialization failed - {e}")
+            logger.warning("Crew AI initialization failed - %s", e)
             crew_workflow = None
     
+    if AUTOPILOT_ENABLED:
+        app.state.autopilot_wake = asyncio.Event()
+        app.state.autopilot_task = asyncio.create_task(_autopilot_loop(app.state.autopilot_wake))
+
     yield
-    
+
+    app.state.autopilot_wake = None
+    autopilot_task = getattr(app.state, "autopilot_task", None)
+    if autopilot_task:
+        autopilot_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await autopilot_task
     if db_service:
         db_service.disconnect()
-    print("Shutting down...")
+    DatabaseService.close_pool()
+    logger.info("Shutting down...")
 
 
-app = FastAPI(
-    title="HealthOps API",
-    description="Landing AI-powered medical image processing for healthcare operations",
-    version="1.0.0",
-    lifespan=lifespan
-)
+# Explicit origin allowlist (comma-separated HEALTHOPS_CORS_ORIGINS overrides the local dev defaults)
+_CORS_ORIGINS = [
+    o.strip()
+    for o in os.getenv(
+        "HEALTHOPS_CORS_ORIGINS",
+        "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173",
+    ).split(",")
+    if o.strip()
+]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
+class CORSLite:
+    """Pure-ASGI CORS for an origin allowlist.
+
+    Preflights are answered directly and allowed origins get their headers appended to
+    `http.response.start`, without Starlette's Request/Response wrapping per call.
+    """
+
+    def __init__(self, app, allow_origins, allow_methods=("GET", "POST"),
+                 allow_headers=("Content-Type", "Authorization"), max_age=86400):
+        self.app = app
+        self.allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self.preflight_headers = [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        origin = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        allowed = origin in self.allow_origins
+
+        if is_preflight and scope["method"] == "OPTIONS":
+            if allowed:
+                status, body = 204, b""
+                headers = [(b"access-control-allow-origin", origin), (b"vary", b"Origin")] + self.preflight_headers
+            else:
+                status, body = 400, b"Disallowed CORS origin"
+                headers = [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode())]
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
 
-@app.get("/")
+
+async def log_request_timing(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info("%s %s -> %s in %.1fms", request.method, request.url.path, response.status_code, elapsed_ms)
+    return response
+
+
+# Endpoints defined in this module; create_app() includes them alongside the service routers
+router = APIRouter()
+
+
+@router.get("/")
 async def root():
     return {
         "message": "HealthOps API - Landing AI Image Processing",
@@ -106,7 +273,7 @@ async def root():
     }
 
 
-@app.get("/health")
+@router.get("/health")
 async def health_check():
     return {
         "status": "healthy",
@@ -128,12 +295,85 @@ SCHEDULING_OVERRIDES_PATH = DATA_DIR / "scheduling_overrides.json"
 REFERRALS_RUNTIME_PATH = DATA_DIR / "referrals_runtime.json"
 COMPLIANCE_DOCS_PATH = DATA_DIR / "compliance_runtime.json"
 JOURNEY_OVERRIDES_PATH = DATA_DIR / "journey_overrides.json"
+REFERRAL_ID_COUNTER_PATH = DATA_DIR / "referral_id_counter.json"
 
 # Demo autopilot settings (kept simple and deterministic for showcase)
 AUTOPILOT_ENABLED = True
 AUTOPILOT_HOME_ASSESSMENT_DELAY_SEC = 25
 AUTOPILOT_READY_TO_BILL_DELAY_SEC = 25
 AUTOPILOT_COMPLETE_DELAY_SEC = 25
+# Background tick period; a fraction of the stage delays so progression stays timely
+AUTOPILOT_TICK_INTERVAL_SEC = AUTOPILOT_HOME_ASSESSMENT_DELAY_SEC / 5
+
+# Serializes read-modify-write of the file-mode JSON state: the autopilot ticks in a
+# worker thread while request handlers record events and save runtime referrals.
+# Take it through _file_state_locked(), which adds the cross-process flock.
+_FILE_STATE_LOCK = threading.RLock()
+_FILE_STATE_LOCK_PATH = DATA_DIR / ".file_state.lock"
+# Lock file held while this process owns the flock, and the RLock nesting depth above it
+_file_state_flock: Optional[tuple] = None
+
+
+@contextmanager
+def _file_state_locked():
+    """Hold the file-state lock across threads and uvicorn worker processes.
+
+    The RLock serializes threads in this process; the outermost holder also flocks
+    _FILE_STATE_LOCK_PATH so workers don't overwrite each other's read-modify-write.
+    Reentrant like the RLock: nested sections reuse the held flock.
+    """
+    global _file_state_flock
+    with _FILE_STATE_LOCK:
+        if _file_state_flock is None:
+            f = None
+            if fcntl is not None:
+                _FILE_STATE_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+                f = open(_FILE_STATE_LOCK_PATH, "a+b")
+                fcntl.flock(f, fcntl.LOCK_EX)
+            _file_state_flock = (f, 0)
+        f, depth = _file_state_flock
+        _file_state_flock = (f, depth + 1)
+        try:
+            yield
+        finally:
+            if depth == 0:
+                _file_state_flock = None
+                if f is not None:
+                    f.close()  # releases the flock
+            else:
+                _file_state_flock = (f, depth)
+
+
+class _NormalizedValues(dict):
+    """raw value -> normalized string, memoized on first sight.
+
+    For the enum-like columns (statuses, urgency, segment) that take a handful of
+    distinct values: a hit is one dict lookup instead of str/strip/upper per access.
+    """
+
+    _MAX_ENTRIES = 256
+
+    def __init__(self, normalize):
+        super().__init__()
+        self._normalize = normalize
+
+    def __missing__(self, value):
+        norm = self._normalize(str(value or "").strip())
+        if len(self) < self._MAX_ENTRIES:
+            self[value] = norm
+        return norm
+
+
+_UPPER = _NormalizedValues(str.upper)
+_LOWER = _NormalizedValues(str.lower)
+
+
+def _is_yes(row: dict, field: str) -> bool:
+    """True if a Y/N flag column is "Y" (case/whitespace-insensitive; missing counts as N)."""
+    v = row.get(field)
+    if v == "Y":
+        return True
+    return bool(v) and str(v).strip().upper() == "Y"
 
 
 def _safe_date(value) -> Optional[date]:
@@ -151,109 +391,158 @@ def _safe_date(value) -> Optional[date]:
         return None
 
 
-def _load_scheduling_overrides() -> dict:
+# Parsed JSON state files keyed by path; entries are reused while (mtime_ns, size) is unchanged.
+# Writes go through _write_json_state so the entry is refreshed without a re-parse.
+_JSON_CACHE: dict[Path, tuple[int, int, object]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+
+def _json_loads(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _json_state_bytes(obj) -> bytes:
+    """Serialize a state file: 2-space indent, UTF-8 with non-ASCII kept (same layout either way)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _read_json_cached(path: Path, expected: type):
+    """Return the parsed JSON at `path`, or an empty `expected` if missing/invalid.
+
+    The returned object is shared with the cache: read it, never mutate it.
+    """
     try:
-        if not SCHEDULING_OVERRIDES_PATH.exists():
-            return {}
-        with open(SCHEDULING_OVERRIDES_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
+        st = path.stat()
+    except OSError:
+        return expected()
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
     except Exception:
-        return {}
+        return expected()
+    if not isinstance(data, expected):
+        data = expected()
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _write_json_state(path: Path, data) -> None:
+    """Atomically replace `path` with `data` as JSON (write a sibling temp file, then os.replace).
+
+    Skipped when `data` equals the cached copy of the unchanged file, so idle autopilot
+    ticks and repeated saves do not rewrite whole state files.
+    """
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[2] == data:
+        try:
+            st = path.stat()
+            if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return
+        except OSError:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    raw = _json_state_bytes(data)
+    # Per-writer temp name so concurrent saves never interleave into one file
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        # os.replace keeps the temp file's mtime, so stat before another writer can swap in theirs
+        st = tmp.stat()
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # Cache a snapshot of what was written; callers keep ownership of `data`
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, _json_loads(raw))
+
+
+def _load_scheduling_overrides() -> dict:
+    return copy.deepcopy(_read_json_cached(SCHEDULING_OVERRIDES_PATH, dict))
 
 
 def _save_scheduling_overrides(overrides: dict) -> None:
-    SCHEDULING_OVERRIDES_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(SCHEDULING_OVERRIDES_PATH, "w", encoding="utf-8") as f:
-        json.dump(overrides, f, indent=2, ensure_ascii=False)
+    _write_json_state(SCHEDULING_OVERRIDES_PATH, overrides)
 
 
-def _apply_scheduling_overrides(row: dict) -> dict:
-    """Merge locally persisted scheduling updates into a referral row (CSV fallback mode)."""
-    try:
-        overrides = _load_scheduling_overrides()
-        rid = str(row.get("referral_id") or "").strip()
-        if not rid:
-            return row
-        o = overrides.get(rid)
-        if not isinstance(o, dict):
-            return row
-
-        # Standardize fields used by the UI
-        if o.get("schedule_status"):
-            row["schedule_status"] = o.get("schedule_status")
-        if o.get("scheduled_date"):
-            row["scheduled_date"] = o.get("scheduled_date")
-        if o.get("assigned_caregiver_id"):
-            row["assigned_caregiver_id"] = o.get("assigned_caregiver_id")
-        return row
-    except Exception:
-        return row
+def _store_scheduling_override(rid: str, override: dict) -> None:
+    """Persist one referral's scheduling override (read-modify-write under the state lock)."""
+    with _file_state_locked():
+        # Only the top-level mapping changes, so a shallow copy of the cached dict is enough
+        overrides = dict(_read_json_cached(SCHEDULING_OVERRIDES_PATH, dict))
+        overrides[rid] = override
+        _save_scheduling_overrides(overrides)
 
 
 def _load_journey_overrides() -> dict:
-    try:
-        if not JOURNEY_OVERRIDES_PATH.exists():
-            return {}
-        with open(JOURNEY_OVERRIDES_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
+    return copy.deepcopy(_read_json_cached(JOURNEY_OVERRIDES_PATH, dict))
 
 
 def _save_journey_overrides(overrides: dict) -> None:
-    JOURNEY_OVERRIDES_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(JOURNEY_OVERRIDES_PATH, "w", encoding="utf-8") as f:
-        json.dump(overrides, f, indent=2, ensure_ascii=False)
+    _write_json_state(JOURNEY_OVERRIDES_PATH, overrides)
+
+
+# Row fields set by each journey stage event (CSV fallback mode); later events win
+_JOURNEY_STAGE_EFFECTS: dict[str, tuple[tuple[str, str], ...]] = {
+    "DOCS_COMPLETED": (("docs_complete", "Y"), ("agent_next_action", "Schedule home assessment")),
+    "HOME_ASSESSMENT_SCHEDULED": (("agent_next_action", "Complete home assessment"),),
+    "HOME_ASSESSMENT_COMPLETED": (("home_assessment_done", "Y"), ("agent_next_action", "Run AI scheduler")),
+    "SERVICE_STARTED": (("agent_next_action", "Deliver authorized units"),),
+    "READY_TO_BILL": (("ready_to_bill", "Y"), ("agent_next_action", "Submit claim")),
+    "SERVICE_COMPLETED": (
+        ("service_complete", "Y"),
+        ("schedule_status", "COMPLETED"),
+        ("agent_next_action", "Completed"),
+    ),
+}
 
 
-def _apply_journey_overrides(row: dict) -> dict:
-    """Merge persisted journey events into a referral row (CSV fallback mode)."""
-    try:
+def _apply_all_overrides(rows: list[dict], sched: Optional[dict] = None, journey: Optional[dict] = None) -> list[dict]:
+    """Merge persisted scheduling updates and journey events into referral rows in place.
+
+    Both override files are read once per call (pass them in to share across calls).
+    """
+    if sched is None:
+        sched = _read_json_cached(SCHEDULING_OVERRIDES_PATH, dict)
+    if journey is None:
+        journey = _read_json_cached(JOURNEY_OVERRIDES_PATH, dict)
+    if not sched and not journey:
+        return rows
+    effects = _JOURNEY_STAGE_EFFECTS
+    for row in rows:
         rid = str(row.get("referral_id") or "").strip()
         if not rid:
-            return row
+            continue
 
-        overrides = _load_journey_overrides()
-        entry = overrides.get(rid)
-        if not isinstance(entry, dict):
-            return row
-        events = entry.get("events")
-        if not isinstance(events, list) or not events:
-            return row
+        so = sched.get(rid)
+        if isinstance(so, dict):
+            # Standardize fields used by the UI
+            for k in ("schedule_status", "scheduled_date", "assigned_caregiver_id"):
+                v = so.get(k)
+                if v:
+                    row[k] = v
 
-        # Apply events in order; later events win
+        jo = journey.get(rid)
+        if not isinstance(jo, dict):
+            continue
+        events = jo.get("events")
+        if not isinstance(events, list) or not events:
+            continue
         for ev in events:
             if not isinstance(ev, dict):
                 continue
-            stage = str(ev.get("stage") or "").strip().upper()
-            if not stage:
-                continue
-
-            if stage == "DOCS_COMPLETED":
-                row["docs_complete"] = "Y"
-                row["agent_next_action"] = "Schedule home assessment"
-            elif stage == "HOME_ASSESSMENT_SCHEDULED":
-                row["agent_next_action"] = "Complete home assessment"
-            elif stage == "HOME_ASSESSMENT_COMPLETED":
-                row["home_assessment_done"] = "Y"
-                row["agent_next_action"] = "Run AI scheduler"
-            elif stage == "SERVICE_STARTED":
-                row["agent_next_action"] = "Deliver authorized units"
-            elif stage == "READY_TO_BILL":
-                row["ready_to_bill"] = "Y"
-                row["agent_next_action"] = "Submit claim"
-            elif stage == "SERVICE_COMPLETED":
-                row["service_complete"] = "Y"
-                row["schedule_status"] = "COMPLETED"
-                row["agent_next_action"] = "Completed"
-
-        row["journey_current_stage"] = str(entry.get("current_stage") or "")
-        row["journey_updated_at"] = str(entry.get("updated_at") or "")
-        return row
-    except Exception:
-        return row
+            for k, v in effects.get(str(ev.get("stage") or "").strip().upper(), ()):
+                row[k] = v
+        row["journey_current_stage"] = str(jo.get("current_stage") or "")
+        row["journey_updated_at"] = str(jo.get("updated_at") or "")
+    return rows
 
 
 def _parse_iso_datetime(s: str) -> Optional[datetime]:
@@ -271,70 +560,159 @@ def _parse_iso_datetime(s: str) -> Optional[datetime]:
         return None
 
 
+def _journey_entry(overrides: dict, rid: str) -> dict:
+    """Return the journey entry for `rid` (attached to `overrides` if new) with a usable `by_stage` index.
+
+    `by_stage` maps each stage to the position of its first event in `events`; entries
+    written before the index existed get it rebuilt here.
+    """
+    entry = overrides.get(rid)
+    if not isinstance(entry, dict):
+        entry = {"events": []}
+        overrides[rid] = entry
+    events = entry.get("events")
+    if not isinstance(events, list):
+        events = entry["events"] = []
+    by_stage = entry.get("by_stage")
+    if not isinstance(by_stage, dict):
+        by_stage = entry["by_stage"] = {}
+        for i, ev in enumerate(events):
+            if isinstance(ev, dict):
+                st = str(ev.get("stage") or "").strip().upper()
+                if st:
+                    by_stage.setdefault(st, i)
+    return entry
+
+
+def _journey_stage_event(entry: dict, stage: str) -> Optional[dict]:
+    """First event recorded for `stage` in a journey entry, via its `by_stage` index."""
+    i = entry.get("by_stage", {}).get(stage)
+    events = entry.get("events") or []
+    if isinstance(i, int) and 0 <= i < len(events) and isinstance(events[i], dict):
+        return events[i]
+    return None
+
+
+def _journey_event_ts(ev: dict) -> Optional[float]:
+    """Epoch seconds of a journey event: its `at_ts`, else parsed from `at` (events written before `at_ts`)."""
+    ts = ev.get("at_ts")
+    if isinstance(ts, (int, float)):
+        return ts
+    at = _parse_iso_datetime(ev.get("at"))
+    return at.replace(tzinfo=timezone.utc).timestamp() if at else None
+
+
+def _utc_now() -> tuple[datetime, str, float]:
+    """Current UTC time as (naive datetime, ISO string with Z, epoch seconds), read once."""
+    now = datetime.utcnow()
+    return now, now.isoformat() + "Z", now.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _append_journey_event(entry: dict, ev: dict) -> None:
+    """Append an event to a journey entry, keeping `by_stage` and the current stage in step."""
+    st = ev["stage"]
+    events = entry["events"]
+    entry["by_stage"].setdefault(st, len(events))
+    events.append(ev)
+    entry["current_stage"] = st
+    entry["updated_at"] = ev["at"]
+
+
+def _record_journey_event_in(
+    overrides: dict,
+    rid: str,
+    stage: str,
+    source: str = "system",
+    note: str = "",
+    now: Optional[tuple[datetime, str, float]] = None,
+) -> None:
+    """Append a journey event (deduped by stage) to an already-loaded overrides dict.
+
+    `now` is a _utc_now() triple; batch callers pass one per tick instead of re-reading the clock.
+    """
+    rid = str(rid or "").strip()
+    st = str(stage or "").strip().upper()
+    if not rid or not st:
+        return
+    entry = _journey_entry(overrides, rid)
+    _, now_iso, now_ts = now or _utc_now()
+
+    # If stage already exists, don't add again; re-recording the current stage is a no-op
+    # so idle autopilot ticks leave the data (and the files) untouched
+    if st in entry["by_stage"]:
+        if entry.get("current_stage") != st:
+            entry["current_stage"] = st
+            entry["updated_at"] = now_iso
+        return
+
+    ev = {
+        "stage": st,
+        "at": now_iso,
+        "at_ts": now_ts,
+        "source": source,
+        "note": (note or "").strip(),
+    }
+    _append_journey_event(entry, ev)
+
+
 def _record_journey_event(rid: str, stage: str, source: str = "system", note: str = "") -> None:
     """Append a journey event (deduped by stage) in file mode store."""
     try:
-        rid = str(rid or "").strip()
-        st = str(stage or "").strip().upper()
-        if not rid or not st:
-            return
-        overrides = _load_journey_overrides()
-        entry = overrides.get(rid)
-        if not isinstance(entry, dict):
-            entry = {"events": []}
-        events = entry.get("events")
-        if not isinstance(events, list):
-            events = []
-
-        # If stage already exists, don't add again
-        if any(isinstance(ev, dict) and str(ev.get("stage") or "").strip().upper() == st for ev in events):
-            entry["current_stage"] = st
-            entry["updated_at"] = datetime.utcnow().isoformat() + "Z"
-            overrides[rid] = entry
+        with _file_state_locked():
+            overrides = _load_journey_overrides()
+            _record_journey_event_in(overrides, rid, stage, source=source, note=note)
             _save_journey_overrides(overrides)
-            return
-
-        ev = {
-            "stage": st,
-            "at": datetime.utcnow().isoformat() + "Z",
-            "source": source,
-            "note": (note or "").strip(),
-        }
-        events.append(ev)
-        entry["events"] = events
-        entry["current_stage"] = st
-        entry["updated_at"] = ev["at"]
-        overrides[rid] = entry
-        _save_journey_overrides(overrides)
     except Exception:
         return
 
 
-def _select_available_caregiver(referral: dict, caregivers: list[dict], assignments: dict, referrals: list[dict]) -> Optional[str]:
-    """Pick an active caregiver with available capacity, preferring same city."""
-    try:
-        city = str(referral.get("patient_city") or "").strip()
-        load = _compute_caregiver_load(assignments, referrals)
+def _store_journey_event(rid: str, ev: dict) -> None:
+    """Persist an event as-is (no stage dedupe), e.g. a manual advance from the UI."""
+    with _file_state_locked():
+        overrides = _load_journey_overrides()
+        _append_journey_event(_journey_entry(overrides, rid), ev)
+        _save_journey_overrides(overrides)
+
+
+class _CaregiverPicker:
+    """Caregiver selection for one autopilot tick.
 
-        def ok(c: dict) -> bool:
-            if str(c.get("active") or "").strip().upper() != "Y":
-                return False
+    Picks the first active caregiver (CSV order) with spare capacity in the referral's city,
+    else the first one anywhere. Caregivers are bucketed by city once and each bucket keeps
+    a cursor past caregivers that are full (load only grows during a tick), so a pick is
+    amortized O(1) instead of rescanning caregivers and referrals.
+    """
+
+    def __init__(self, caregivers: list[dict], load: dict[str, int]):
+        self.load = dict(load)
+        self.capacity: dict[str, int] = {}
+        self.by_city: dict[Optional[str], list[str]] = {None: []}
+        self.cursors: dict[Optional[str], int] = {}
+        for c in caregivers:
+            if not _is_yes(c, "active"):
+                continue
             cg_id = str(c.get("caregiver_id") or "").strip()
             if not cg_id:
-                return False
-            cap = _caregiver_capacity(c)
-            used = load.get(cg_id, 0)
-            return used < cap
-
-        same_city = [c for c in caregivers if ok(c) and str(c.get("city") or "").strip() == city]
-        if same_city:
-            return str(same_city[0].get("caregiver_id"))
-        any_city = [c for c in caregivers if ok(c)]
-        if any_city:
-            return str(any_city[0].get("caregiver_id"))
-        return None
-    except Exception:
-        return None
+                continue
+            self.capacity[cg_id] = _caregiver_capacity(c)
+            self.by_city.setdefault(str(c.get("city") or "").strip(), []).append(cg_id)
+            self.by_city[None].append(cg_id)
+
+    def _first_open(self, key: Optional[str]) -> Optional[str]:
+        ids = self.by_city.get(key) or []
+        i = self.cursors.get(key, 0)
+        while i < len(ids) and self.load.get(ids[i], 0) >= self.capacity[ids[i]]:
+            i += 1
+        self.cursors[key] = i
+        return ids[i] if i < len(ids) else None
+
+    def pick(self, referral: dict) -> Optional[str]:
+        """Return a caregiver id for the referral and count the assignment against its capacity."""
+        city = str(referral.get("patient_city") or "").strip()
+        cg_id = self._first_open(city) or self._first_open(None)
+        if cg_id:
+            self.load[cg_id] = self.load.get(cg_id, 0) + 1
+        return cg_id
 
 
 def _autopilot_should_run(referral: dict) -> bool:
@@ -348,148 +726,247 @@ def _autopilot_should_run(referral: dict) -> bool:
     return False
 
 
-def _autopilot_tick_for_referral(referral: dict) -> None:
-    """Automatic journey progression + optional auto-scheduling (file mode only)."""
+def _autopilot_tick_for_referral(
+    referral: dict, journey: dict, sched: dict, ctx: dict, now: tuple[datetime, str, float]
+) -> bool:
+    """Automatic journey progression + optional auto-scheduling (file mode only).
+
+    Mutates the loaded `journey` and `sched` override dicts in place; the caller saves them.
+    `ctx` memoizes per-tick inputs (the caregiver picker); `now` is the tick's _utc_now().
+    Returns True if `sched` changed.
+    """
+    sched_changed = False
+    _, now_iso, now_ts = now
     try:
         if not AUTOPILOT_ENABLED:
-            return
+            return False
         if not isinstance(referral, dict):
-            return
+            return False
         rid = str(referral.get("referral_id") or "").strip()
         if not rid:
-            return
+            return False
         if not _autopilot_should_run(referral):
-            return
-        if str(referral.get("service_complete") or "").strip().upper() == "Y":
-            _record_journey_event(rid, "SERVICE_COMPLETED", source="autopilot")
-            return
+            return False
+        if _is_yes(referral, "service_complete"):
+            _record_journey_event_in(journey, rid, "SERVICE_COMPLETED", source="autopilot", now=now)
+            return False
 
         # Always ensure intake event
-        _record_journey_event(rid, "INTAKE_RECEIVED", source="autopilot")
+        _record_journey_event_in(journey, rid, "INTAKE_RECEIVED", source="autopilot", now=now)
 
         # Docs completion heuristic for runtime referrals: LandingAI parse implies docs exist
-        if str(referral.get("docs_complete") or "").strip().upper() != "Y":
-            _record_journey_event(rid, "DOCS_COMPLETED", source="autopilot", note="Docs inferred from intake")
+        if not _is_yes(referral, "docs_complete"):
+            _record_journey_event_in(journey, rid, "DOCS_COMPLETED", source="autopilot", note="Docs inferred from intake", now=now)
 
         # If auth is required and not approved, stop at auth pending
-        insurance_ok = str(referral.get("insurance_active") or "").strip().upper() == "Y"
-        auth_required = str(referral.get("auth_required") or "").strip().upper() == "Y"
-        auth_status = str(referral.get("auth_status") or "").strip().upper()
+        insurance_ok = _is_yes(referral, "insurance_active")
+        auth_required = _is_yes(referral, "auth_required")
+        auth_status = _UPPER[referral.get("auth_status")]
         if insurance_ok and auth_required and auth_status != "APPROVED":
-            _record_journey_event(rid, "AUTH_PENDING", source="autopilot")
-            return
+            _record_journey_event_in(journey, rid, "AUTH_PENDING", source="autopilot", now=now)
+            return False
 
         # Home assessment schedule/complete
-        overrides = _load_journey_overrides()
-        entry = overrides.get(rid) if isinstance(overrides, dict) else None
-        entry = entry if isinstance(entry, dict) else {"events": []}
-        events = entry.get("events") if isinstance(entry.get("events"), list) else []
+        entry = _journey_entry(journey, rid)
+        ev = _journey_stage_event(entry, "HOME_ASSESSMENT_SCHEDULED")
+        if not ev:
+            _record_journey_event_in(journey, rid, "HOME_ASSESSMENT_SCHEDULED", source="autopilot", now=now)
+            return False
 
-        def has_stage(st: str) -> Optional[dict]:
-            for ev in events:
-                if isinstance(ev, dict) and str(ev.get("stage") or "").strip().upper() == st:
-                    return ev
-            return None
-
-        if not has_stage("HOME_ASSESSMENT_SCHEDULED"):
-            _record_journey_event(rid, "HOME_ASSESSMENT_SCHEDULED", source="autopilot")
-            return
-
-        if str(referral.get("home_assessment_done") or "").strip().upper() != "Y":
-            ev = has_stage("HOME_ASSESSMENT_SCHEDULED")
-            at = _parse_iso_datetime(ev.get("at")) if ev else None
-            if at and (datetime.utcnow() - at).total_seconds() >= AUTOPILOT_HOME_ASSESSMENT_DELAY_SEC:
-                _record_journey_event(rid, "HOME_ASSESSMENT_COMPLETED", source="autopilot")
+        if not _is_yes(referral, "home_assessment_done"):
+            at_ts = _journey_event_ts(ev)
+            if at_ts is not None and now_ts - at_ts >= AUTOPILOT_HOME_ASSESSMENT_DELAY_SEC:
+                _record_journey_event_in(journey, rid, "HOME_ASSESSMENT_COMPLETED", source="autopilot", now=now)
 
         # Auto schedule if ready
-        if str(referral.get("schedule_status") or "").strip().upper() == "NOT_SCHEDULED" and insurance_ok:
+        schedule_status = _UPPER[referral.get("schedule_status")]
+        if schedule_status == "NOT_SCHEDULED" and insurance_ok:
             if not _db_ready():
                 # file mode caregiver pick + apply scheduling override
-                caregivers = _load_caregivers_csv()
-                overrides_sched = _load_scheduling_overrides()
-                assignments = {
-                    rrid: {
-                        "referral_id": rrid,
-                        "caregiver_id": o.get("assigned_caregiver_id"),
-                        "schedule_status": o.get("schedule_status"),
-                        "scheduled_date": o.get("scheduled_date"),
+                if "picker" not in ctx:
+                    assignments = {
+                        rrid: {
+                            "referral_id": rrid,
+                            "caregiver_id": o.get("assigned_caregiver_id"),
+                            "schedule_status": o.get("schedule_status"),
+                            "scheduled_date": o.get("scheduled_date"),
+                        }
+                        for rrid, o in sched.items()
+                        if isinstance(o, dict)
                     }
-                    for rrid, o in overrides_sched.items()
-                    if isinstance(o, dict)
-                }
-                all_refs = _load_referrals_csv()
-                caregiver_id = _select_available_caregiver(referral, caregivers, assignments, all_refs)
+                    load = _compute_caregiver_load(assignments, _load_referrals_csv(sched, journey))
+                    ctx["picker"] = _CaregiverPicker(_load_caregivers_csv(), load)
+                caregiver_id = ctx["picker"].pick(referral)
                 if caregiver_id:
-                    overrides_sched[rid] = {
+                    sched[rid] = {
                         "schedule_status": "SCHEDULED",
                         "scheduled_date": date.today().isoformat(),
                         "assigned_caregiver_id": caregiver_id,
-                        "updated_at": datetime.utcnow().isoformat() + "Z",
+                        "updated_at": now_iso,
                     }
-                    _save_scheduling_overrides(overrides_sched)
-                    _record_journey_event(rid, "SCHEDULED", source="autopilot", note=f"Auto-scheduled with {caregiver_id}")
+                    sched_changed = True
+                    _record_journey_event_in(journey, rid, "SCHEDULED", source="autopilot", note=f"Auto-scheduled with {caregiver_id}", now=now)
 
         # After scheduled, progress to billing and completion with delays
-        overrides = _load_journey_overrides()
-        entry = overrides.get(rid) if isinstance(overrides, dict) else None
-        entry = entry if isinstance(entry, dict) else {"events": []}
-        events = entry.get("events") if isinstance(entry.get("events"), list) else []
-        sched_ev = None
-        for ev in events:
-            if isinstance(ev, dict) and str(ev.get("stage") or "").strip().upper() == "SCHEDULED":
-                sched_ev = ev
-                break
-        if sched_ev and str(referral.get("schedule_status") or "").strip().upper() == "SCHEDULED":
-            at = _parse_iso_datetime(sched_ev.get("at"))
-            if at and (datetime.utcnow() - at).total_seconds() >= AUTOPILOT_READY_TO_BILL_DELAY_SEC:
-                _record_journey_event(rid, "READY_TO_BILL", source="autopilot")
-            rb_ev = None
-            for ev in events:
-                if isinstance(ev, dict) and str(ev.get("stage") or "").strip().upper() == "READY_TO_BILL":
-                    rb_ev = ev
-                    break
+        sched_ev = _journey_stage_event(entry, "SCHEDULED")
+        if sched_ev and schedule_status == "SCHEDULED":
+            at_ts = _journey_event_ts(sched_ev)
+            if at_ts is not None and now_ts - at_ts >= AUTOPILOT_READY_TO_BILL_DELAY_SEC:
+                _record_journey_event_in(journey, rid, "READY_TO_BILL", source="autopilot", now=now)
+            rb_ev = _journey_stage_event(entry, "READY_TO_BILL")
             if rb_ev:
-                rb_at = _parse_iso_datetime(rb_ev.get("at"))
-                if rb_at and (datetime.utcnow() - rb_at).total_seconds() >= AUTOPILOT_COMPLETE_DELAY_SEC:
-                    _record_journey_event(rid, "SERVICE_COMPLETED", source="autopilot")
+                rb_ts = _journey_event_ts(rb_ev)
+                if rb_ts is not None and now_ts - rb_ts >= AUTOPILOT_COMPLETE_DELAY_SEC:
+                    _record_journey_event_in(journey, rid, "SERVICE_COMPLETED", source="autopilot", now=now)
+        return sched_changed
     except Exception:
-        return
+        return sched_changed
 
 
 def _autopilot_tick_all() -> None:
-    """Best-effort autopilot tick for runtime referrals (file mode)."""
+    """Best-effort autopilot tick for runtime referrals (file mode).
+
+    Loads the override files once, ticks every referral against them in memory and
+    writes each file back at most once.
+    """
     try:
         if not AUTOPILOT_ENABLED:
             return
         if _db_ready():
             return
-        runtime = _load_runtime_referrals()
-        if not runtime:
-            return
-        for r in runtime:
-            _autopilot_tick_for_referral(r)
-        # Reload and save with applied overrides to keep state consistent
-        updated = _load_runtime_referrals()
-        _save_runtime_referrals(updated)
+        with _file_state_locked():
+            runtime = _load_runtime_referrals()
+            if not runtime:
+                return
+            journey = _load_journey_overrides()
+            sched = _load_scheduling_overrides()
+            ctx: dict = {}
+            now = _utc_now()
+            sched_changed = False
+            for r in runtime:
+                sched_changed |= _autopilot_tick_for_referral(r, journey, sched, ctx, now)
+            if sched_changed:
+                _save_scheduling_overrides(sched)
+            _save_journey_overrides(journey)
+            # Save runtime rows with applied overrides to keep state consistent
+            _save_runtime_referrals(_load_runtime_referrals(sched, journey))
     except Exception:
         return
 
 
-def _load_compliance_docs() -> list[dict]:
+_AUTOPILOT_LEADER_LOCK_PATH = DATA_DIR / ".autopilot_leader.lock"
+
+
+def _acquire_autopilot_leadership():
+    """Non-blocking flock on the leader lock file; the open file while held, else None.
+
+    Only the leader worker runs the periodic tick, so N uvicorn workers don't all tick.
+    """
+    _AUTOPILOT_LEADER_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    f = open(_AUTOPILOT_LEADER_LOCK_PATH, "a+b")
+    if fcntl is not None:  # without flock this is a single process, which always leads
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return None
+    return f
+
+
+async def _autopilot_loop(wake: asyncio.Event) -> None:
+    """Tick the file-mode autopilot in the background so request handlers only read state.
+
+    The leader worker ticks every AUTOPILOT_TICK_INTERVAL_SEC; any worker ticks early when
+    its `wake` is set (the state flock makes that safe). Wake-ups that arrive while a tick
+    is running coalesce into the next one.
+    """
+    leader = None
     try:
-        if not COMPLIANCE_DOCS_PATH.exists():
-            return []
-        with open(COMPLIANCE_DOCS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, list) else []
-    except Exception:
-        return []
+        while True:
+            woken = False
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), timeout=AUTOPILOT_TICK_INTERVAL_SEC)
+                woken = True
+            wake.clear()
+            if leader is None:
+                leader = await run_in_threadpool(_acquire_autopilot_leadership)
+            if woken or leader is not None:
+                await run_in_threadpool(_autopilot_tick_all)
+    finally:
+        if leader is not None:
+            leader.close()
+
+
+def _request_autopilot_tick(request: Request, background_tasks: BackgroundTasks) -> None:
+    """Ask for a prompt autopilot tick: wake the background loop, or tick after the response if it isn't running."""
+    wake = getattr(request.app.state, "autopilot_wake", None)
+    if wake is not None:
+        wake.set()
+    else:
+        background_tasks.add_task(_autopilot_tick_all)
+
+
+# Guardrail docs kept in the file-mode store (newest first)
+_COMPLIANCE_DOCS_MAX = 200
+
+
+def _load_compliance_docs() -> list[dict]:
+    return copy.deepcopy(_read_json_cached(COMPLIANCE_DOCS_PATH, list))
 
 
 def _save_compliance_docs(docs: list[dict]) -> None:
-    COMPLIANCE_DOCS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(COMPLIANCE_DOCS_PATH, "w", encoding="utf-8") as f:
-        json.dump(docs, f, indent=2, ensure_ascii=False)
+    _write_json_state(COMPLIANCE_DOCS_PATH, docs)
+
+
+def _prepend_compliance_docs(new_docs: list[dict]) -> None:
+    """Persist new guardrail docs ahead of the stored ones, keeping the newest _COMPLIANCE_DOCS_MAX.
+
+    Re-reads the file under the state lock so docs saved by a concurrent intake are kept.
+    """
+    with _file_state_locked():
+        current = _read_json_cached(COMPLIANCE_DOCS_PATH, list)
+        _save_compliance_docs((new_docs + current)[:_COMPLIANCE_DOCS_MAX])
+
+
+# Keyword tables for _classify_document_text, ordered as reported in `reasons`.
+# Plain substring checks: each is a C-level scan, which beats one combined `re`
+# alternation (backtracking, not a DFA) on this small keyword set.
+_REFERRAL_KEYWORDS = (
+    "referral",
+    "referring",
+    "patient",
+    "dob",
+    "date of birth",
+    "payer",
+    "authorization",
+    "auth required",
+    "plan type",
+    "diagnosis",
+    "home health",
+    "assessment",
+    "intake",
+    "start of care",
+)
+_COMPLIANCE_KEYWORDS = (
+    "compliance",
+    "policy",
+    "procedure",
+    "guideline",
+    "regulation",
+    "cms",
+    "hipaa",
+    "privacy",
+    "security rule",
+    "oig",
+    "fraud",
+    "abuse",
+    "audit",
+    "billing compliance",
+    "documentation requirements",
+)
+_COMPLIANCE_BOOST_KEYWORDS = frozenset(("compliance", "guideline", "policy"))
+# Text shorter than the shortest keyword cannot match anything
+_MIN_KEYWORD_LEN = min(len(kw) for kw in _REFERRAL_KEYWORDS + _COMPLIANCE_KEYWORDS)
 
 
 def _classify_document_text(text: str) -> dict:
@@ -497,55 +974,23 @@ def _classify_document_text(text: str) -> dict:
 
     Returns: {type: 'referral'|'compliance'|'other', confidence: 0..1, reasons: [..]}
     """
-    t = (text or "").lower()
-    t = " ".join(t.split())
-
-    referral_kw = [
-        "referral",
-        "referring",
-        "patient",
-        "dob",
-        "date of birth",
-        "payer",
-        "authorization",
-        "auth required",
-        "plan type",
-        "diagnosis",
-        "home health",
-        "assessment",
-        "intake",
-        "start of care",
-    ]
-    compliance_kw = [
-        "compliance",
-        "policy",
-        "procedure",
-        "guideline",
-        "regulation",
-        "cms",
-        "hipaa",
-        "privacy",
-        "security rule",
-        "oig",
-        "fraud",
-        "abuse",
-        "audit",
-        "billing compliance",
-        "documentation requirements",
-    ]
+    if not text or len(text) < _MIN_KEYWORD_LEN:
+        return {"type": "other", "confidence": 0.2, "reasons": ["no_keywords_detected"]}
 
-    referral_hits = [kw for kw in referral_kw if kw in t]
-    compliance_hits = [kw for kw in compliance_kw if kw in t]
+    t = " ".join(text.lower().split())
 
-    reasons: list[str] = []
-    score_ref = len(referral_hits)
+    compliance_hits = [kw for kw in _COMPLIANCE_KEYWORDS if kw in t]
     score_comp = len(compliance_hits)
+    # The boost terms are themselves keywords, so reuse the hit lists instead of rescanning
+    if _COMPLIANCE_BOOST_KEYWORDS.intersection(compliance_hits):
+        score_comp += 3
 
-    if "referral" in t:
+    referral_hits = [kw for kw in _REFERRAL_KEYWORDS if kw in t]
+    score_ref = len(referral_hits)
+    if "referral" in referral_hits:
         score_ref += 3
-    if "compliance" in t or "guideline" in t or "policy" in t:
-        score_comp += 3
 
+    reasons: list[str] = []
     if referral_hits:
         reasons.append(f"referral_keywords={referral_hits[:6]}")
     if compliance_hits:
@@ -566,48 +1011,106 @@ def _classify_document_text(text: str) -> dict:
         return {"type": "compliance", "confidence": 0.55, "reasons": reasons + ["ambiguous_prefer_compliance"]}
     return {"type": "other", "confidence": 0.5, "reasons": reasons + ["ambiguous"]}
 
-# Mount static files (CSS)
-if STATIC_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+# Parsed CSV rows keyed by (path, int fields); entries are reused while (mtime_ns, size) is unchanged.
+# Bounded LRU so ad-hoc paths (e.g. uploaded extracts) cannot grow it without limit.
+_CSV_CACHE: "OrderedDict[tuple[Path, frozenset[str]], tuple[int, int, list[dict]]]" = OrderedDict()
+_CSV_CACHE_MAX_ENTRIES = 32
+# Parses run concurrently in the threadpool; guards the LRU reordering/eviction
+_CSV_CACHE_LOCK = threading.Lock()
 
-def _csv_to_html_table(csv_path: Path, title: str) -> str:
-        try:
-                import csv
-                if not csv_path.exists():
-                        return f"<h2>{title}</h2><p>File not found: {csv_path}</p>"
-                rows = []
-                with open(csv_path, "r", encoding="utf-8") as f:
-                        reader = csv.reader(f)
-                        for row in reader:
-                                rows.append(row)
-                if not rows:
-                        return f"<h2>{title}</h2><p>No data available.</p>"
-                header = rows[0]
-                body = rows[1:]
-                th = "".join([f"<th>{h}</th>" for h in header])
-                trs = "\n".join(["<tr>" + "".join([f"<td>{c}</td>" for c in r]) + "</tr>" for r in body])
-                return f"""
+# Rows per streamed chunk when rendering CSV tables
+_HTML_TABLE_ROWS_PER_CHUNK = 200
+
+# csv module wants newline="" (no universal-newline translation); read in 1 MiB blocks
+_CSV_READ_BUFFER = 1 << 20
+
+
+def _render_table_rows(rows) -> str:
+    """Render rows of cells as escaped <tr>/<td> markup, joined once from a flat parts list."""
+    parts: list[str] = []
+    append = parts.append
+    esc = escape
+    for r in rows:
+        if not r:
+            append("<tr></tr>\n")
+            continue
+        append("<tr><td>")
+        append("</td><td>".join([esc(str(c), False) for c in r]))
+        append("</td></tr>\n")
+    return "".join(parts)
+
+
+def _iter_html_table(csv_path: Path, title: str) -> Iterator[str]:
+    """Yield a CSV as an HTML table incrementally: heading first, then batches of escaped rows."""
+    if not csv_path.exists():
+        yield f"<h2>{title}</h2><p>File not found: {csv_path}</p>"
+        return
+    try:
+        with open(csv_path, "r", encoding="utf-8", errors="replace", newline="", buffering=_CSV_READ_BUFFER) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                yield f"<h2>{title}</h2><p>No data available.</p>"
+                return
+            th = "".join([f"<th>{escape(h, quote=False)}</th>" for h in header])
+            yield f"""
                 <h2>{title}</h2>
                 <div class='table-container'>
                   <table class='data-table'>
                       <thead><tr>{th}</tr></thead>
                       <tbody>
-                          {trs}
+                """
+            for batch in iter(lambda: list(islice(reader, _HTML_TABLE_ROWS_PER_CHUNK)), []):
+                yield _render_table_rows(batch)
+        yield """
                       </tbody>
                   </table>
                 </div>
                 """
-        except Exception as e:
-                return f"<h2>{title}</h2><p>Error rendering table: {e}</p>"
+    except Exception as e:
+        yield f"<h2>{title}</h2><p>Error rendering table: {e}</p>"
 
 
-def _parse_csv_dicts(csv_path: Path) -> list[dict]:
+def _parse_csv_dicts(
+    csv_path: Path, int_fields: frozenset[str] = frozenset(), copy_rows: bool = True
+) -> list[dict]:
+    """Parse a CSV into row dicts, reusing the cached parse while the file is unchanged.
+
+    `int_fields` columns are coerced with _safe_int once at parse time, column by column,
+    so cache hits skip the coercion. Callers mutate rows (overrides), so each call
+    returns fresh row copies; read-only callers pass copy_rows=False to get the cached
+    rows themselves.
+    """
     try:
         if not csv_path.exists():
             return []
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        st = csv_path.stat()
+        key = (csv_path, int_fields)
+        cached = _CSV_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            with _CSV_CACHE_LOCK:
+                if key in _CSV_CACHE:
+                    _CSV_CACHE.move_to_end(key)
+            return [dict(r) for r in cached[2]] if copy_rows else cached[2]
+        with open(csv_path, "r", encoding="utf-8", errors="replace", newline="", buffering=_CSV_READ_BUFFER) as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            n = len(header)
+            # Same rows as DictReader: blank lines skipped, short rows padded with None.
+            rows = [
+                dict(zip(header, row if len(row) >= n else row + [None] * (n - len(row))))
+                for row in reader
+                if row
+            ]
+        for field in int_fields.intersection(header):
+            for r in rows:
+                r[field] = _safe_int(r.get(field))
+        with _CSV_CACHE_LOCK:
+            _CSV_CACHE[key] = (st.st_mtime_ns, st.st_size, rows)
+            _CSV_CACHE.move_to_end(key)
+            while len(_CSV_CACHE) > _CSV_CACHE_MAX_ENTRIES:
+                _CSV_CACHE.popitem(last=False)
+        return [dict(r) for r in rows] if copy_rows else rows
     except Exception:
         return []
 
@@ -619,68 +1122,192 @@ def _safe_float(x: str) -> float:
         return 0.0
 
 
-_REFERRAL_INT_FIELDS = {
+_REFERRAL_INT_FIELDS = frozenset({
     "auth_units_total",
     "auth_units_remaining",
     "contact_attempts",
     "units_scheduled_next_7d",
     "units_delivered_to_date",
     "patient_age",
-}
+})
+
+_CAREGIVER_INT_FIELDS = frozenset({"age"})
+
+# Columns written when a new referral is inserted in DB mode (extra row keys are ignored)
+_REFERRAL_INSERT_COLUMNS = (
+    'referral_id', 'use_case', 'service_type', 'referral_source',
+    'urgency', 'referral_received_date', 'first_outreach_date',
+    'last_activity_date', 'insurance_active', 'payer', 'plan_type',
+    'auth_required', 'auth_status', 'auth_start_date', 'auth_end_date',
+    'auth_units_total', 'auth_units_remaining', 'unit_type',
+    'docs_complete', 'home_assessment_done', 'patient_responsive',
+    'contact_attempts', 'schedule_status', 'scheduled_date',
+    'units_scheduled_next_7d', 'units_delivered_to_date',
+    'service_complete', 'evv_or_visit_note_exists', 'ready_to_bill',
+    'claim_status', 'denial_reason', 'payment_amount', 'patient_dob',
+    'patient_age', 'patient_gender', 'patient_address', 'patient_city',
+    'patient_zip', 'agent_segment', 'agent_next_action', 'agent_rationale'
+)
+# Single-row insert; a taken referral_id inserts nothing (rows_affected == 0)
+_REFERRAL_INSERT_SQL = (
+    f"INSERT INTO referrals ({','.join(_REFERRAL_INSERT_COLUMNS)}) "
+    f"VALUES ({','.join(['%s'] * len(_REFERRAL_INSERT_COLUMNS))}) "
+    "ON CONFLICT (referral_id) DO NOTHING"
+)
+# PostgreSQL rejects '' for DATE columns; these are sent as NULL instead
+_REFERRAL_DATE_COLUMNS = frozenset({
+    "referral_received_date", "first_outreach_date", "last_activity_date",
+    "auth_start_date", "auth_end_date", "scheduled_date", "patient_dob",
+})
+
 
-_CAREGIVER_INT_FIELDS = {"age"}
+def _referral_insert_values(row: dict) -> tuple:
+    """Values for _REFERRAL_INSERT_COLUMNS, with empty dates as None."""
+    values = []
+    for c in _REFERRAL_INSERT_COLUMNS:
+        val = row.get(c)
+        if val == "" and c in _REFERRAL_DATE_COLUMNS:
+            val = None
+        values.append(val)
+    return tuple(values)
 
 
-def _coerce_int_fields(row: dict, int_fields: set[str]) -> dict:
+def _coerce_int_fields(row: dict, int_fields: frozenset[str]) -> dict:
     for field in int_fields:
         if field in row:
             row[field] = _safe_int(row.get(field))
     return row
 
 
-def _load_referrals_csv() -> list[dict]:
-    rows = _parse_csv_dicts(REFERRALS_CSV)
-    coerced = [_coerce_int_fields(r, _REFERRAL_INT_FIELDS) for r in rows]
-    base = [_apply_journey_overrides(_apply_scheduling_overrides(r)) for r in coerced]
-    runtime = _load_runtime_referrals()
+def _load_referrals_csv(sched: Optional[dict] = None, journey: Optional[dict] = None) -> list[dict]:
+    coerced = _parse_csv_dicts(REFERRALS_CSV, _REFERRAL_INT_FIELDS)
+    if sched is None:
+        sched = _read_json_cached(SCHEDULING_OVERRIDES_PATH, dict)
+    if journey is None:
+        journey = _read_json_cached(JOURNEY_OVERRIDES_PATH, dict)
+    base = _apply_all_overrides(coerced, sched, journey)
+    runtime = _load_runtime_referrals(sched, journey)
     merged = runtime + base
     return merged
 
 
-def _load_runtime_referrals() -> list[dict]:
+def _load_runtime_referrals(sched: Optional[dict] = None, journey: Optional[dict] = None) -> list[dict]:
     try:
-        if not REFERRALS_RUNTIME_PATH.exists():
-            return []
-        with open(REFERRALS_RUNTIME_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, list):
-            return []
-        cleaned = []
-        for row in data:
-            if isinstance(row, dict):
-                cleaned.append(_apply_journey_overrides(_apply_scheduling_overrides(_coerce_int_fields(row, _REFERRAL_INT_FIELDS))))
-        return cleaned
+        data = _read_json_cached(REFERRALS_RUNTIME_PATH, list)
+        # Runtime rows are flat; shallow copies keep the cached parse untouched by overrides
+        rows = [_coerce_int_fields(dict(row), _REFERRAL_INT_FIELDS) for row in data if isinstance(row, dict)]
+        return _apply_all_overrides(rows, sched, journey)
     except Exception:
         return []
 
 
 def _save_runtime_referrals(rows: list[dict]) -> None:
-    REFERRALS_RUNTIME_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(REFERRALS_RUNTIME_PATH, "w", encoding="utf-8") as f:
-        json.dump(rows, f, indent=2, ensure_ascii=False)
+    _write_json_state(REFERRALS_RUNTIME_PATH, rows)
 
 
-def _next_referral_id(existing_ids: list[str]) -> str:
-    max_n = 1000
-    for rid in existing_ids:
-        try:
-            s = str(rid)
-            if s.startswith("REF-"):
-                n = int(s.split("REF-")[-1])
-                max_n = max(max_n, n)
-        except Exception:
-            continue
-    return f"REF-{max_n + 1}"
+def _prepend_runtime_referrals(new_rows: list[dict]) -> None:
+    """Persist newly ingested referrals ahead of the stored runtime rows.
+
+    Re-reads the file under the state lock so updates from a concurrent autopilot tick are kept.
+    """
+    with _file_state_locked():
+        new_ids = {r.get("referral_id") for r in new_rows}
+        current = [r for r in _load_runtime_referrals() if r.get("referral_id") not in new_ids]
+        _save_runtime_referrals(new_rows + current)
+
+
+# Per (source, id field): (cached rows the index was built from, id -> first row with that id).
+# A cache refresh hands out a new rows list, so an identity check is enough to invalidate.
+_ROW_ID_INDEX: dict[tuple[Path, str], tuple[list, dict]] = {}
+
+
+def _row_id_index(source: Path, rows: list, id_field: str) -> dict:
+    cached = _ROW_ID_INDEX.get((source, id_field))
+    if cached is not None and cached[0] is rows:
+        return cached[1]
+    index: dict = {}
+    for r in rows:
+        if isinstance(r, dict):
+            index.setdefault(str(r.get(id_field) or "").strip(), r)
+    _ROW_ID_INDEX[(source, id_field)] = (rows, index)
+    return index
+
+
+def _referral_id_index(source: Path, rows: list) -> dict:
+    return _row_id_index(source, rows, "referral_id")
+
+
+def _find_referral(rid: str) -> Optional[dict]:
+    """One file-mode referral by id with overrides applied, same row _load_referrals_csv() would give.
+
+    Looks the id up in per-file indexes instead of materializing and scanning every row.
+    """
+    runtime = _read_json_cached(REFERRALS_RUNTIME_PATH, list)
+    row = _referral_id_index(REFERRALS_RUNTIME_PATH, runtime).get(rid)
+    if row is None:
+        base = _parse_csv_dicts(REFERRALS_CSV, _REFERRAL_INT_FIELDS, copy_rows=False)
+        row = _referral_id_index(REFERRALS_CSV, base).get(rid)
+    if row is None:
+        return None
+    return _apply_all_overrides([_coerce_int_fields(dict(row), _REFERRAL_INT_FIELDS)])[0]
+
+
+_REFERRAL_ID_LOCK = threading.Lock()
+
+
+def _referral_id_number(rid) -> Optional[int]:
+    s = str(rid or "")
+    if not s.startswith("REF-"):
+        return None
+    try:
+        return int(s[4:])
+    except ValueError:
+        return None
+
+
+def _bump_referral_id_counter(allocate: bool, at_least: int = 0) -> int:
+    """Read-modify-write the persisted `{"next": n}` referral id counter and return n.
+
+    With `allocate` the counter moves past n; `at_least` raises n first. The file is seeded
+    once from the CSV + runtime referrals. flock serializes uvicorn worker processes; the
+    thread lock covers the threadpool within one.
+    """
+    REFERRAL_ID_COUNTER_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with _REFERRAL_ID_LOCK:
+        fd = os.open(REFERRAL_ID_COUNTER_PATH, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(fd, "r+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)  # released when the file closes
+            try:
+                n = int(_json_loads(f.read())["next"])
+            except Exception:
+                # Read-only scan: reuse the cached referral parse and runtime rows, no copies
+                known = (
+                    _referral_id_number(r.get("referral_id"))
+                    for r in chain(
+                        _parse_csv_dicts(REFERRALS_CSV, _REFERRAL_INT_FIELDS, copy_rows=False),
+                        _read_json_cached(REFERRALS_RUNTIME_PATH, list),
+                    )
+                    if isinstance(r, dict)
+                )
+                n = max((k for k in known if k is not None), default=1000) + 1
+            n = max(n, at_least)
+            f.seek(0)
+            f.truncate()
+            f.write(_json_state_bytes({"next": n + 1 if allocate else n}))
+    return n
+
+
+def _next_referral_id() -> str:
+    """Allocate a new REF-<n> id in O(1) from the persisted counter."""
+    return f"REF-{_bump_referral_id_counter(allocate=True)}"
+
+
+def _reserve_referral_id(rid: str) -> None:
+    """Move the counter past an id that came from elsewhere (e.g. extracted from a PDF)."""
+    n = _referral_id_number(rid)
+    if n is not None:
+        _bump_referral_id_counter(allocate=False, at_least=n + 1)
 
 
 def _kv_lines_from_text(text: str) -> list[tuple[str, str]]:
@@ -699,32 +1326,38 @@ def _kv_lines_from_text(text: str) -> list[tuple[str, str]]:
     return pairs
 
 
-def _normalize_extracted_kv_to_referral_fields(pairs: list[tuple[str, str]]) -> dict:
-    """Map LandingAI extracted KV-ish lines to our referral schema fields."""
+# Lowercased extracted labels -> referral schema fields
+_KV_KEY_MAP = {
+    "referral id": "referral_id",
+    "payer": "payer",
+    "payer name": "payer",
+    "plan type": "plan_type",
+    "authorization status": "auth_status",
+    "authorization required": "auth_required",
+    "authorization start date": "auth_start_date",
+    "authorization end date": "auth_end_date",
+    "authorized units": "auth_units_total",
+    "units delivered": "units_delivered_to_date",
+    "units used": "units_delivered_to_date",
+    "unit type": "unit_type",
+    "city": "patient_city",
+    "service category": "service_type",
+}
+_AUTH_REQ_YES = frozenset({"yes", "y", "true", "1"})
+_AUTH_REQ_NO = frozenset({"no", "n", "false", "0"})
+# Extracted fields copied onto a PDF-created referral row (referral_id is handled separately)
+_PDF_MAPPABLE_FIELDS = frozenset({
+    "auth_required", "auth_status", "auth_start_date", "auth_end_date", "auth_units_total",
+    "units_delivered_to_date", "payer", "plan_type", "unit_type", "patient_city", "service_type",
+})
 
-    def norm_key(k: str) -> Optional[str]:
-        kl = k.strip().lower()
-        mapping = {
-            "referral id": "referral_id",
-            "payer": "payer",
-            "payer name": "payer",
-            "plan type": "plan_type",
-            "authorization status": "auth_status",
-            "authorization required": "auth_required",
-            "authorization start date": "auth_start_date",
-            "authorization end date": "auth_end_date",
-            "authorized units": "auth_units_total",
-            "units delivered": "units_delivered_to_date",
-            "units used": "units_delivered_to_date",
-            "unit type": "unit_type",
-            "city": "patient_city",
-            "service category": "service_type",
-        }
-        return mapping.get(kl)
 
+def _normalize_extracted_kv_to_referral_fields(pairs: list[tuple[str, str]]) -> dict:
+    """Map LandingAI extracted KV-ish lines to our referral schema fields."""
     out: dict = {}
+    key_map = _KV_KEY_MAP
     for k, v in pairs:
-        nk = norm_key(k)
+        nk = key_map.get(k.strip().lower())
         if not nk:
             continue
         if nk in out and out.get(nk):
@@ -734,9 +1367,9 @@ def _normalize_extracted_kv_to_referral_fields(pairs: list[tuple[str, str]]) ->
     # Normalize auth_required to Y/N when possible
     if "auth_required" in out:
         s = str(out.get("auth_required") or "").strip().lower()
-        if s in ("yes", "y", "true", "1"):
+        if s in _AUTH_REQ_YES:
             out["auth_required"] = "Y"
-        elif s in ("no", "n", "false", "0"):
+        elif s in _AUTH_REQ_NO:
             out["auth_required"] = "N"
 
     # Normalize auth_status common variants
@@ -766,8 +1399,12 @@ def _normalize_extracted_kv_to_referral_fields(pairs: list[tuple[str, str]]) ->
     return out
 
 
-@app.post("/api/v1/intake/from-pdf")
-async def intake_from_pdf(files: List[UploadFile] = File(...)):
+# Concurrent LandingAI parses per PDF intake request (keeps bursts under the API rate limit)
+_PDF_PARSE_CONCURRENCY = 4
+
+
+@router.post("/api/v1/intake/from-pdf")
+async def intake_from_pdf(request: Request, background_tasks: BackgroundTasks, files: List[UploadFile] = File(...)):
     """Upload PDFs, parse via LandingAI, then classify:
 
     - referral: normalize fields and create a new referral (enters the ops + scheduler flow)
@@ -788,28 +1425,44 @@ async def intake_from_pdf(files: List[UploadFile] = File(...)):
         ignored = []
         errors = []
 
-        # Baseline dataset for consistent fields
-        base_rows = _parse_csv_dicts(REFERRALS_CSV)
+        # Baseline dataset for consistent fields (shared cached rows: copy before editing)
+        base_rows = await run_in_threadpool(_parse_csv_dicts, REFERRALS_CSV, _REFERRAL_INT_FIELDS, copy_rows=False)
         if not base_rows:
             raise HTTPException(status_code=500, detail="Synthetic referrals CSV is empty")
 
-        runtime_rows = _load_runtime_referrals()
-        existing_ids = [r.get("referral_id") for r in base_rows if r.get("referral_id")]
-        existing_ids += [r.get("referral_id") for r in runtime_rows if r.get("referral_id")]
-        existing_ids = [str(x) for x in existing_ids if x]
+        # Only needed to vet ids extracted from the PDFs; generated ids come from the counter
+        # Raw cached runtime rows: only the ids are read, so skip the copies and override pass
+        runtime_rows = await run_in_threadpool(_read_json_cached, REFERRALS_RUNTIME_PATH, list)
+        existing_ids = {
+            str(rid)
+            for r in chain(base_rows, runtime_rows)
+            if isinstance(r, dict) and (rid := r.get("referral_id"))
+        }
 
-        compliance_docs = _load_compliance_docs()
+        new_compliance_docs: list[dict] = []
+        new_runtime_rows: list[dict] = []
+        # (index into `created`, insert values) for DB mode
+        pending_inserts: list[tuple[int, tuple]] = []
 
-        for f in files:
-            try:
+        parse_slots = asyncio.Semaphore(_PDF_PARSE_CONCURRENCY)
+
+        async def parse_upload(f: UploadFile) -> dict:
+            async with parse_slots:
                 file_bytes = await f.read()
                 if not file_bytes:
                     raise ValueError("Empty file")
-
-                parse_result = await landingai_service.process_document(
+                return await landingai_service.process_document(
                     file_bytes=file_bytes,
                     document_type="referral_packet",
                 )
+
+        # LandingAI parses fan out (bounded); classification and row building stay in upload order
+        parsed = await asyncio.gather(*(parse_upload(f) for f in files), return_exceptions=True)
+
+        for f, parse_result in zip(files, parsed):
+            try:
+                if isinstance(parse_result, BaseException):
+                    raise parse_result
                 if not parse_result.get("success"):
                     raise ValueError(parse_result.get("message") or "LandingAI parse failed")
 
@@ -821,8 +1474,7 @@ async def intake_from_pdf(files: List[UploadFile] = File(...)):
                     # Store guardrail doc for the rest of the system
                     doc_id = f"COMP-{int(datetime.utcnow().timestamp())}-{random.randint(100, 999)}"
                     excerpt = (extracted_text or "").strip().replace("\n", " ")[:1200]
-                    compliance_docs.insert(
-                        0,
+                    new_compliance_docs.append(
                         {
                             "compliance_id": doc_id,
                             "source_filename": f.filename,
@@ -856,51 +1508,38 @@ async def intake_from_pdf(files: List[UploadFile] = File(...)):
                 pairs = _kv_lines_from_text(extracted_text)
                 mapped = _normalize_extracted_kv_to_referral_fields(pairs)
 
-                template = dict(random.choice(base_rows))
-
                 new_id = mapped.get("referral_id")
                 if new_id:
                     new_id = str(new_id).strip()
-                if not new_id or new_id in existing_ids:
-                    new_id = _next_referral_id(existing_ids)
-
-                existing_ids.append(new_id)
-
-                today = date.today()
-                new_row = template
-                new_row["referral_id"] = new_id
-                new_row["referral_received_date"] = today.isoformat()
-                new_row["schedule_status"] = "NOT_SCHEDULED"
-                new_row["scheduled_date"] = ""
-                new_row["service_complete"] = "N"
-                new_row["insurance_active"] = "Y"
-                new_row["contact_attempts"] = 0
-                new_row["docs_complete"] = "N"
-                new_row["home_assessment_done"] = "N"
-                new_row["ready_to_bill"] = "N"
-                new_row["referral_source"] = "LandingAI PDF"
-                new_row["agent_next_action"] = "Review and schedule"
-                new_row["agent_rationale"] = f"Ingested from PDF via LandingAI: {f.filename}"
+                if new_id and new_id not in existing_ids:
+                    await run_in_threadpool(_reserve_referral_id, new_id)
+                else:
+                    new_id = await run_in_threadpool(_next_referral_id)
+                    while new_id in existing_ids:
+                        new_id = await run_in_threadpool(_next_referral_id)
+
+                existing_ids.add(new_id)
+
+                # Template row (shared cached dict, copied by the merge) with the intake fields reset
+                new_row = {
+                    **random.choice(base_rows),
+                    "referral_id": new_id,
+                    "referral_received_date": date.today().isoformat(),
+                    "schedule_status": "NOT_SCHEDULED",
+                    "scheduled_date": "",
+                    "service_complete": "N",
+                    "insurance_active": "Y",
+                    "contact_attempts": 0,
+                    "docs_complete": "N",
+                    "home_assessment_done": "N",
+                    "ready_to_bill": "N",
+                    "referral_source": "LandingAI PDF",
+                    "agent_next_action": "Review and schedule",
+                    "agent_rationale": f"Ingested from PDF via LandingAI: {f.filename}",
+                }
 
                 # Apply extracted mappings
-                for k, v in mapped.items():
-                    if k == "referral_id":
-                        continue
-                    # Map extracted schema keys to our dataset keys
-                    if k == "auth_required":
-                        new_row["auth_required"] = v
-                    elif k == "auth_status":
-                        new_row["auth_status"] = v
-                    elif k == "auth_start_date":
-                        new_row["auth_start_date"] = v
-                    elif k == "auth_end_date":
-                        new_row["auth_end_date"] = v
-                    elif k == "auth_units_total":
-                        new_row["auth_units_total"] = v
-                    elif k == "units_delivered_to_date":
-                        new_row["units_delivered_to_date"] = v
-                    elif k in ("payer", "plan_type", "unit_type", "patient_city", "service_type"):
-                        new_row[k] = v
+                new_row.update({k: v for k, v in mapped.items() if k in _PDF_MAPPABLE_FIELDS})
 
                 # Segment heuristic for demo
                 urg = str(new_row.get("urgency") or "").strip().lower()
@@ -912,28 +1551,10 @@ async def intake_from_pdf(files: List[UploadFile] = File(...)):
                 new_row = _coerce_int_fields(new_row, _REFERRAL_INT_FIELDS)
 
                 if _db_ready():
-                    cols = [
-                        'referral_id', 'use_case', 'service_type', 'referral_source',
-                        'urgency', 'referral_received_date', 'first_outreach_date',
-                        'last_activity_date', 'insurance_active', 'payer', 'plan_type',
-                        'auth_required', 'auth_status', 'auth_start_date', 'auth_end_date',
-                        'auth_units_total', 'auth_units_remaining', 'unit_type',
-                        'docs_complete', 'home_assessment_done', 'patient_responsive',
-                        'contact_attempts', 'schedule_status', 'scheduled_date',
-                        'units_scheduled_next_7d', 'units_delivered_to_date',
-                        'service_complete', 'evv_or_visit_note_exists', 'ready_to_bill',
-                        'claim_status', 'denial_reason', 'payment_amount', 'patient_dob',
-                        'patient_age', 'patient_gender', 'patient_address', 'patient_city',
-                        'patient_zip', 'agent_segment', 'agent_next_action', 'agent_rationale'
-                    ]
-                    values = [new_row.get(c) for c in cols]
-                    placeholders = ",".join(["%s"] * len(cols))
-                    insert_sql = f"INSERT INTO referrals ({','.join(cols)}) VALUES ({placeholders})"
-                    res = db_service.query(insert_sql, tuple(values))
-                    if not res.get('success'):
-                        raise ValueError(res.get('message'))
+                    # Inserted in one batch after the loop
+                    pending_inserts.append((len(created), _referral_insert_values(new_row)))
                 else:
-                    runtime_rows.insert(0, new_row)
+                    new_runtime_rows.append(new_row)
 
                 created.append({
                     "referral": new_row,
@@ -948,20 +1569,40 @@ async def intake_from_pdf(files: List[UploadFile] = File(...)):
             except Exception as e:
                 errors.append({"filename": getattr(f, "filename", "unknown"), "error": str(e)})
 
-        if compliance_docs:
-            _save_compliance_docs(compliance_docs[:200])
+        if pending_inserts:
+            # Ids already in Postgres are skipped by ON CONFLICT instead of failing the whole batch;
+            # RETURNING tells which rows went in
+            res = await db_service.abulk_insert(
+                "referrals", _REFERRAL_INSERT_COLUMNS, [values for _, values in pending_inserts],
+                on_conflict_do_nothing="referral_id", returning="referral_id",
+            )
+            if res.get("success"):
+                inserted = set(res.get("returned") or ())
+                failed = {i for i, _ in pending_inserts if created[i]["referral"]["referral_id"] not in inserted}
+                for i in sorted(failed):
+                    rid = created[i]["referral"]["referral_id"]
+                    errors.append({"filename": created[i]["source_filename"], "error": f"Referral {rid} already exists"})
+            else:
+                # One transaction: none of the batch was stored, so report every file in it
+                failed = {i for i, _ in pending_inserts}
+                for i in sorted(failed):
+                    errors.append({"filename": created[i]["source_filename"], "error": res.get("message")})
+            created = [item for i, item in enumerate(created) if i not in failed]
 
-        if not _db_ready():
-            _save_runtime_referrals(runtime_rows)
+        if new_compliance_docs:
+            # Newest first, as if each doc had been inserted at the front in upload order
+            await run_in_threadpool(_prepend_compliance_docs, new_compliance_docs[::-1])
+
+        if new_runtime_rows:
+            # Newest first, matching the order of the stored runtime rows
+            await run_in_threadpool(_prepend_runtime_referrals, new_runtime_rows[::-1])
 
-        # Keep the system agentic: tick autopilot so stages/scheduling progress automatically.
-        _autopilot_tick_all()
+        # Keep the system agentic: have the background loop tick now so stages/scheduling
+        # progress without the client waiting on it; concurrent intakes share one tick.
+        _request_autopilot_tick(request, background_tasks)
 
-        # Refresh created referrals with latest overrides for accurate UI updates.
-        for item in created:
-            rr = item.get("referral")
-            if isinstance(rr, dict):
-                item["referral"] = _apply_journey_overrides(_apply_scheduling_overrides(rr))
+        # Overlay overrides already stored under these ids (e.g. a re-ingested referral), in place
+        _apply_all_overrides([item["referral"] for item in created if isinstance(item.get("referral"), dict)])
 
         return {
             "success": True,
@@ -978,8 +1619,21 @@ async def intake_from_pdf(files: List[UploadFile] = File(...)):
         raise HTTPException(status_code=500, detail=f"Failed PDF intake: {str(e)}")
 
 
-@app.post("/api/v1/intake/simulate")
+# Value pools for simulated intake (realistic demo data)
+_SIM_CITIES = ("San Francisco", "Oakland", "Berkeley", "San Jose", "Fremont", "Dublin", "San Leandro")
+_SIM_PAYERS = ("Medicare", "Medi-Cal", "BlueCross", "Aetna", "Cigna", "United", "Anthem")
+_SIM_SERVICE_TYPES = ("PersonalCare", "HomeHealthNursing", "HomeHealthPT", "BehavioralHealth", "ECM", "CS_NutritionSupport")
+_SIM_URGENCIES = ("Routine", "Urgent")
+_SIM_PLAN_TYPES = ("HMO", "PPO", "FFS", "Medicaid", "Commercial")
+_SIM_REFERRAL_SOURCES = ("PCP", "Hospital", "County", "Self", "Payer")
+_SIM_UNIT_TYPES = ("HOURS", "VISITS")
+_SIM_RESPONSIVENESS = ("HIGH", "MED", "LOW")
+
+
+@router.post("/api/v1/intake/simulate")
 async def simulate_referral_intake(
+    request: Request,
+    background_tasks: BackgroundTasks,
     urgency: Optional[str] = None,
     patient_city: Optional[str] = None,
     payer: Optional[str] = None,
@@ -995,138 +1649,99 @@ async def simulate_referral_intake(
         today = date.today()
 
         # Pick a template row from the synthetic CSV so fields look realistic
-        base_rows = _parse_csv_dicts(REFERRALS_CSV)
+        base_rows = await run_in_threadpool(_parse_csv_dicts, REFERRALS_CSV, _REFERRAL_INT_FIELDS, copy_rows=False)
         if not base_rows:
             raise HTTPException(status_code=500, detail="Synthetic referrals CSV is empty or not found")
         template = random.choice(base_rows)
 
-        # Collect existing IDs (CSV + runtime + DB)
-        existing_ids = [r.get("referral_id") for r in base_rows if r.get("referral_id")]
-        runtime_rows = _load_runtime_referrals()
-        existing_ids += [r.get("referral_id") for r in runtime_rows if r.get("referral_id")]
-        
-        # Also check DB for existing IDs
-        if _db_ready():
-            db_result = db_service.query("SELECT referral_id FROM referrals")
-            if db_result.get("success") and db_result.get("data"):
-                existing_ids += [r.get("referral_id") for r in db_result["data"] if r.get("referral_id")]
-        
-        new_id = _next_referral_id([str(x) for x in existing_ids if x])
-
-        # Random values for realistic demo
-        cities = ["San Francisco", "Oakland", "Berkeley", "San Jose", "Fremont", "Dublin", "San Leandro"]
-        payers = ["Medicare", "Medi-Cal", "BlueCross", "Aetna", "Cigna", "United", "Anthem"]
-        service_types = ["PersonalCare", "HomeHealthNursing", "HomeHealthPT", "BehavioralHealth", "ECM", "CS_NutritionSupport"]
-        urgencies = ["Routine", "Urgent"]
-        plan_types = ["HMO", "PPO", "FFS", "Medicaid", "Commercial"]
-
-        new_row = dict(template)
-        new_row["referral_id"] = new_id
-        new_row["use_case"] = "HOME_CARE"
-        new_row["service_type"] = service_type or random.choice(service_types)
-        new_row["referral_source"] = random.choice(["PCP", "Hospital", "County", "Self", "Payer"])
-        new_row["urgency"] = urgency or random.choice(urgencies)
-        new_row["referral_received_date"] = today.isoformat()
-        new_row["first_outreach_date"] = ""
-        new_row["last_activity_date"] = today.isoformat()
-        new_row["insurance_active"] = "Y"
-        new_row["payer"] = payer or random.choice(payers)
-        new_row["plan_type"] = random.choice(plan_types)
-        
+        new_id = await run_in_threadpool(_next_referral_id)
+
         # Initial stage: auth pending or not required
-        needs_auth = random.choice([True, False])
-        new_row["auth_required"] = "Y" if needs_auth else "N"
-        new_row["auth_status"] = "PENDING" if needs_auth else "NOT_REQUIRED"
-        new_row["auth_start_date"] = today.isoformat() if needs_auth else ""
-        new_row["auth_end_date"] = (today + timedelta(days=random.randint(30, 90))).isoformat() if needs_auth else ""
-        new_row["auth_units_total"] = random.randint(10, 80) if needs_auth else random.randint(20, 60)
-        new_row["auth_units_remaining"] = new_row["auth_units_total"]
-        new_row["unit_type"] = random.choice(["HOURS", "VISITS"])
-
-        # Reset journey state so the agentic timeline is visible
-        new_row["docs_complete"] = "N"
-        new_row["home_assessment_done"] = "N"
-        new_row["patient_responsive"] = random.choice(["HIGH", "MED", "LOW"])
-        new_row["contact_attempts"] = 0
-        new_row["schedule_status"] = "NOT_SCHEDULED"
-        new_row["scheduled_date"] = ""
-        new_row["units_scheduled_next_7d"] = 0
-        new_row["units_delivered_to_date"] = 0
-        new_row["service_complete"] = "N"
-        new_row["evv_or_visit_note_exists"] = "N"
-        new_row["ready_to_bill"] = "N"
-        new_row["claim_status"] = "NOT_SUBMITTED"
-        new_row["denial_reason"] = ""
-        new_row["payment_amount"] = 0
-
-        # Patient info from template or random
-        new_row["patient_city"] = patient_city or random.choice(cities)
-        
-        # Agent segment based on urgency and auth status
-        urg = str(new_row.get("urgency") or "").strip().lower()
-        auth_stat = str(new_row.get("auth_status") or "").strip().upper()
-        if urg == "urgent":
-            new_row["agent_segment"] = "RED" if auth_stat == "PENDING" else "ORANGE"
-        elif auth_stat == "PENDING":
-            new_row["agent_segment"] = "YELLOW"
+        needs_auth = random.random() < 0.5
+        new_urgency = urgency or random.choice(_SIM_URGENCIES)
+
+        # Agent segment and next action based on urgency and auth status
+        if str(new_urgency).strip().lower() == "urgent":
+            segment = "RED" if needs_auth else "ORANGE"
         else:
-            new_row["agent_segment"] = "GREEN"
-        
-        # Set appropriate next action based on state
-        if auth_stat == "PENDING":
-            new_row["agent_next_action"] = "FOLLOW_UP_AUTH"
-            new_row["agent_rationale"] = "New intake; authorization pending - follow up with payer."
+            segment = "YELLOW" if needs_auth else "GREEN"
+        if needs_auth:
+            next_action = "FOLLOW_UP_AUTH"
+            rationale = "New intake; authorization pending - follow up with payer."
         else:
-            new_row["agent_next_action"] = "REQUEST_DOCS"
-            new_row["agent_rationale"] = "New intake; gather required documents to proceed."
+            next_action = "REQUEST_DOCS"
+            rationale = "New intake; gather required documents to proceed."
+
+        today_iso = today.isoformat()
+        auth_units = random.randint(10, 80) if needs_auth else random.randint(20, 60)
+        # Template row (shared cached dict, copied by the merge) with every intake field set in one build
+        new_row = {
+            **template,
+            "referral_id": new_id,
+            "use_case": "HOME_CARE",
+            "service_type": service_type or random.choice(_SIM_SERVICE_TYPES),
+            "referral_source": random.choice(_SIM_REFERRAL_SOURCES),
+            "urgency": new_urgency,
+            "referral_received_date": today_iso,
+            "first_outreach_date": "",
+            "last_activity_date": today_iso,
+            "insurance_active": "Y",
+            "payer": payer or random.choice(_SIM_PAYERS),
+            "plan_type": random.choice(_SIM_PLAN_TYPES),
+            "auth_required": "Y" if needs_auth else "N",
+            "auth_status": "PENDING" if needs_auth else "NOT_REQUIRED",
+            "auth_start_date": today_iso if needs_auth else "",
+            "auth_end_date": (today + timedelta(days=random.randint(30, 90))).isoformat() if needs_auth else "",
+            "auth_units_total": auth_units,
+            "auth_units_remaining": auth_units,
+            "unit_type": random.choice(_SIM_UNIT_TYPES),
+            # Reset journey state so the agentic timeline is visible
+            "docs_complete": "N",
+            "home_assessment_done": "N",
+            "patient_responsive": random.choice(_SIM_RESPONSIVENESS),
+            "contact_attempts": 0,
+            "schedule_status": "NOT_SCHEDULED",
+            "scheduled_date": "",
+            "units_scheduled_next_7d": 0,
+            "units_delivered_to_date": 0,
+            "service_complete": "N",
+            "evv_or_visit_note_exists": "N",
+            "ready_to_bill": "N",
+            "claim_status": "NOT_SUBMITTED",
+            "denial_reason": "",
+            "payment_amount": 0,
+            # Patient info from template or random
+            "patient_city": patient_city or random.choice(_SIM_CITIES),
+            "agent_segment": segment,
+            "agent_next_action": next_action,
+            "agent_rationale": rationale,
+        }
 
         # Coerce numeric fields
         new_row = _coerce_int_fields(new_row, _REFERRAL_INT_FIELDS)
 
         if _db_ready():
-            # Insert only the columns present in schema (ignore extras)
-            cols = [
-                'referral_id', 'use_case', 'service_type', 'referral_source',
-                'urgency', 'referral_received_date', 'first_outreach_date',
-                'last_activity_date', 'insurance_active', 'payer', 'plan_type',
-                'auth_required', 'auth_status', 'auth_start_date', 'auth_end_date',
-                'auth_units_total', 'auth_units_remaining', 'unit_type',
-                'docs_complete', 'home_assessment_done', 'patient_responsive',
-                'contact_attempts', 'schedule_status', 'scheduled_date',
-                'units_scheduled_next_7d', 'units_delivered_to_date',
-                'service_complete', 'evv_or_visit_note_exists', 'ready_to_bill',
-                'claim_status', 'denial_reason', 'payment_amount', 'patient_dob',
-                'patient_age', 'patient_gender', 'patient_address', 'patient_city',
-                'patient_zip', 'agent_segment', 'agent_next_action', 'agent_rationale'
-            ]
-            # Convert empty strings to None for date columns (PostgreSQL requires NULL, not '')
-            date_cols = {'referral_received_date', 'first_outreach_date', 'last_activity_date',
-                         'auth_start_date', 'auth_end_date', 'scheduled_date', 'patient_dob'}
-            values = []
-            for c in cols:
-                val = new_row.get(c)
-                # Convert empty string to None for date fields
-                if c in date_cols and val == '':
-                    val = None
-                values.append(val)
-            placeholders = ",".join(["%s"] * len(cols))
-            insert_sql = f"INSERT INTO referrals ({','.join(cols)}) VALUES ({placeholders})"
-            res = db_service.query(insert_sql, tuple(values))
-            if not res.get('success'):
-                raise HTTPException(status_code=500, detail=res.get('message'))
+            # Rows can reach the DB without going through the counter; the primary key rejects
+            # a taken id, so move to the next one instead of probing before the insert
+            while True:
+                res = await db_service.aquery(_REFERRAL_INSERT_SQL, _referral_insert_values(new_row))
+                if not res.get('success'):
+                    raise HTTPException(status_code=500, detail=res.get('message'))
+                if res.get('rows_affected'):
+                    break
+                new_row["referral_id"] = await run_in_threadpool(_next_referral_id)
 
             # DB mode: autopilot currently runs only in file mode.
             return {"success": True, "mode": "db", "referral": new_row}
 
         # File/demo mode
-        runtime_rows.insert(0, new_row)
-        _save_runtime_referrals(runtime_rows)
+        await run_in_threadpool(_prepend_runtime_referrals, [new_row])
 
-        # Keep agentic behavior consistent: tick autopilot after intake.
-        _autopilot_tick_all()
+        # Keep agentic behavior consistent: wake the autopilot loop for a prompt tick.
+        _request_autopilot_tick(request, background_tasks)
 
-        # Return the view with latest overrides applied.
-        new_row = _apply_journey_overrides(_apply_scheduling_overrides(new_row))
+        # Return the view with any overrides already stored for this id applied.
+        new_row = _apply_all_overrides([new_row])[0]
         return {"success": True, "mode": "file", "referral": new_row}
 
     except HTTPException:
@@ -1135,10 +1750,10 @@ async def simulate_referral_intake(
         raise HTTPException(status_code=500, detail=f"Failed to simulate intake: {str(e)}")
 
 
-@app.get("/api/v1/compliance/docs")
+@router.get("/api/v1/compliance/docs")
 async def list_compliance_docs(limit: int = Query(50, ge=1, le=200)):
     try:
-        docs = _load_compliance_docs()
+        docs = await run_in_threadpool(_load_compliance_docs)
         return {
             "success": True,
             "count": len(docs),
@@ -1149,11 +1764,11 @@ async def list_compliance_docs(limit: int = Query(50, ge=1, le=200)):
         raise HTTPException(status_code=500, detail=f"Failed to load compliance docs: {str(e)}")
 
 
-@app.get("/api/v1/compliance/guardrails")
+@router.get("/api/v1/compliance/guardrails")
 async def get_compliance_guardrails():
     """Return a lightweight guardrails payload for agents/UI."""
     try:
-        docs = _load_compliance_docs()
+        docs = await run_in_threadpool(_load_compliance_docs)
         items = []
         for d in docs[:25]:
             items.append(
@@ -1185,20 +1800,20 @@ def _journey_default_timeline(referral: dict) -> list[dict]:
             "source": "dataset",
         }
     ]
-    if str(referral.get("docs_complete") or "").strip().upper() == "Y":
+    if _is_yes(referral, "docs_complete"):
         items.append({"stage": "DOCS_COMPLETED", "at": referral.get("last_activity_date") or "", "source": "dataset"})
-    if str(referral.get("home_assessment_done") or "").strip().upper() == "Y":
+    if _is_yes(referral, "home_assessment_done"):
         items.append({"stage": "HOME_ASSESSMENT_COMPLETED", "at": referral.get("last_activity_date") or "", "source": "dataset"})
-    if str(referral.get("schedule_status") or "").strip().upper() == "SCHEDULED":
+    if _UPPER[referral.get("schedule_status")] == "SCHEDULED":
         items.append({"stage": "SCHEDULED", "at": referral.get("scheduled_date") or "", "source": "dataset"})
-    if str(referral.get("ready_to_bill") or "").strip().upper() == "Y":
+    if _is_yes(referral, "ready_to_bill"):
         items.append({"stage": "READY_TO_BILL", "at": referral.get("last_activity_date") or "", "source": "dataset"})
-    if str(referral.get("service_complete") or "").strip().upper() == "Y":
+    if _is_yes(referral, "service_complete"):
         items.append({"stage": "SERVICE_COMPLETED", "at": referral.get("last_activity_date") or "", "source": "dataset"})
     return items
 
 
-@app.get("/api/v1/referrals/{referral_id}/journey")
+@router.get("/api/v1/referrals/{referral_id}/journey")
 async def get_referral_journey(referral_id: str):
     try:
         rid = str(referral_id or "").strip()
@@ -1207,7 +1822,7 @@ async def get_referral_journey(referral_id: str):
 
         # Find referral
         if _db_ready():
-            r = db_service.query("SELECT * FROM referrals WHERE referral_id = %s", (rid,))
+            r = await db_service.aquery("SELECT * FROM referrals WHERE referral_id = %s", (rid,))
             if not r.get("success"):
                 raise HTTPException(status_code=500, detail=r.get("message"))
             rows = r.get("data") or []
@@ -1215,13 +1830,13 @@ async def get_referral_journey(referral_id: str):
                 raise HTTPException(status_code=404, detail="Referral not found")
             referral = rows[0]
         else:
-            rows = _load_referrals_csv()
-            referral = next((x for x in rows if str(x.get("referral_id") or "").strip() == rid), None)
+            referral = await run_in_threadpool(_find_referral, rid)
             if not referral:
                 raise HTTPException(status_code=404, detail="Referral not found")
 
-        overrides = _load_journey_overrides()
-        entry = overrides.get(rid) if isinstance(overrides, dict) else None
+        # Read-only: only this referral's entry is used, so skip the deep copy of the whole store
+        overrides = await run_in_threadpool(_read_json_cached, JOURNEY_OVERRIDES_PATH, dict)
+        entry = overrides.get(rid)
         entry = entry if isinstance(entry, dict) else {"events": []}
         events = entry.get("events") if isinstance(entry.get("events"), list) else []
 
@@ -1248,7 +1863,32 @@ async def get_referral_journey(referral_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to load journey: {str(e)}")
 
 
-@app.post("/api/v1/referrals/{referral_id}/journey/advance")
+# Referral columns set in DB mode when a stage is advanced from the UI
+_JOURNEY_STAGE_DB_UPDATES: dict[str, tuple[tuple[str, str], ...]] = {
+    "DOCS_COMPLETED": (("docs_complete", "Y"),),
+    "HOME_ASSESSMENT_COMPLETED": (("home_assessment_done", "Y"),),
+    "READY_TO_BILL": (("ready_to_bill", "Y"),),
+    "SERVICE_COMPLETED": (("service_complete", "Y"), ("schedule_status", "COMPLETED")),
+}
+
+# Whether referrals has the journey_stage columns (migration 001); probed once per process
+_HAS_JOURNEY_STAGE_COL: Optional[bool] = None
+
+
+async def _referrals_has_journey_stage() -> bool:
+    global _HAS_JOURNEY_STAGE_COL
+    if _HAS_JOURNEY_STAGE_COL is None:
+        res = await db_service.aquery(
+            "SELECT 1 FROM information_schema.columns WHERE table_name = 'referrals' AND column_name = 'journey_stage'"
+        )
+        if not res.get("success"):
+            # Probe failed (e.g. connection blip): skip the columns now, retry on the next call
+            return False
+        _HAS_JOURNEY_STAGE_COL = bool(res.get("data"))
+    return _HAS_JOURNEY_STAGE_COL
+
+
+@router.post("/api/v1/referrals/{referral_id}/journey/advance")
 async def advance_referral_journey(referral_id: str, stage: str, note: Optional[str] = None):
     """Advance a referral through the demo journey.
 
@@ -1262,52 +1902,28 @@ async def advance_referral_journey(referral_id: str, stage: str, note: Optional[
         if not st:
             raise HTTPException(status_code=400, detail="stage is required")
 
-        now = datetime.utcnow().isoformat() + "Z"
-        ev = {"stage": st, "at": now, "source": "ui", "note": (note or "").strip()}
+        _, now, now_ts = _utc_now()
+        ev = {"stage": st, "at": now, "at_ts": now_ts, "source": "ui", "note": (note or "").strip()}
 
-        overrides = _load_journey_overrides()
-        entry = overrides.get(rid)
-        if not isinstance(entry, dict):
-            entry = {"events": []}
-        events = entry.get("events")
-        if not isinstance(events, list):
-            events = []
-        events.append(ev)
-        entry["events"] = events
-        entry["current_stage"] = st
-        entry["updated_at"] = now
-        overrides[rid] = entry
-        _save_journey_overrides(overrides)
+        await run_in_threadpool(_store_journey_event, rid, ev)
 
         # Apply side effects to referral row so the rest of the system updates
         if _db_ready():
+            updated_at = datetime.utcnow()
             updates: dict[str, object] = {
-                "updated_at": datetime.utcnow(),
+                "updated_at": updated_at,
             }
-            
-            # Try to update journey_stage if column exists (migration may not have run)
-            try:
-                journey_res = db_service.query(
-                    "UPDATE referrals SET journey_stage = %s, journey_updated_at = %s WHERE referral_id = %s",
-                    (st, datetime.utcnow(), rid)
-                )
-                # If it fails silently, that's OK - column may not exist
-            except Exception:
-                pass  # Column doesn't exist yet
-            
-            if st == "DOCS_COMPLETED":
-                updates.update({"docs_complete": "Y"})
-            elif st == "HOME_ASSESSMENT_COMPLETED":
-                updates.update({"home_assessment_done": "Y"})
-            elif st == "READY_TO_BILL":
-                updates.update({"ready_to_bill": "Y"})
-            elif st == "SERVICE_COMPLETED":
-                updates.update({"service_complete": "Y", "schedule_status": "COMPLETED"})
+
+            # journey_stage columns come from a migration that may not have run
+            if await _referrals_has_journey_stage():
+                updates.update({"journey_stage": st, "journey_updated_at": updated_at})
+
+            updates.update(_JOURNEY_STAGE_DB_UPDATES.get(st, ()))
 
             if updates:
                 set_clause = ", ".join([f"{k} = %s" for k in updates.keys()])
                 params = list(updates.values()) + [rid]
-                res = db_service.query(f"UPDATE referrals SET {set_clause} WHERE referral_id = %s", tuple(params))
+                res = await db_service.aquery(f"UPDATE referrals SET {set_clause} WHERE referral_id = %s", tuple(params))
                 if not res.get("success"):
                     raise HTTPException(status_code=500, detail=res.get("message"))
 
@@ -1319,8 +1935,7 @@ async def advance_referral_journey(referral_id: str, stage: str, note: Optional[
 
 
 def _load_caregivers_csv() -> list[dict]:
-    rows = _parse_csv_dicts(CAREGIVERS_CSV)
-    return [_coerce_int_fields(r, _CAREGIVER_INT_FIELDS) for r in rows]
+    return _parse_csv_dicts(CAREGIVERS_CSV, _CAREGIVER_INT_FIELDS)
 
 
 def _db_ready() -> bool:
@@ -1355,56 +1970,71 @@ def _safe_int(x: str) -> int:
         return 0
 
 
+def _count_matching(rows: list[dict], field: str, accepted) -> int:
+    """Count rows whose `field`, stripped and lowercased, is one of `accepted`."""
+    return sum(map(accepted.__contains__, (str(r.get(field) or "").strip().lower() for r in rows)))
+
+
+def _sum_int_field(rows: list[dict], field: str) -> int:
+    """Sum the unsigned integer values of `field`; blanks and non-numeric cells count as 0."""
+    return sum(map(int, filter(str.isdecimal, (str(r.get(field) or "").strip() for r in rows))))
+
+
+_TRUTHY = frozenset(("true", "yes", "1"))
+_YES_TRUE = frozenset(("yes", "true"))
+_APPROVED = frozenset(("approved",))
+
+_OUTCOME_FLAG_FIELDS = (
+    "referral_received",
+    "intake_complete",
+    "assessment_complete",
+    "eligibility_verified",
+    "auth_required",
+    "auth_approved",
+    "ready_to_schedule",
+)
+
+
 def _summarize_outcomes(rows: list[dict]) -> dict:
-    d = {
-        "referral_received": 0,
-        "intake_complete": 0,
-        "assessment_complete": 0,
-        "eligibility_verified": 0,
-        "auth_required": 0,
-        "auth_approved": 0,
-        "ready_to_schedule": 0,
-        "outcomes_count": len(rows),
-    }
-    caregivers = {}
-    for r in rows:
-        def is_true(v):
-            s = str(v or "").strip().lower()
-            return s in ("true", "yes", "1")
-        if is_true(r.get("referral_received")): d["referral_received"] += 1
-        if is_true(r.get("intake_complete")): d["intake_complete"] += 1
-        if is_true(r.get("assessment_complete")): d["assessment_complete"] += 1
-        if is_true(r.get("eligibility_verified")): d["eligibility_verified"] += 1
-        if is_true(r.get("auth_required")): d["auth_required"] += 1
-        if is_true(r.get("auth_approved")): d["auth_approved"] += 1
-        if is_true(r.get("ready_to_schedule")): d["ready_to_schedule"] += 1
-        cg = (r.get("matched_caregiver_id") or "").strip()
-        if cg:
-            caregivers[cg] = caregivers.get(cg, 0) + 1
+    # One columnar pass per flag instead of seven branches per row
+    d = {field: _count_matching(rows, field, _TRUTHY) for field in _OUTCOME_FLAG_FIELDS}
+    d["outcomes_count"] = len(rows)
+    caregivers = Counter(cg for cg in (str(r.get("matched_caregiver_id") or "").strip() for r in rows) if cg)
     d["caregivers_unique"] = len(caregivers)
-    d["caregivers_multi_assign"] = sum(1 for k,v in caregivers.items() if v >= 2)
+    d["caregivers_multi_assign"] = sum(1 for v in caregivers.values() if v >= 2)
     d["caregivers_clients_avg"] = (sum(caregivers.values())/len(caregivers)) if caregivers else 0.0
     return d
 
 
-def _build_dashboard_metrics() -> dict:
-    norm_rows = _parse_csv_dicts(DOC_EXTRACT_DIR / "normalized_summary.csv")
-    indiv_rows = _parse_csv_dicts(DOC_EXTRACT_DIR / "individual" / "summary_individual.csv")
-    outcomes_rows = _parse_csv_dicts(DOC_EXTRACT_DIR / "pipeline_outcomes.csv")
-    referrals_rows = _parse_csv_dicts(REPO_ROOT / "data" / "referrals_synthetic.csv")
-    caregivers_rows = _parse_csv_dicts(REPO_ROOT / "data" / "caregivers_synthetic.csv")
-    auth_required_yes = sum(
-        1 for r in norm_rows if str(r.get("authorization_required", "")).strip().lower() in ("yes", "true")
-    )
-    auth_approved = sum(
-        1 for r in norm_rows if str(r.get("authorization_status", "")).strip().lower() == "approved"
-    )
-    ready_to_bill = sum(1 for r in norm_rows if str(r.get("ready_to_bill", "")).strip().lower() in ("yes", "true"))
-    units_authorized = sum(_safe_int(r.get("authorized_units", 0)) for r in norm_rows)
-    units_delivered = sum(_safe_int(r.get("units_delivered", 0)) for r in norm_rows)
+_DASHBOARD_INPUTS = (
+    DOC_EXTRACT_DIR / "normalized_summary.csv",
+    DOC_EXTRACT_DIR / "individual" / "summary_individual.csv",
+    DOC_EXTRACT_DIR / "pipeline_outcomes.csv",
+    REFERRALS_CSV,
+    CAREGIVERS_CSV,
+)
+
+
+async def _load_dashboard_rows() -> list[list[dict]]:
+    """Parse the dashboard input CSVs concurrently in the threadpool (wall time = slowest file).
+
+    Rows are the shared cached parses: read them, never mutate them.
+    """
+    return list(await asyncio.gather(
+        *(run_in_threadpool(_parse_csv_dicts, p, copy_rows=False) for p in _DASHBOARD_INPUTS)
+    ))
+
+
+def _build_dashboard_metrics(rows: list[list[dict]]) -> dict:
+    norm_rows, indiv_rows, outcomes_rows, referrals_rows, caregivers_rows = rows
+    auth_required_yes = _count_matching(norm_rows, "authorization_required", _YES_TRUE)
+    auth_approved = _count_matching(norm_rows, "authorization_status", _APPROVED)
+    ready_to_bill = _count_matching(norm_rows, "ready_to_bill", _YES_TRUE)
+    units_authorized = _sum_int_field(norm_rows, "authorized_units")
+    units_delivered = _sum_int_field(norm_rows, "units_delivered")
 
     total_docs = len(indiv_rows)
-    success_docs = sum(1 for r in indiv_rows if str(r.get("success", "")).strip().lower() in ("true", "yes"))
+    success_docs = _count_matching(indiv_rows, "success", _YES_TRUE)
     success_rate = f"{(success_docs / total_docs * 100):.1f}%" if total_docs else "—"
     proc_times = []
     for r in indiv_rows:
@@ -1452,332 +2082,352 @@ def _build_dashboard_metrics() -> dict:
     }
 
 
-@app.get("/ui/summary", response_class=HTMLResponse)
-async def ui_summary():
-    path = DOC_EXTRACT_DIR / "normalized_summary.csv"
-    content = _csv_to_html_table(path, "Normalized Referral Summary")
-    return f"""
+# (input signature, metrics) for the dashboard page and API; rebuilt only when an input CSV changes
+_DASHBOARD_METRICS_CACHE: Optional[tuple[tuple, dict]] = None
+
+
+async def _dashboard_metrics() -> dict:
+    """Cached _build_dashboard_metrics(); the returned dict is shared, so do not mutate it."""
+    global _DASHBOARD_METRICS_CACHE
+    sig = _files_signature(_DASHBOARD_INPUTS)
+    if _DASHBOARD_METRICS_CACHE and _DASHBOARD_METRICS_CACHE[0] == sig:
+        return _DASHBOARD_METRICS_CACHE[1]
+    metrics = _build_dashboard_metrics(await _load_dashboard_rows())
+    _DASHBOARD_METRICS_CACHE = (sig, metrics)
+    return metrics
+
+
+# Rendered UI pages keyed by endpoint; reused while the input files' signature is unchanged.
+_HTML_CACHE: dict[str, tuple[tuple, str, str]] = {}
+
+# Streamed pages larger than this are not retained, so memory stays bounded by the batch size
+_HTML_STREAM_CACHE_MAX_CHARS = 8 << 20
+
+def _files_signature(paths) -> tuple:
+    sig = []
+    for p in paths:
+        try:
+            st = p.stat()
+            sig.append((str(p), st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append((str(p), None, None))
+    return tuple(sig)
+
+
+def _html_etag(html: str) -> str:
+    return '"' + hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def _stream_and_cache(endpoint: str, sig: tuple, chunks: Iterator[str]) -> Iterator[str]:
+    parts: Optional[list[str]] = []
+    size = 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size > _HTML_STREAM_CACHE_MAX_CHARS:
+                parts = None
+            else:
+                parts.append(chunk)
+        yield chunk
+    if parts is not None:
+        html = "".join(parts)
+        _HTML_CACHE[endpoint] = (sig, html, _html_etag(html))
+
+
+async def _cached_html_response(request: Request, endpoint: str, input_paths, render) -> Response:
+    """Serve a rendered page from cache, re-rendering only when an input CSV changes."""
+    sig = _files_signature(input_paths)
+    cached = _HTML_CACHE.get(endpoint)
+    if cached and cached[0] == sig:
+        html, etag = cached[1], cached[2]
+    elif inspect.isgeneratorfunction(render):
+        # Stream the first render so the browser can start parsing; the page is cached once fully sent
+        return StreamingResponse(_stream_and_cache(endpoint, sig, render()), media_type="text/html")
+    else:
+        if inspect.iscoroutinefunction(render):
+            html = await render()
+        else:
+            # Sync renderers parse CSVs from disk; keep that off the event loop
+            html = await run_in_threadpool(render)
+        etag = _html_etag(html)
+        _HTML_CACHE[endpoint] = (sig, html, etag)
+    headers = {"Cache-Control": "public, max-age=60", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(html, headers=headers)
+
+
+# Shared chrome for the /ui pages, built once at import; each page shows a prefix of the nav links
+_NAV_LINKS = (
+    ("/ui/summary", "Summary"),
+    ("/ui/individual", "Per-Document Summary"),
+    ("/ui/dashboard", "Dashboard"),
+    ("/ui/pipeline", "Pipeline"),
+    ("/ui/referrals", "Referrals"),
+    ("/ui/caregivers", "Caregivers"),
+)
+
+_PAGE_HEADER_TMPL = """
     <html>
         <head>
-            <title>HealthOps Summary</title>
+            <title>%s</title>
             <link rel="stylesheet" href="/static/style.css">
             <meta name="viewport" content="width=device-width, initial-scale=1" />
         </head>
         <body>
             <header>
-                <h1>HealthOps Document Parsing</h1>
+                <h1>%s</h1>
                 <nav>
-                    <a href='/ui/summary'>Summary</a>
-                    <a href='/ui/individual'>Per-Document Summary</a>
-                    <a href='/ui/dashboard'>Dashboard</a>
+%s
                 </nav>
             </header>
             <main>
-                {content}
+"""
+
+_PAGE_FOOTER = """
             </main>
         </body>
     </html>
-    """
+"""
+
+
+def _page_header(title: str, heading: str, nav_links: int) -> str:
+    nav = "\n".join(f"                    <a href='{href}'>{label}</a>" for href, label in _NAV_LINKS[:nav_links])
+    return _PAGE_HEADER_TMPL % (title, heading, nav)
+
+
+_SUMMARY_PAGE_HEADER = _page_header("HealthOps Summary", "HealthOps Document Parsing", 3)
+_INDIVIDUAL_PAGE_HEADER = _page_header("HealthOps Per-Document Summary", "HealthOps Document Parsing", 3)
+_DASHBOARD_PAGE_HEADER = _page_header("HealthOps Dashboard", "HealthOps Dashboard", 3)
+_PIPELINE_PAGE_HEADER = _page_header("HealthOps Pipeline Outcomes", "HealthOps Pipeline Outcomes", 4)
+_REFERRALS_PAGE_HEADER = _page_header("HealthOps Referrals", "HealthOps Referrals", 5)
+_CAREGIVERS_PAGE_HEADER = _page_header("Caregivers Summary", "Caregivers Summary", 6)
+_CAREGIVERS_PAGE_OPEN = _CAREGIVERS_PAGE_HEADER + """
+            <div class='table-container'>
+                <table class='data-table'>
+                    <thead><tr>%s</tr></thead>
+                    <tbody>""" % "".join([f"<th>{h}</th>" for h in ("Caregiver", "City", "Skills", "Assigned Clients")])
+_CAREGIVER_ROW_TMPL = "<tr><td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>\n"
+_CAREGIVERS_PAGE_CLOSE = """</tbody>
+                </table>
+            </div>
+        """ + _PAGE_FOOTER
+
+
+def _render_ui_summary() -> Iterator[str]:
+    path = DOC_EXTRACT_DIR / "normalized_summary.csv"
+    yield _SUMMARY_PAGE_HEADER
+    yield from _iter_html_table(path, "Normalized Referral Summary")
+    yield _PAGE_FOOTER
+
 
+@router.get("/ui/summary", response_class=HTMLResponse)
+async def ui_summary(request: Request):
+    return await _cached_html_response(request, "ui_summary", [DOC_EXTRACT_DIR / "normalized_summary.csv"], _render_ui_summary)
 
-@app.get("/ui/individual", response_class=HTMLResponse)
-async def ui_individual():
+
+def _render_ui_individual() -> Iterator[str]:
     path = DOC_EXTRACT_DIR / "individual" / "summary_individual.csv"
-    content = _csv_to_html_table(path, "Per-Document Parsing Summary")
-    return f"""
-    <html>
-        <head>
-            <title>HealthOps Per-Document Summary</title>
-            <link rel="stylesheet" href="/static/style.css">
-            <meta name="viewport" content="width=device-width, initial-scale=1" />
-        </head>
-        <body>
-            <header>
-                <h1>HealthOps Document Parsing</h1>
-                <nav>
-                    <a href='/ui/summary'>Summary</a>
-                    <a href='/ui/individual'>Per-Document Summary</a>
-                    <a href='/ui/dashboard'>Dashboard</a>
-                </nav>
-            </header>
-            <main>
-                {content}
-            </main>
-        </body>
-    </html>
+    yield _INDIVIDUAL_PAGE_HEADER
+    yield from _iter_html_table(path, "Per-Document Parsing Summary")
+    yield _PAGE_FOOTER
+
+
+@router.get("/ui/individual", response_class=HTMLResponse)
+async def ui_individual(request: Request):
+    return await _cached_html_response(request, "ui_individual", [DOC_EXTRACT_DIR / "individual" / "summary_individual.csv"], _render_ui_individual)
+
+
+# Dashboard page body: (cards html, funnel rows html)
+_DASHBOARD_BODY_TMPL = """
+                %s
+                <h2>Funnel</h2>
+                <div class='table-container'>
+                    <table class='data-table'>
+                        <thead><tr>
+                            <th>Stage</th><th>Count</th>
+                        </tr></thead>
+                        <tbody>
+                            %s
+                        </tbody>
+                    </table>
+                </div>
     """
 
 
-@app.get("/ui/dashboard", response_class=HTMLResponse)
-async def ui_dashboard():
-    metrics = _build_dashboard_metrics()
+async def _render_ui_dashboard() -> str:
+    metrics = await _dashboard_metrics()
     cards_html = _render_cards([(item["title"], item["value"]) for item in metrics["cards"]])
     funnel_rows = "\n".join(
         [f"<tr><td>{item['stage']}</td><td>{item['count']}</td></tr>" for item in metrics["funnel"]]
     )
+    return _DASHBOARD_PAGE_HEADER + _DASHBOARD_BODY_TMPL % (cards_html, funnel_rows) + _PAGE_FOOTER
+
 
-    return f"""
-        <html>
-                <head>
-                        <title>HealthOps Dashboard</title>
-                        <link rel=\"stylesheet\" href=\"/static/style.css\">
-                        <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-                </head>
-                <body>
-                        <header>
-                                <h1>HealthOps Dashboard</h1>
-                                <nav>
-                                        <a href='/ui/summary'>Summary</a>
-                                        <a href='/ui/individual'>Per-Document Summary</a>
-                                        <a href='/ui/dashboard'>Dashboard</a>
-                                </nav>
-                        </header>
-                        <main>
-                            {cards_html}
-                            <h2>Funnel</h2>
-                            <div class='table-container'>
-                                <table class='data-table'>
-                                    <thead><tr>
-                                        <th>Stage</th><th>Count</th>
-                                    </tr></thead>
-                                    <tbody>
-                                        {funnel_rows}
-                                    </tbody>
-                                </table>
-                            </div>
-                        </main>
-                </body>
-        </html>
-        """
-
-
-@app.get("/ui/pipeline", response_class=HTMLResponse)
-async def ui_pipeline():
+@router.get("/ui/dashboard", response_class=HTMLResponse)
+async def ui_dashboard(request: Request):
+    return await _cached_html_response(request, "ui_dashboard", _DASHBOARD_INPUTS, _render_ui_dashboard)
+
+
+def _render_ui_pipeline() -> Iterator[str]:
     path = DOC_EXTRACT_DIR / "pipeline_outcomes.csv"
-    content = _csv_to_html_table(path, "Pipeline Outcomes")
-    return f"""
-    <html>
-        <head>
-            <title>HealthOps Pipeline Outcomes</title>
-            <link rel=\"stylesheet\" href=\"/static/style.css\">
-            <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-        </head>
-        <body>
-            <header>
-                <h1>HealthOps Pipeline Outcomes</h1>
-                <nav>
-                    <a href='/ui/summary'>Summary</a>
-                    <a href='/ui/individual'>Per-Document Summary</a>
-                    <a href='/ui/dashboard'>Dashboard</a>
-                    <a href='/ui/pipeline'>Pipeline</a>
-                </nav>
-            </header>
-            <main>
-                {content}
-            </main>
-        </body>
-    </html>
-    """
+    yield _PIPELINE_PAGE_HEADER
+    yield from _iter_html_table(path, "Pipeline Outcomes")
+    yield _PAGE_FOOTER
+
 
-@app.get("/ui/caregivers", response_class=HTMLResponse)
-async def ui_caregivers():
-        outcomes_rows = _parse_csv_dicts(DOC_EXTRACT_DIR / "pipeline_outcomes.csv")
-        caregivers_rows = _parse_csv_dicts(REPO_ROOT / "data" / "caregivers_synthetic.csv")
+@router.get("/ui/pipeline", response_class=HTMLResponse)
+async def ui_pipeline(request: Request):
+    return await _cached_html_response(request, "ui_pipeline", [DOC_EXTRACT_DIR / "pipeline_outcomes.csv"], _render_ui_pipeline)
+
+
+def _render_ui_caregivers() -> str:
+        # Read-only: use the cached parses directly
+        outcomes_rows = _parse_csv_dicts(DOC_EXTRACT_DIR / "pipeline_outcomes.csv", copy_rows=False)
+        caregivers_rows = _parse_csv_dicts(CAREGIVERS_CSV, _CAREGIVER_INT_FIELDS, copy_rows=False)
         # Aggregate matches per caregiver
-        counts: dict[str,int] = {}
-        for r in outcomes_rows:
-                cg = (r.get("matched_caregiver_id") or "").strip()
-                rid = r.get("referral_id")
-                if cg:
-                        counts[cg] = counts.get(cg, 0) + 1
+        counts = Counter(cg for cg in ((r.get("matched_caregiver_id") or "").strip() for r in outcomes_rows) if cg)
         # build rows
-        idx = {c.get("caregiver_id"): c for c in caregivers_rows}
-        table_rows = []
+        idx = _row_id_index(CAREGIVERS_CSV, caregivers_rows, "caregiver_id")
+        # One fixed-width row template per caregiver, escaped and joined once
+        esc = escape
+        trs = []
         for cg_id, cnt in sorted(counts.items(), key=lambda kv: kv[1], reverse=True):
                 c = idx.get(cg_id) or {}
-                table_rows.append([cg_id, c.get("city","—"), c.get("skills","—"), str(cnt)])
-        # render table
-        th = "".join([f"<th>{h}</th>" for h in ("Caregiver","City","Skills","Assigned Clients")])
-        trs = "\n".join(["<tr>" + "".join([f"<td>{cell}</td>" for cell in row]) + "</tr>" for row in table_rows])
-        content = f"""
-            <div class='table-container'>
-                <table class='data-table'>
-                    <thead><tr>{th}</tr></thead>
-                    <tbody>{trs}</tbody>
-                </table>
-            </div>
-        """
-        return f"""
-        <html>
-                <head>
-                    <title>Caregivers Summary</title>
-                    <link rel=\"stylesheet\" href=\"/static/style.css\">
-                    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-                </head>
-                <body>
-                        <header>
-                            <h1>Caregivers Summary</h1>
-                            <nav>
-                                    <a href='/ui/summary'>Summary</a>
-                                    <a href='/ui/individual'>Per-Document Summary</a>
-                                    <a href='/ui/dashboard'>Dashboard</a>
-                                    <a href='/ui/pipeline'>Pipeline</a>
-                                    <a href='/ui/referrals'>Referrals</a>
-                                    <a href='/ui/caregivers'>Caregivers</a>
-                            </nav>
-                        </header>
-                        <main>
-                            {content}
-                        </main>
-                </body>
-        </html>
-        """
+                trs.append(_CAREGIVER_ROW_TMPL % (
+                    esc(cg_id, False), esc(str(c.get("city", "—")), False), esc(str(c.get("skills", "—")), False), cnt,
+                ))
+        # Static page/table shell is prebuilt; only the rows are rendered per call
+        return _CAREGIVERS_PAGE_OPEN + "".join(trs) + _CAREGIVERS_PAGE_CLOSE
+
+
+@router.get("/ui/caregivers", response_class=HTMLResponse)
+async def ui_caregivers(request: Request):
+    return await _cached_html_response(request, "ui_caregivers", [DOC_EXTRACT_DIR / "pipeline_outcomes.csv", CAREGIVERS_CSV], _render_ui_caregivers)
 
 
 # --- Interactive Referrals UI + API ---
-@app.get("/api/outcomes")
-async def api_outcomes():
-    outcomes_rows = _parse_csv_dicts(DOC_EXTRACT_DIR / "pipeline_outcomes.csv")
-    referrals_rows = _parse_csv_dicts(REPO_ROOT / "data" / "referrals_synthetic.csv")
-    # Build index by referral_id for quick join
-    idx = {r.get("referral_id"): r for r in referrals_rows}
-    joined = []
+_OUTCOMES_JOIN_FIELDS = ("agent_segment", "agent_next_action", "agent_rationale", "payer", "plan_type", "patient_city")
+_OUTCOMES_JOIN_MISSING = (None,) * len(_OUTCOMES_JOIN_FIELDS)
+# (input signature, joined rows) for /api/outcomes; rebuilt only when either CSV changes
+_OUTCOMES_JOIN_CACHE: Optional[tuple[tuple, list[dict]]] = None
+
+
+def _join_outcomes_with_referrals(outcomes_path: Path) -> list[dict]:
+    outcomes_rows = _parse_csv_dicts(outcomes_path)
+    referrals_rows = _parse_csv_dicts(REFERRALS_CSV, _REFERRAL_INT_FIELDS, copy_rows=False)
+    # Index only the joined columns, then merge them into the (already copied) outcome rows in one pass
+    idx = {r.get("referral_id"): tuple(r.get(f) for f in _OUTCOMES_JOIN_FIELDS) for r in referrals_rows}
     for o in outcomes_rows:
-        rid = o.get("referral_id")
-        r = idx.get(rid) or {}
-        joined.append({
-            **o,
-            "agent_segment": r.get("agent_segment"),
-            "agent_next_action": r.get("agent_next_action"),
-            "agent_rationale": r.get("agent_rationale"),
-            "payer": r.get("payer"),
-            "plan_type": r.get("plan_type"),
-            "patient_city": r.get("patient_city"),
-        })
-    return {"data": joined}
-
-
-@app.get("/ui/referrals", response_class=HTMLResponse)
-async def ui_referrals():
-    return """
-        <html>
-                <head>
-                    <title>HealthOps Referrals</title>
-                    <link rel=\"stylesheet\" href=\"/static/style.css\">
-                    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-                </head>
-                <body>
-                        <header>
-                            <h1>HealthOps Referrals</h1>
-                            <nav>
-                                    <a href='/ui/summary'>Summary</a>
-                                    <a href='/ui/individual'>Per-Document Summary</a>
-                                    <a href='/ui/dashboard'>Dashboard</a>
-                                    <a href='/ui/pipeline'>Pipeline</a>
-                                    <a href='/ui/referrals'>Referrals</a>
-                            </nav>
-                        </header>
-                        <main>
-                            <div id='app'>
-                                <div class='filters'>
-                                    <input id='search' placeholder='Search referral ID or city' />
-                                    <select id='state'>
-                                        <option value=''>All States</option>
-                                        <option>REFERRAL_RECEIVED</option>
-                                        <option>INTAKE_COMPLETE</option>
-                                        <option>ASSESSMENT_COMPLETE</option>
-                                        <option>ELIGIBILITY_VERIFIED</option>
-                                        <option>AUTH_PENDING</option>
-                                        <option>AUTH_APPROVED</option>
-                                        <option>READY_TO_SCHEDULE</option>
-                                    </select>
-                                    <select id='segment'>
-                                        <option value=''>All Segments</option>
-                                        <option>GREEN</option>
-                                        <option>ORANGE</option>
-                                        <option>RED</option>
-                                    </select>
-                                </div>
-                                <div id='table'></div>
-                            </div>
-                            <script src='/static/app.js'></script>
-                        </main>
-                </body>
-        </html>
-        """
-
-
-@app.post("/api/v1/process-image", response_model=ImageResponse)
-async def process_image(request: ImageRequest):
-    try:
-        if not landingai_service:
-            raise HTTPException(
-                status_code=500,
-                detail="Landing AI service not initialized"
-            )
-        
-        result = await landingai_service.process_image(
-            image_data=request.image_data,
-            image_type=request.image_type,
-            task_type=request.task_type
-        )
-        
-        return ImageResponse(**result)
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Image processing failed: {str(e)}"
-        )
+        o.update(zip(_OUTCOMES_JOIN_FIELDS, idx.get(o.get("referral_id"), _OUTCOMES_JOIN_MISSING)))
+    return outcomes_rows
 
 
-@app.post("/api/v1/upload-image", response_model=ImageResponse)
-async def upload_image(file: UploadFile = File(...), image_type: str = None, task_type: str = "defect_detection"):
-    try:
-        if not landingai_service:
-            raise HTTPException(
-                status_code=500,
-                detail="Landing AI service not initialized"
-            )
-        
-        image_bytes = await file.read()
-        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-        
-        result = await landingai_service.process_image(
-            image_data=image_base64,
-            image_type=image_type,
-            task_type=task_type
-        )
-        
-        return ImageResponse(**result)
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Image upload failed: {str(e)}"
-        )
+@router.get("/api/outcomes")
+async def api_outcomes():
+    global _OUTCOMES_JOIN_CACHE
+    outcomes_path = DOC_EXTRACT_DIR / "pipeline_outcomes.csv"
+    sig = _files_signature((outcomes_path, REFERRALS_CSV))
+    # Joined rows are plain JSON-ready dicts; skip FastAPI's jsonable_encoder pass
+    if _OUTCOMES_JOIN_CACHE and _OUTCOMES_JOIN_CACHE[0] == sig:
+        return DefaultJSONResponse({"data": _OUTCOMES_JOIN_CACHE[1]})
+
+    joined = await run_in_threadpool(_join_outcomes_with_referrals, outcomes_path)
+    _OUTCOMES_JOIN_CACHE = (sig, joined)
+    return DefaultJSONResponse({"data": joined})
+
+
+_UI_REFERRALS_HTML = _REFERRALS_PAGE_HEADER + """
+                <div id='app'>
+                    <div class='filters'>
+                        <input id='search' placeholder='Search referral ID or city' />
+                        <select id='state'>
+                            <option value=''>All States</option>
+                            <option>REFERRAL_RECEIVED</option>
+                            <option>INTAKE_COMPLETE</option>
+                            <option>ASSESSMENT_COMPLETE</option>
+                            <option>ELIGIBILITY_VERIFIED</option>
+                            <option>AUTH_PENDING</option>
+                            <option>AUTH_APPROVED</option>
+                            <option>READY_TO_SCHEDULE</option>
+                        </select>
+                        <select id='segment'>
+                            <option value=''>All Segments</option>
+                            <option>GREEN</option>
+                            <option>ORANGE</option>
+                            <option>RED</option>
+                        </select>
+                    </div>
+                    <div id='table'></div>
+                </div>
+                <script src='/static/app.js'></script>
+""" + _PAGE_FOOTER
+
+
+# Static page: encoded and fingerprinted once at import
+_UI_REFERRALS_BYTES = _UI_REFERRALS_HTML.encode("utf-8")
+_UI_REFERRALS_HEADERS = {"Cache-Control": "public, max-age=300", "ETag": _html_etag(_UI_REFERRALS_HTML)}
+
 
+@router.get("/ui/referrals", response_class=HTMLResponse)
+async def ui_referrals(request: Request):
+    if request.headers.get("if-none-match") == _UI_REFERRALS_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_UI_REFERRALS_HEADERS)
+    return Response(_UI_REFERRALS_BYTES, media_type="text/html", headers=_UI_REFERRALS_HEADERS)
 
-@app.post("/api/v1/validate-predictions")
-async def validate_predictions(predictions: list):
+
+def _json_array_stream(first: Optional[list], chunks: Iterator[list]) -> Iterator[bytes]:
+    yield b"["
+    if first:
+        # Each chunk encodes as "[...]"; drop its brackets and splice the rows into one array
+        yield _json_bytes(first)[1:-1]
+        for chunk in chunks:
+            yield b"," + _json_bytes(chunk)[1:-1]
+    yield b"]"
+
+
+async def _stream_query_rows(query: str, params: tuple) -> StreamingResponse:
+    """Stream a SELECT as a JSON array straight from a server-side cursor.
+
+    The first chunk is fetched before responding so query errors still surface as a 500.
+    """
+    chunks = db_service.iter_query(query, params)
     try:
-        if not landingai_service:
-            raise HTTPException(
-                status_code=500,
-                detail="Landing AI service not initialized"
-            )
-        
-        result = await landingai_service.validate_predictions(predictions)
-        return result
-        
+        first = await run_in_threadpool(next, chunks, None)
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Validation failed: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
+    return StreamingResponse(_json_array_stream(first, chunks), media_type="application/json")
+
 
+def _filter_sql_variants(select: str, conditions: tuple, tail: str) -> tuple[tuple[str, tuple[int, ...]], ...]:
+    """Precompute (sql, positions of the bound filters) for every bitmask of set filters.
 
-@app.get("/api/v1/referrals")
+    Bit i of the index corresponds to conditions[i].
+    """
+    variants = []
+    for mask in range(1 << len(conditions)):
+        positions = tuple(i for i in range(len(conditions)) if mask >> i & 1)
+        variants.append((select + "".join(f" AND {conditions[i]}" for i in positions) + tail, positions))
+    return tuple(variants)
+
+
+# LIMIT/OFFSET are bound parameters so each filter combination keeps one constant SQL string
+_REFERRALS_SQL = _filter_sql_variants(
+    "SELECT * FROM referrals WHERE 1=1",
+    ("urgency = %s", "agent_segment = %s", "schedule_status = %s"),
+    " ORDER BY referral_received_date DESC LIMIT %s OFFSET %s",
+)
+
+_CAREGIVERS_SQL = _filter_sql_variants(
+    """SELECT caregiver_id, gender, date_of_birth, age, primary_language, skills, 
+                   employment_type, availability, city, active, created_at 
+                   FROM caregivers WHERE 1=1""",
+    ("city = %s", "active = %s", "skills LIKE %s"),
+    " ORDER BY caregiver_id LIMIT %s OFFSET %s",
+)
+
+
+@router.get("/api/v1/referrals")
 async def get_referrals(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
@@ -1786,9 +2436,8 @@ async def get_referrals(
     schedule_status: Optional[str] = None
 ):
     try:
-        _autopilot_tick_all()
         if not _db_ready():
-            rows = _load_referrals_csv()
+            rows = await run_in_threadpool(_load_referrals_csv)
             if urgency:
                 rows = [r for r in rows if (r.get("urgency") == urgency)]
             if agent_segment:
@@ -1801,45 +2450,25 @@ async def get_referrals(
                 return str(r.get("referral_received_date") or "")
 
             rows.sort(key=_sort_key, reverse=True)
-            return rows[offset: offset + limit]
-        
-        query = "SELECT * FROM referrals WHERE 1=1"
-        params = []
-        
-        if urgency:
-            query += " AND urgency = %s"
-            params.append(urgency)
+            # Rows are plain JSON-ready dicts; skip FastAPI's jsonable_encoder pass
+            return DefaultJSONResponse(rows[offset: offset + limit])
         
-        if agent_segment:
-            query += " AND agent_segment = %s"
-            params.append(agent_segment)
+        filters = (urgency, agent_segment, schedule_status)
+        query, positions = _REFERRALS_SQL[bool(urgency) | bool(agent_segment) << 1 | bool(schedule_status) << 2]
         
-        if schedule_status:
-            query += " AND schedule_status = %s"
-            params.append(schedule_status)
-        
-        query += f" ORDER BY referral_received_date DESC LIMIT {limit} OFFSET {offset}"
-        
-        result = db_service.query(query, tuple(params) if params else None)
-        
-        if not result['success']:
-            raise HTTPException(status_code=500, detail=result['message'])
-        
-        return result['data']
+        return await _stream_query_rows(query, (*[filters[i] for i in positions], limit, offset))
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        error_detail = f"Failed to fetch referrals: {str(e)}\n{traceback.format_exc()}"
-        print(error_detail)
+        logger.exception("Failed to fetch referrals")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch referrals: {str(e)}"
         )
 
 
-@app.post("/api/v1/scheduling/apply")
+@router.post("/api/v1/scheduling/apply")
 async def apply_schedule(
     referral_id: str,
     caregiver_id: Optional[str] = None,
@@ -1861,7 +2490,7 @@ async def apply_schedule(
 
         if _db_ready():
             # Ensure assignments table exists (safe no-op if already created)
-            db_service.query(
+            await db_service.aquery(
                 """
                 CREATE TABLE IF NOT EXISTS referral_assignments (
                     referral_id VARCHAR(20) PRIMARY KEY,
@@ -1874,7 +2503,7 @@ async def apply_schedule(
             )
 
             # Update referral scheduling state
-            update_result = db_service.query(
+            update_result = await db_service.aquery(
                 """
                 UPDATE referrals
                 SET schedule_status = %s,
@@ -1890,7 +2519,7 @@ async def apply_schedule(
             # Upsert assignment
             if caregiver_id:
                 cg = str(caregiver_id).strip()
-                db_service.query(
+                await db_service.aquery(
                     """
                     INSERT INTO referral_assignments (referral_id, caregiver_id, schedule_status, scheduled_date)
                     VALUES (%s, %s, %s, %s)
@@ -1913,20 +2542,19 @@ async def apply_schedule(
             }
 
         # CSV/demo mode: write override
-        overrides = _load_scheduling_overrides()
-        overrides[rid] = {
+        override = {
             "schedule_status": status,
             "scheduled_date": sd.isoformat(),
             "assigned_caregiver_id": str(caregiver_id).strip() if caregiver_id else None,
             "updated_at": datetime.utcnow().isoformat() + "Z",
         }
-        _save_scheduling_overrides(overrides)
+        await run_in_threadpool(_store_scheduling_override, rid, override)
 
         # Keep journey timeline consistent with scheduling actions.
         if status == "SCHEDULED":
-            _record_journey_event(rid, "SCHEDULED", source="scheduler")
+            await run_in_threadpool(_record_journey_event, rid, "SCHEDULED", "scheduler")
         elif status == "COMPLETED":
-            _record_journey_event(rid, "SERVICE_COMPLETED", source="scheduler")
+            await run_in_threadpool(_record_journey_event, rid, "SERVICE_COMPLETED", "scheduler")
         return {
             "success": True,
             "referral_id": rid,
@@ -1942,29 +2570,25 @@ async def apply_schedule(
         raise HTTPException(status_code=500, detail=f"Failed to apply schedule: {str(e)}")
 
 
-def _priority_score(referral: dict) -> int:
-    """Heuristic priority scoring for scheduling queue."""
-    score = 0
-    urgency = str(referral.get("urgency") or "").strip().lower()
-    segment = str(referral.get("agent_segment") or "").strip().upper()
+_SEGMENT_PRIORITY_BONUS = {"RED": 50, "ORANGE": 25}
+
+
+def _priority_score(referral: dict, today: date) -> int:
+    """Heuristic priority scoring for scheduling queue; `today` is bound once by the caller."""
+    score = _SEGMENT_PRIORITY_BONUS.get(_UPPER[referral.get("agent_segment")], 0)
+    if _LOWER[referral.get("urgency")] == "urgent":
+        score += 100
     received = _safe_date(referral.get("referral_received_date"))
     auth_end = _safe_date(referral.get("auth_end_date"))
     contact_attempts = _safe_int(referral.get("contact_attempts"))
     units_remaining = _safe_int(referral.get("auth_units_remaining"))
 
-    if urgency == "urgent":
-        score += 100
-    if segment == "RED":
-        score += 50
-    elif segment == "ORANGE":
-        score += 25
-
     if received:
-        days_waiting = max(0, (date.today() - received).days)
+        days_waiting = max(0, (today - received).days)
         score += min(days_waiting, 30)
 
     if auth_end:
-        days_left = (auth_end - date.today()).days
+        days_left = (auth_end - today).days
         if days_left <= 3:
             score += 40
         elif days_left <= 7:
@@ -1972,9 +2596,9 @@ def _priority_score(referral: dict) -> int:
 
     if contact_attempts >= 3:
         score += 10
-    if units_remaining <= 2 and units_remaining > 0:
+    if 0 < units_remaining <= 2:
         score += 10
-    return int(score)
+    return score
 
 
 def _caregiver_capacity(caregiver: dict) -> int:
@@ -1994,78 +2618,80 @@ def _caregiver_capacity(caregiver: dict) -> int:
 
 def _compute_caregiver_load(assignments: dict, referrals: list[dict]) -> dict[str, int]:
     """Count active scheduled referrals per caregiver."""
-    ref_by_id = {str(r.get("referral_id") or ""): r for r in referrals}
-    load: dict[str, int] = {}
+    scheduled: dict[str, str] = {}
     for rid, a in (assignments or {}).items():
         if not isinstance(a, dict):
             continue
         cg = str(a.get("caregiver_id") or "").strip()
         if not cg:
             continue
-        status = str(a.get("schedule_status") or "").strip().upper()
+        status = _UPPER[a.get("schedule_status")]
         if status != "SCHEDULED":
             continue
-        r = ref_by_id.get(str(rid))
+        scheduled[str(rid)] = cg
+    if not scheduled:
+        return {}
+    # Index only the referrals that have a scheduled assignment
+    ref_by_id = {rid: r for r in referrals if (rid := str(r.get("referral_id") or "")) in scheduled}
+    load: dict[str, int] = {}
+    for rid, cg in scheduled.items():
+        r = ref_by_id.get(rid)
         if not r:
             continue
-        if str(r.get("service_complete") or "").strip().upper() == "Y":
+        if _is_yes(r, "service_complete"):
             continue
         load[cg] = load.get(cg, 0) + 1
     return load
 
 
+# Stored journey_stage -> board column; board stage names map to themselves.
+# INTAKE_RECEIVED and unknown values are absent, so those rows fall through to derivation.
+_STORED_STAGE_TO_BOARD = {
+    "DOCS_COMPLETED": "READY_TO_SCHEDULE",
+    "HOME_ASSESSMENT_SCHEDULED": "HOME_ASSESSMENT_PENDING",
+    "HOME_ASSESSMENT_COMPLETED": "READY_TO_SCHEDULE",
+    "SERVICE_STARTED": "SCHEDULED",
+    "READY_TO_BILL": "READY_TO_BILL",
+    "SERVICE_COMPLETED": "COMPLETED",
+    **{s: s for s in (
+        "SCHEDULED", "COMPLETED", "AUTH_PENDING", "AUTH_ISSUE", "DOCS_PENDING",
+        "HOME_ASSESSMENT_PENDING", "READY_TO_SCHEDULE", "IN_PROGRESS",
+    )},
+}
+
+
 def _derive_journey_stage(r: dict) -> str:
     """Derive a human-demo-friendly stage for board view.
     
     Prioritizes explicitly set journey_stage from database, falls back to derived logic.
+    Each field is read and normalized once.
     """
     try:
-        # Check if journey_stage is explicitly set in database
-        stored_stage = str(r.get("journey_stage") or "").strip().upper()
-        if stored_stage and stored_stage not in ("", "INTAKE_RECEIVED"):
-            # Map stored stages to board stages
-            stage_mapping = {
-                "DOCS_COMPLETED": "READY_TO_SCHEDULE",
-                "HOME_ASSESSMENT_SCHEDULED": "HOME_ASSESSMENT_PENDING",
-                "HOME_ASSESSMENT_COMPLETED": "READY_TO_SCHEDULE",
-                "SERVICE_STARTED": "SCHEDULED",
-                "READY_TO_BILL": "READY_TO_BILL",
-                "SERVICE_COMPLETED": "COMPLETED",
-            }
-            if stored_stage in stage_mapping:
-                return stage_mapping[stored_stage]
-            if stored_stage in ("SCHEDULED", "COMPLETED", "AUTH_PENDING", "AUTH_ISSUE", "DOCS_PENDING", "HOME_ASSESSMENT_PENDING", "READY_TO_SCHEDULE", "IN_PROGRESS"):
-                return stored_stage
+        stored = _STORED_STAGE_TO_BOARD.get(_UPPER[r.get("journey_stage")])
+        if stored is not None:
+            return stored
 
         # Terminal states from data
-        if str(r.get("service_complete") or "").strip().upper() == "Y" or str(r.get("schedule_status") or "").strip().upper() == "COMPLETED":
+        sched_status = _UPPER[r.get("schedule_status")]
+        if sched_status == "COMPLETED" or _is_yes(r, "service_complete"):
             return "COMPLETED"
-        if str(r.get("ready_to_bill") or "").strip().upper() == "Y":
+        if _is_yes(r, "ready_to_bill"):
             return "READY_TO_BILL"
-        if str(r.get("schedule_status") or "").strip().upper() == "SCHEDULED":
+        if sched_status == "SCHEDULED":
             return "SCHEDULED"
 
-        insurance_ok = str(r.get("insurance_active") or "").strip().upper() == "Y"
-        auth_required = str(r.get("auth_required") or "").strip().upper() == "Y"
-        auth_status = str(r.get("auth_status") or "").strip().upper()
-        auth_ok = (not auth_required) or (auth_status == "APPROVED")
+        insurance_ok = _is_yes(r, "insurance_active")
+        auth_required = _is_yes(r, "auth_required")
+        auth_status = _UPPER[r.get("auth_status")]
 
-        if insurance_ok and auth_required and auth_status not in ("APPROVED", ""):
-            # DENIED/EXPIRED/etc
-            return "AUTH_ISSUE"
         if insurance_ok and auth_required and auth_status != "APPROVED":
-            return "AUTH_PENDING"
-
-        docs_complete = str(r.get("docs_complete") or "").strip().upper() == "Y"
-        if not docs_complete:
+            # Blank status is still pending; DENIED/EXPIRED/etc are issues
+            return "AUTH_ISSUE" if auth_status else "AUTH_PENDING"
+        if not _is_yes(r, "docs_complete"):
             return "DOCS_PENDING"
-
-        ha_done = str(r.get("home_assessment_done") or "").strip().upper() == "Y"
-        if not ha_done:
+        if not _is_yes(r, "home_assessment_done"):
             return "HOME_ASSESSMENT_PENDING"
-
-        sched_status = str(r.get("schedule_status") or "").strip().upper()
-        if sched_status == "NOT_SCHEDULED" and insurance_ok and auth_ok:
+        if sched_status == "NOT_SCHEDULED" and insurance_ok and (not auth_required or auth_status == "APPROVED"):
             return "READY_TO_SCHEDULE"
 
         return "IN_PROGRESS"
@@ -2073,52 +2699,51 @@ def _derive_journey_stage(r: dict) -> str:
         return "IN_PROGRESS"
 
 
-@app.get("/api/v1/journey/board")
+_JOURNEY_BOARD_STAGES = (
+    ("AUTH_PENDING", "Authorization Pending"),
+    ("AUTH_ISSUE", "Authorization Issue"),
+    ("DOCS_PENDING", "Docs Pending"),
+    ("HOME_ASSESSMENT_PENDING", "Home Assessment Pending"),
+    ("READY_TO_SCHEDULE", "Ready to Schedule"),
+    ("SCHEDULED", "Scheduled"),
+    ("READY_TO_BILL", "Ready to Bill"),
+    ("COMPLETED", "Completed"),
+    ("IN_PROGRESS", "In Progress"),
+)
+_JOURNEY_BOARD_COLUMNS = (
+    "referral_id", "urgency", "agent_segment", "patient_city", "payer", "schedule_status", "auth_status",
+    "agent_next_action", "referral_received_date", "service_complete", "ready_to_bill", "insurance_active",
+    "auth_required", "docs_complete", "home_assessment_done",
+)
+
+
+@router.get("/api/v1/journey/board")
 async def journey_board(limit_per_stage: int = Query(50, ge=5, le=200)):
     """Kanban-style board data: all referrals grouped by derived stage."""
     try:
-        _autopilot_tick_all()
         if _db_ready():
-            res = db_service.query("SELECT * FROM referrals")
+            # Only the columns _derive_journey_stage() and the board cards read
+            cols = _JOURNEY_BOARD_COLUMNS + (("journey_stage",) if await _referrals_has_journey_stage() else ())
+            res = await db_service.aquery(f"SELECT {', '.join(cols)} FROM referrals")
             if not res.get("success"):
                 raise HTTPException(status_code=500, detail=res.get("message"))
             referrals = res.get("data") or []
         else:
-            referrals = _load_referrals_csv()
-
-        stage_order = [
-            ("AUTH_PENDING", "Authorization Pending"),
-            ("AUTH_ISSUE", "Authorization Issue"),
-            ("DOCS_PENDING", "Docs Pending"),
-            ("HOME_ASSESSMENT_PENDING", "Home Assessment Pending"),
-            ("READY_TO_SCHEDULE", "Ready to Schedule"),
-            ("SCHEDULED", "Scheduled"),
-            ("READY_TO_BILL", "Ready to Bill"),
-            ("COMPLETED", "Completed"),
-            ("IN_PROGRESS", "In Progress"),
-        ]
+            referrals = await run_in_threadpool(_load_referrals_csv)
 
-        buckets: dict[str, list[dict]] = {k: [] for k, _ in stage_order}
+        # One pass: derive each row's stage and its (urgency, received date) sort key together
+        buckets: dict[str, list[tuple]] = {k: [] for k, _ in _JOURNEY_BOARD_STAGES}
         for r in referrals:
-            stage = _derive_journey_stage(r)
-            if stage not in buckets:
-                buckets.setdefault(stage, []).append(r)
-            else:
-                buckets[stage].append(r)
-
-        # Sort each bucket by urgency then received date
-        def _urg_key(rr: dict) -> int:
-            u = str(rr.get("urgency") or "").strip().lower()
-            return 0 if u == "urgent" else 1
-
-        def _date_key(rr: dict) -> str:
-            return str(rr.get("referral_received_date") or "")
+            bucket = buckets.get(_derive_journey_stage(r))
+            if bucket is not None:
+                urgent = _LOWER[r.get("urgency")] == "urgent"
+                bucket.append(((0 if urgent else 1, str(r.get("referral_received_date") or "")), r))
 
         stages = []
-        for key, label in stage_order:
-            rows = buckets.get(key) or []
-            rows.sort(key=lambda rr: (_urg_key(rr), _date_key(rr)))
-            trimmed = rows[:limit_per_stage]
+        for key, label in _JOURNEY_BOARD_STAGES:
+            rows = buckets[key]
+            # Only the first limit_per_stage are shown; nsmallest is a stable partial sort
+            trimmed = [rr for _, rr in heapq.nsmallest(limit_per_stage, rows, key=itemgetter(0))]
             stages.append(
                 {
                     "stage": key,
@@ -2142,37 +2767,109 @@ async def journey_board(limit_per_stage: int = Query(50, ge=5, le=200)):
                 }
             )
 
-        return {
+        return DefaultJSONResponse({
             "success": True,
             "stages": stages,
             "generated_at": datetime.utcnow().isoformat() + "Z",
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to build journey board: {str(e)}")
 
 
-@app.get("/api/v1/ops/summary")
+# DB-mode ops KPIs: counted in PostgreSQL so only scalars and the pending rows cross the wire.
+# The predicates mirror _ops_referral_counts().
+_OPS_KPI_FIELDS = (
+    "total_referrals", "active_clients", "completed_clients", "scheduled_clients", "leads_last_7d", "leads_last_7d_urgent",
+)
+_OPS_KPI_SQL = """
+    SELECT
+        COUNT(*) AS total_referrals,
+        COUNT(*) FILTER (WHERE UPPER(TRIM(COALESCE(service_complete, ''))) = 'N') AS active_clients,
+        COUNT(*) FILTER (WHERE UPPER(TRIM(COALESCE(service_complete, ''))) = 'Y') AS completed_clients,
+        COUNT(*) FILTER (WHERE TRIM(COALESCE(schedule_status, '')) = 'SCHEDULED') AS scheduled_clients,
+        COUNT(*) FILTER (WHERE referral_received_date >= %s) AS leads_last_7d,
+        COUNT(*) FILTER (WHERE referral_received_date >= %s AND LOWER(TRIM(COALESCE(urgency, ''))) = 'urgent') AS leads_last_7d_urgent
+    FROM referrals
+"""
+_OPS_PENDING_SQL = """
+    SELECT referral_id, urgency, agent_segment, patient_city, payer, schedule_status,
+           auth_units_remaining, auth_end_date, contact_attempts, referral_received_date
+    FROM referrals
+    WHERE TRIM(COALESCE(schedule_status, '')) = 'NOT_SCHEDULED'
+      AND UPPER(TRIM(COALESCE(service_complete, ''))) = 'N'
+      AND UPPER(TRIM(COALESCE(insurance_active, ''))) = 'Y'
+      AND (UPPER(TRIM(COALESCE(auth_required, ''))) = 'N' OR UPPER(TRIM(COALESCE(auth_status, ''))) = 'APPROVED')
+"""
+
+
+def _ops_referral_counts(referrals: list[dict], last_7d: date) -> tuple[dict, list[dict], list[dict]]:
+    """File-mode ops KPIs: (counts keyed like _OPS_KPI_SQL's columns, pending queue, urgent pending).
+
+    One pass over referrals: normalize each field once and bump every counter it feeds.
+    """
+    counts = dict.fromkeys(_OPS_KPI_FIELDS, 0)
+    counts["total_referrals"] = len(referrals)
+    queue: list[dict] = []
+    urgent_pending: list[dict] = []
+    for r in referrals:
+        complete = _UPPER[r.get("service_complete")]
+        if complete == "N":
+            counts["active_clients"] += 1
+        elif complete == "Y":
+            counts["completed_clients"] += 1
+        sched_status = str(r.get("schedule_status") or "").strip()
+        if sched_status == "SCHEDULED":
+            counts["scheduled_clients"] += 1
+        urgent = _LOWER[r.get("urgency")] == "urgent"
+        if (_safe_date(r.get("referral_received_date")) or date(1970, 1, 1)) >= last_7d:
+            counts["leads_last_7d"] += 1
+            if urgent:
+                counts["leads_last_7d_urgent"] += 1
+        if (
+            sched_status == "NOT_SCHEDULED"
+            and complete == "N"
+            and _is_yes(r, "insurance_active")
+            and (
+                _UPPER[r.get("auth_required")] == "N"
+                or _UPPER[r.get("auth_status")] == "APPROVED"
+            )
+        ):
+            queue.append(r)
+            if urgent:
+                urgent_pending.append(r)
+    return counts, queue, urgent_pending
+
+
+@router.get("/api/v1/ops/summary")
 async def ops_summary(limit: int = Query(10, ge=1, le=50)):
     """Live ops KPIs for the React frontend (active clients, urgent, last-week leads, priority queue, pairings)."""
     try:
-        _autopilot_tick_all()
         today = date.today()
         last_7d = today - timedelta(days=7)
 
         if _db_ready():
-            referrals_result = db_service.query("SELECT * FROM referrals")
-            if not referrals_result.get("success"):
-                raise HTTPException(status_code=500, detail=referrals_result.get("message"))
-            referrals = referrals_result.get("data") or []
-
-            caregivers_result = db_service.query("SELECT * FROM caregivers")
+            kpi_result = await db_service.aquery(_OPS_KPI_SQL, (last_7d, last_7d))
+            if not kpi_result.get("success"):
+                raise HTTPException(status_code=500, detail=kpi_result.get("message"))
+            kpi_row = (kpi_result.get("data") or [{}])[0]
+            counts = {k: int(kpi_row.get(k) or 0) for k in _OPS_KPI_FIELDS}
+
+            pending_result = await db_service.aquery(_OPS_PENDING_SQL)
+            if not pending_result.get("success"):
+                raise HTTPException(status_code=500, detail=pending_result.get("message"))
+            queue = pending_result.get("data") or []
+            urgent_pending = [r for r in queue if _LOWER[r.get("urgency")] == "urgent"]
+
+            caregivers_result = await db_service.aquery(
+                "SELECT caregiver_id, employment_type, availability, active FROM caregivers"
+            )
             caregivers = caregivers_result.get("data") if caregivers_result.get("success") else []
 
             # Optional assignments table
             assignments = {}
-            assign_result = db_service.query(
+            assign_result = await db_service.aquery(
                 """
                 SELECT referral_id, caregiver_id, schedule_status, scheduled_date
                 FROM referral_assignments
@@ -2181,10 +2878,22 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
             if assign_result.get("success"):
                 for r in assign_result.get("data") or []:
                     assignments[str(r.get("referral_id"))] = r
+
+            # Caregiver load only needs the assigned referrals' completion flag
+            referrals = []
+            if assignments:
+                load_result = await db_service.aquery(
+                    "SELECT referral_id, service_complete FROM referrals WHERE referral_id = ANY(%s)",
+                    (list(assignments),),
+                )
+                if not load_result.get("success"):
+                    raise HTTPException(status_code=500, detail=load_result.get("message"))
+                referrals = load_result.get("data") or []
         else:
-            referrals = _load_referrals_csv()
-            caregivers = _load_caregivers_csv()
-            overrides = _load_scheduling_overrides()
+            referrals = await run_in_threadpool(_load_referrals_csv)
+            caregivers = await run_in_threadpool(_load_caregivers_csv)
+            # Read-only: no deep copy of the cached overrides
+            overrides = await run_in_threadpool(_read_json_cached, SCHEDULING_OVERRIDES_PATH, dict)
             assignments = {
                 rid: {
                     "referral_id": rid,
@@ -2195,28 +2904,12 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
                 for rid, o in overrides.items()
                 if isinstance(o, dict)
             }
+            counts, queue, urgent_pending = _ops_referral_counts(referrals, last_7d)
 
-        def _is_active(r: dict) -> bool:
-            return str(r.get("service_complete") or "").strip().upper() == "N"
-
-        def _is_pending_sched(r: dict) -> bool:
-            return (
-                str(r.get("schedule_status") or "").strip() == "NOT_SCHEDULED"
-                and str(r.get("insurance_active") or "").strip().upper() == "Y"
-                and (
-                    str(r.get("auth_required") or "").strip().upper() == "N"
-                    or str(r.get("auth_status") or "").strip().upper() == "APPROVED"
-                )
-                and _is_active(r)
-            )
-
-        total_referrals = len(referrals)
         total_caregivers = len(caregivers)
-        active_clients = sum(1 for r in referrals if _is_active(r))
-        completed_clients = sum(1 for r in referrals if str(r.get("service_complete") or "").strip().upper() == "Y")
-        scheduled_clients = sum(1 for r in referrals if str(r.get("schedule_status") or "").strip() == "SCHEDULED")
-        pending_scheduling = sum(1 for r in referrals if _is_pending_sched(r))
-        active_caregivers = sum(1 for c in caregivers if str(c.get("active") or "").strip().upper() == "Y")
+        pending_scheduling = len(queue)
+        urgent_pending_count = len(urgent_pending)
+        active_caregivers = sum(1 for c in caregivers if _is_yes(c, "active"))
 
         caregiver_load = _compute_caregiver_load(assignments, referrals)
         caregivers_by_id = {str(c.get("caregiver_id") or "").strip(): c for c in caregivers}
@@ -2225,7 +2918,7 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
         for cg_id, c in caregivers_by_id.items():
             if not cg_id:
                 continue
-            if str(c.get("active") or "").strip().upper() != "Y":
+            if not _is_yes(c, "active"):
                 continue
             cap = _caregiver_capacity(c)
             used = caregiver_load.get(cg_id, 0)
@@ -2234,23 +2927,18 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
             else:
                 available_caregivers += 1
 
-        leads_last_7d = [r for r in referrals if (_safe_date(r.get("referral_received_date")) or date(1970, 1, 1)) >= last_7d]
-        leads_last_7d_count = len(leads_last_7d)
-        leads_last_7d_urgent = [r for r in leads_last_7d if str(r.get("urgency") or "").strip().lower() == "urgent"]
-
-        urgent_pending = [r for r in referrals if _is_pending_sched(r) and str(r.get("urgency") or "").strip().lower() == "urgent"]
-        urgent_pending_count = len(urgent_pending)
-
         # Pairings: scheduled/assigned referrals
         assigned_pairs = [a for a in assignments.values() if (a.get("caregiver_id") or a.get("caregiver_id") == 0)]
         unique_caregivers_paired = len({str(a.get("caregiver_id")) for a in assigned_pairs if a.get("caregiver_id")})
         paired_referrals = len({str(a.get("referral_id")) for a in assigned_pairs if a.get("referral_id")})
 
-        queue = [r for r in referrals if _is_pending_sched(r)]
-        for r in queue:
-            r["_priority_score"] = _priority_score(r)
-        queue.sort(key=lambda r: (-(r.get("_priority_score") or 0), str(r.get("referral_received_date") or "")))
-        top = queue[:limit]
+        # Scores ride alongside the rows (no "_priority_score" written into them); nsmallest is a
+        # stable O(N log limit) partial sort: highest score first, oldest received date on ties
+        top = heapq.nsmallest(
+            limit,
+            ((-_priority_score(r, today), str(r.get("referral_received_date") or ""), r) for r in queue),
+            key=itemgetter(0, 1),
+        )
 
         def _priority_label(score: int) -> str:
             if score >= 130:
@@ -2270,10 +2958,10 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
                 "auth_units_remaining": r.get("auth_units_remaining"),
                 "contact_attempts": r.get("contact_attempts"),
                 "referral_received_date": r.get("referral_received_date"),
-                "score": int(r.get("_priority_score") or 0),
-                "priority": _priority_label(int(r.get("_priority_score") or 0)),
+                "score": -neg_score,
+                "priority": _priority_label(-neg_score),
             }
-            for r in top
+            for neg_score, _, r in top
         ]
 
         urgent_preview = [
@@ -2287,12 +2975,12 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
             for r in urgent_pending[: min(10, len(urgent_pending))]
         ]
 
-        return {
+        return DefaultJSONResponse({
             "kpis": {
-                "total_referrals": total_referrals,
-                "active_clients": active_clients,
-                "completed_clients": completed_clients,
-                "scheduled_clients": scheduled_clients,
+                "total_referrals": counts["total_referrals"],
+                "active_clients": counts["active_clients"],
+                "completed_clients": counts["completed_clients"],
+                "scheduled_clients": counts["scheduled_clients"],
                 "pending_scheduling": pending_scheduling,
                 "total_caregivers": total_caregivers,
                 "active_caregivers": active_caregivers,
@@ -2300,14 +2988,14 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
                 "busy_caregivers": busy_caregivers,
                 "paired_referrals": paired_referrals,
                 "unique_caregivers_paired": unique_caregivers_paired,
-                "leads_last_7d": leads_last_7d_count,
-                "leads_last_7d_urgent": len(leads_last_7d_urgent),
+                "leads_last_7d": counts["leads_last_7d"],
+                "leads_last_7d_urgent": counts["leads_last_7d_urgent"],
                 "urgent_pending": urgent_pending_count,
             },
             "urgent_pending_preview": urgent_preview,
             "priority_queue": priority_queue,
             "generated_at": datetime.utcnow().isoformat() + "Z",
-        }
+        })
 
     except HTTPException:
         raise
@@ -2315,7 +3003,14 @@ async def ops_summary(limit: int = Query(10, ge=1, le=50)):
         raise HTTPException(status_code=500, detail=f"Failed to build ops summary: {str(e)}")
 
 
-@app.get("/api/v1/caregivers", response_model=List[CaregiverResponse])
+# Fields of CaregiverResponse, in declaration order; response_model stays on the route for the OpenAPI schema only
+_CAREGIVER_RESPONSE_FIELDS = (
+    "caregiver_id", "gender", "date_of_birth", "age", "primary_language", "skills",
+    "employment_type", "availability", "city", "active", "created_at",
+)
+
+
+@router.get("/api/v1/caregivers", response_model=List[CaregiverResponse])
 async def get_caregivers(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
@@ -2325,11 +3020,12 @@ async def get_caregivers(
 ):
     try:
         if not _db_ready():
-            rows = _load_caregivers_csv()
+            rows = await run_in_threadpool(_load_caregivers_csv)
 
             # Add derived load/capacity fields so caregiver counts fluctuate with scheduling
-            referrals = _load_referrals_csv()
-            overrides = _load_scheduling_overrides()
+            referrals = await run_in_threadpool(_load_referrals_csv)
+            # Read-only: no deep copy of the cached overrides
+            overrides = await run_in_threadpool(_read_json_cached, SCHEDULING_OVERRIDES_PATH, dict)
             assignments = {
                 rid: {
                     "referral_id": rid,
@@ -2359,34 +3055,17 @@ async def get_caregivers(
                 sk = skills.strip().lower()
                 rows = [r for r in rows if sk in str(r.get("skills") or "").lower()]
             rows.sort(key=lambda r: str(r.get("caregiver_id") or ""))
-            return rows[offset: offset + limit]
+            # Project onto the CaregiverResponse fields by hand; returning the response directly skips
+            # FastAPI's per-row Pydantic validation and re-encoding
+            return DefaultJSONResponse(
+                [{f: r.get(f) for f in _CAREGIVER_RESPONSE_FIELDS} for r in rows[offset: offset + limit]]
+            )
         
         # Select only needed columns
-        query = """SELECT caregiver_id, gender, date_of_birth, age, primary_language, skills, 
-                   employment_type, availability, city, active 
-                   FROM caregivers WHERE 1=1"""
-        params = []
-        
-        if city:
-            query += " AND city = %s"
-            params.append(city)
-        
-        if active:
-            query += " AND active = %s"
-            params.append(active)
-        
-        if skills:
-            query += " AND skills LIKE %s"
-            params.append(f"%{skills}%")
-        
-        query += f" ORDER BY caregiver_id LIMIT {limit} OFFSET {offset}"
+        filters = (city, active, f"%{skills}%" if skills else None)
+        query, positions = _CAREGIVERS_SQL[bool(city) | bool(active) << 1 | bool(skills) << 2]
         
-        result = db_service.query(query, tuple(params) if params else None)
-        
-        if not result['success']:
-            raise HTTPException(status_code=500, detail=result['message'])
-        
-        return result['data']
+        return await _stream_query_rows(query, (*[filters[i] for i in positions], limit, offset))
         
     except HTTPException:
         raise
@@ -2397,26 +3076,26 @@ async def get_caregivers(
         )
 
 
-@app.get("/api/v1/stats", response_model=DataStatsResponse)
+@router.get("/api/v1/stats", response_model=DataStatsResponse)
 async def get_stats():
     try:
         if not _db_ready():
-            referrals = _load_referrals_csv()
-            caregivers = _load_caregivers_csv()
+            referrals = await run_in_threadpool(_load_referrals_csv)
+            caregivers = await run_in_threadpool(_load_caregivers_csv)
             stats = {
                 "total_referrals": len(referrals),
-                "active_referrals": sum(1 for r in referrals if str(r.get("service_complete") or "").strip().upper() == "N"),
+                "active_referrals": sum(1 for r in referrals if _UPPER[r.get("service_complete")] == "N"),
                 "total_caregivers": len(caregivers),
-                "active_caregivers": sum(1 for c in caregivers if str(c.get("active") or "").strip().upper() == "Y"),
+                "active_caregivers": sum(1 for c in caregivers if _is_yes(c, "active")),
             }
-            return stats
+            return DefaultJSONResponse(stats)
         
-        result = db_service.get_table_stats()
+        result = await db_service.aget_table_stats()
         
         if not result['success']:
             raise HTTPException(status_code=500, detail=result['message'])
         
-        return result['stats']
+        return DefaultJSONResponse(result['stats'])
         
     except HTTPException:
         raise
@@ -2427,10 +3106,10 @@ async def get_stats():
         )
 
 
-@app.get("/api/v1/dashboard-metrics", response_model=DashboardMetricsResponse)
+@router.get("/api/v1/dashboard-metrics", response_model=DashboardMetricsResponse)
 async def get_dashboard_metrics():
     try:
-        return _build_dashboard_metrics()
+        return await _dashboard_metrics()
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -2438,7 +3117,7 @@ async def get_dashboard_metrics():
         )
 
 
-@app.post("/api/v1/agent/process-referral")
+@router.post("/api/v1/agent/process-referral")
 async def process_referral_with_agents(referral_id: str):
     """
     Run 3-agent workflow for a specific referral:
@@ -2452,7 +3131,7 @@ async def process_referral_with_agents(referral_id: str):
 
         if _db_ready():
             # Get referral data
-            result = db_service.query(
+            result = await db_service.aquery(
                 "SELECT * FROM referrals WHERE referral_id = %s",
                 (referral_id,)
             )
@@ -2467,25 +3146,25 @@ async def process_referral_with_agents(referral_id: str):
 
             # Get caregivers in same city
             city = referral.get('patient_city')
-            caregiver_result = db_service.query(
+            caregiver_result = await db_service.aquery(
                 "SELECT * FROM caregivers WHERE city = %s AND active = 'Y'",
                 (city,)
             )
             caregivers = caregiver_result['data'] if caregiver_result['success'] else []
         else:
-            referrals = _load_referrals_csv()
-            referral = next((r for r in referrals if r.get("referral_id") == referral_id), None)
+            referral = await run_in_threadpool(_find_referral, referral_id)
             if not referral:
                 raise HTTPException(status_code=404, detail=f"Referral {referral_id} not found")
             city = referral.get("patient_city")
-            caregivers = [c for c in _load_caregivers_csv() if c.get("city") == city and str(c.get("active") or "").upper() == "Y"]
+            all_caregivers = await run_in_threadpool(_load_caregivers_csv)
+            caregivers = [c for c in all_caregivers if c.get("city") == city and str(c.get("active") or "").upper() == "Y"]
         
         # Run agent workflow
-        workflow_result = agent_workflow.process_referral(referral, caregivers)
+        workflow_result = await run_in_threadpool(agent_workflow.process_referral, referral, caregivers)
 
         # Attach compliance guardrails (if any) so agents/UI can reference them
         try:
-            guardrails = _load_compliance_docs()
+            guardrails = await run_in_threadpool(_load_compliance_docs)
             if guardrails:
                 top = []
                 for d in guardrails[:5]:
@@ -2525,7 +3204,46 @@ async def process_referral_with_agents(referral_id: str):
         )
 
 
-@app.get("/api/v1/agent/pending-referrals")
+def _rules_file_mtime_ns() -> Optional[int]:
+    try:
+        return os.stat(rules_engine.rules_file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_pending_referrals_sql() -> Optional[str]:
+    """Return the cached pending-referrals query if the rules file is unchanged since it was built."""
+    cached = _pending_referrals_sql
+    if cached and cached[0] == _rules_file_mtime_ns():
+        return cached[1]
+    return None
+
+
+def _build_pending_referrals_sql(sql_parts: Optional[dict] = None) -> str:
+    """Build the pending-referrals query from the rules engine WHERE clause (an LLM call when not given).
+
+    Only a successfully generated clause is cached; the fallback clause is rebuilt on the next call.
+    """
+    global _pending_referrals_sql
+    mtime_ns = _rules_file_mtime_ns()
+    if sql_parts is None:
+        # This worker may not have handled the reload-rules call; re-read the file the key refers to
+        rules_engine.reload_rules()
+        sql_parts = rules_engine.generate_sql_where_clause()
+    logger.info("Pending referrals filter WHERE clause: %s", sql_parts.get('where_clause'))
+
+    # Build query WITHOUT ORDER BY (sorting will be done by AI)
+    query = "SELECT * FROM referrals"
+    if sql_parts.get("where_clause"):
+        # Generated clause may contain literal % (LIKE patterns); escape it since params are bound
+        query += " WHERE " + sql_parts["where_clause"].replace("%", "%%")
+    query += " LIMIT %s"
+
+    _pending_referrals_sql = (mtime_ns, query) if sql_parts.get("success") else None
+    return query
+
+
+@router.get("/api/v1/agent/pending-referrals")
 async def get_pending_referrals():
     """
     Get referrals that are waiting for scheduling
@@ -2535,38 +3253,19 @@ async def get_pending_referrals():
         if not agent_workflow:
             raise HTTPException(status_code=500, detail="Agent Workflow not initialized")
         
-        # Get limit from agent config (default to 50 if not available)
-        max_pending = 50
-        try:
-            if hasattr(agent_workflow, 'scheduling_agent') and hasattr(agent_workflow.scheduling_agent, 'max_pending_referrals'):
-                max_pending = agent_workflow.scheduling_agent.max_pending_referrals
-        except:
-            pass
+        max_pending = max_pending_referrals
         
         if _db_ready():
-            # Step 1: Use rules engine to build WHERE clause (filtering only)
-            print(f"\n{'='*60}")
-            print("STEP 1: APPLYING FILTER RULES")
-            print(f"{'='*60}")
-
-            sql_parts = rules_engine.generate_sql_where_clause()
-            print(f"WHERE Clause: {sql_parts.get('where_clause')}")
-            print(f"{'='*60}\n")
-
-            # Build query WITHOUT ORDER BY (sorting will be done by AI)
-            query = "SELECT * FROM referrals"
-            if sql_parts.get("where_clause"):
-                query += f" WHERE {sql_parts['where_clause']}"
+            # Step 1: Use rules engine to build WHERE clause (filtering only); cached until the rules file changes
+            query = _cached_pending_referrals_sql() or await run_in_threadpool(_build_pending_referrals_sql)
 
             # Get more records than needed so AI can pick the best ones
-            query += f" LIMIT {max_pending * 2}"
-
-            result = db_service.query(query)
+            result = await db_service.aquery(query, (max_pending * 2,))
             if not result.get("success"):
                 raise HTTPException(status_code=500, detail=result.get("message"))
 
             # Step 2: Use AI Sorting Agent to intelligently prioritize
-            sorted_referrals = sorting_agent.sort_referrals(result.get("data") or [])
+            sorted_referrals = await run_in_threadpool(sorting_agent.sort_referrals, result.get("data") or [])
 
             # Step 3: Return top N after AI sorting
             final_referrals = sorted_referrals[:max_pending]
@@ -2577,7 +3276,7 @@ async def get_pending_referrals():
             }
 
         # File/demo mode fallback
-        referrals = _load_referrals_csv()
+        referrals = await run_in_threadpool(_load_referrals_csv)
 
         def _is_ok(r: dict) -> bool:
             return (
@@ -2612,7 +3311,14 @@ async def get_pending_referrals():
         )
 
 
-@app.post("/api/v1/agent/reload-rules")
+@router.post("/api/v1/autopilot/tick")
+async def autopilot_tick():
+    """Run one file-mode autopilot tick now and return once it has been applied."""
+    await run_in_threadpool(_autopilot_tick_all)
+    return {"success": True, "autopilot_enabled": AUTOPILOT_ENABLED}
+
+
+@router.post("/api/v1/agent/reload-rules")
 async def reload_scheduler_rules():
     """
     Reload scheduler rules from config/scheduler_rules.txt
@@ -2620,7 +3326,8 @@ async def reload_scheduler_rules():
     """
     try:
         rules_engine.reload_rules()
-        sql_parts = rules_engine.generate_sql_where_clause()
+        sql_parts = await run_in_threadpool(rules_engine.generate_sql_where_clause)
+        _build_pending_referrals_sql(sql_parts)
         
         return {
             "success": True,
@@ -2637,7 +3344,7 @@ async def reload_scheduler_rules():
         )
 
 
-@app.post("/api/v1/crew/process-referral")
+@router.post("/api/v1/crew/process-referral")
 async def process_referral_with_crew(referral_id: str):
     """
     Process a referral using Crew AI workflow
@@ -2654,7 +3361,7 @@ async def process_referral_with_crew(referral_id: str):
             raise HTTPException(status_code=500, detail="Database service not initialized")
         
         # Fetch referral data
-        referral_result = db_service.query(
+        referral_result = await db_service.aquery(
             f"SELECT * FROM referrals WHERE referral_id = '{referral_id}'"
         )
         
@@ -2664,11 +3371,11 @@ async def process_referral_with_crew(referral_id: str):
         referral_data = referral_result['data'][0]
         
         # Fetch available caregivers
-        caregivers_result = db_service.query("SELECT * FROM caregivers WHERE available = 'Y'")
+        caregivers_result = await db_service.aquery("SELECT * FROM caregivers WHERE available = 'Y'")
         caregivers = caregivers_result.get('data', []) if caregivers_result['success'] else []
         
         # Process through Crew AI workflow
-        result = crew_workflow.process_referral(referral_data, caregivers)
+        result = await run_in_threadpool(crew_workflow.process_referral, referral_data, caregivers)
         
         return result
         
@@ -2681,7 +3388,7 @@ async def process_referral_with_crew(referral_id: str):
         )
 
 
-@app.post("/api/v1/crew/process-batch")
+@router.post("/api/v1/crew/process-batch")
 async def process_batch_with_crew(limit: int = 10):
     """
     Process multiple referrals in batch using Crew AI
@@ -2697,7 +3404,7 @@ async def process_batch_with_crew(limit: int = 10):
             raise HTTPException(status_code=500, detail="Database service not initialized")
         
         # Get pending referrals
-        referrals_result = db_service.query(f"""
+        referrals_result = await db_service.aquery(f"""
             SELECT * FROM referrals 
             WHERE schedule_status = 'NOT_SCHEDULED'
               AND insurance_active = 'Y'
@@ -2710,11 +3417,11 @@ async def process_batch_with_crew(limit: int = 10):
         referrals = referrals_result.get('data', [])
         
         # Get caregivers
-        caregivers_result = db_service.query("SELECT * FROM caregivers WHERE available = 'Y'")
+        caregivers_result = await db_service.aquery("SELECT * FROM caregivers WHERE available = 'Y'")
         caregivers = caregivers_result.get('data', []) if caregivers_result['success'] else []
         
         # Process batch
-        results = crew_workflow.process_batch_referrals(referrals, caregivers)
+        results = await run_in_threadpool(crew_workflow.process_batch_referrals, referrals, caregivers)
         
         return {
             "success": True,
@@ -2731,7 +3438,7 @@ async def process_batch_with_crew(limit: int = 10):
         )
 
 
-@app.get("/api/v1/crew/history")
+@router.get("/api/v1/crew/history")
 async def get_crew_execution_history(limit: int = 20):
     """
     Get Crew AI execution history for monitoring
@@ -2761,7 +3468,7 @@ async def get_crew_execution_history(limit: int = 20):
         )
 
 
-@app.get("/api/v1/crew/stats")
+@router.get("/api/v1/crew/stats")
 async def get_crew_stats():
     """
     Get Crew AI workflow statistics
@@ -2790,7 +3497,7 @@ async def get_crew_stats():
         )
 
 
-@app.post("/api/v1/schedule/confirm")
+@router.post("/api/v1/schedule/confirm")
 async def schedule_referral(referral_id: str, caregiver_id: Optional[str] = None):
     """
     Schedule a referral and send confirmation email
@@ -2803,61 +3510,57 @@ async def schedule_referral(referral_id: str, caregiver_id: Optional[str] = None
         Scheduling result with email confirmation status
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"SCHEDULE REQUEST RECEIVED")
-        print(f"Referral ID: {referral_id}")
-        print(f"Caregiver ID: {caregiver_id}")
-        print(f"{'='*60}\n")
+        logger.info("Schedule request received: referral_id=%s caregiver_id=%s", referral_id, caregiver_id)
         
         if not db_service:
             raise HTTPException(status_code=500, detail="Database service not initialized")
         
         # Fetch referral data
-        referral_result = db_service.query(
+        referral_result = await db_service.aquery(
             f"SELECT * FROM referrals WHERE referral_id = '{referral_id}'"
         )
         
-        print(f"Referral query result: {referral_result.get('success')}")
+        logger.debug("Referral query result: %s", referral_result.get('success'))
         
         if not referral_result['success'] or not referral_result['data']:
             raise HTTPException(status_code=404, detail=f"Referral {referral_id} not found")
         
         referral_data = referral_result['data'][0]
-        print(f"Referral data retrieved: {referral_data.get('referral_id')}")
+        logger.debug("Referral data retrieved: %s", referral_data.get('referral_id'))
         
         # Fetch caregiver data if provided
         caregiver_data = None
         if caregiver_id:
-            caregiver_result = db_service.query(
+            caregiver_result = await db_service.aquery(
                 f"SELECT * FROM caregivers WHERE caregiver_id = '{caregiver_id}'"
             )
             if caregiver_result['success'] and caregiver_result['data']:
                 caregiver_data = caregiver_result['data'][0]
         
         # Update referral status to SCHEDULED
-        print(f"Updating referral status to SCHEDULED...")
-        update_result = db_service.query(f"""
+        logger.debug("Updating referral %s status to SCHEDULED", referral_id)
+        update_result = await db_service.aquery(f"""
             UPDATE referrals 
             SET schedule_status = 'SCHEDULED'
             WHERE referral_id = '{referral_id}'
         """)
         
-        print(f"Update result: {update_result}")
+        logger.debug("Update result: %s", update_result)
         
         if not update_result['success']:
             error_msg = update_result.get('message', 'Unknown error')
-            print(f"Database update failed: {error_msg}")
+            logger.error("Database update failed: %s", error_msg)
             raise HTTPException(status_code=500, detail=f"Failed to update referral status: {error_msg}")
         
         # Send scheduling confirmation email
-        print(f"Sending email confirmation...")
-        print(f"Email service available: {email_service is not None}")
-        email_result = email_service.send_scheduling_confirmation(
+        logger.debug("Sending email confirmation (email service available: %s)", email_service is not None)
+        email_result = await run_in_threadpool(
+            email_service.send_scheduling_confirmation,
             referral_data=referral_data,
             caregiver_data=caregiver_data
         )
         
-        print(f"Email result: {email_result}")
+        logger.debug("Email result: %s", email_result)
         
         return {
             "success": True,
@@ -2872,20 +3575,14 @@ async def schedule_referral(referral_id: str, caregiver_id: Optional[str] = None
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"\n{'='*60}")
-        print(f"SCHEDULE ERROR:")
-        print(f"{'='*60}")
-        print(error_trace)
-        print(f"{'='*60}\n")
+        logger.exception("Scheduling failed for referral %s", referral_id)
         raise HTTPException(
             status_code=500,
             detail=f"Scheduling failed: {str(e)}"
         )
 
 
-@app.post("/api/v1/email/send-notification")
+@router.post("/api/v1/email/send-notification")
 async def send_email_notification(
     referral_id: str,
     notification_type: str = "workflow_update",
@@ -2901,7 +3598,8 @@ async def send_email_notification(
     """
     try:
         if notification_type == "workflow_update":
-            result = email_service.send_workflow_notification(
+            result = await run_in_threadpool(
+                email_service.send_workflow_notification,
                 referral_id=referral_id,
                 workflow_status="Updated",
                 details=details or "Workflow status has been updated"
@@ -2920,6 +3618,55 @@ async def send_email_notification(
         )
 
 
+def create_app() -> FastAPI:
+    """Build the API app: middleware, shared lifespan and the service routers."""
+    app = FastAPI(
+        title="HealthOps API",
+        description="Landing AI-powered medical image processing for healthcare operations",
+        version="1.0.0",
+        default_response_class=DefaultJSONResponse,
+        lifespan=lifespan
+    )
+
+    # Compress HTML tables and large JSON payloads (/api/outcomes, referral lists); tiny bodies pass through
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    app.add_middleware(
+        CORSLite,
+        allow_origins=_CORS_ORIGINS,
+        allow_methods=("GET", "POST"),
+        allow_headers=("Content-Type", "Authorization"),
+        max_age=86400,
+    )
+
+    app.middleware("http")(log_request_timing)
+
+    app.include_router(landingai_router.router, prefix="/api/v1")
+    app.include_router(router)
+
+    # Mount static files (CSS)
+    if STATIC_DIR.exists():
+        app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+    return app
+
+
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple workers need an import string; run from backend/ (uvloop/httptools ship with uvicorn[standard])
+    uvicorn.run(
+        "app:app",
+        host=os.getenv("HEALTHOPS_HOST", "0.0.0.0"),
+        port=int(os.getenv("HEALTHOPS_PORT", "8000")),
+        workers=int(os.getenv("HEALTHOPS_WORKERS", str((os.cpu_count() or 2) * 2 + 1))),
+        loop=os.getenv("HEALTHOPS_LOOP", "uvloop"),
+        http=os.getenv("HEALTHOPS_HTTP", "httptools"),
+        log_level="info",
+        # Request timing is already logged by the log_request_timing middleware
+        access_log=False,
+        backlog=int(os.getenv("HEALTHOPS_BACKLOG", "2048")),
+    )
@@ -1,12 +1,21 @@
+import asyncio
+import logging
 import os
+import threading
+import uuid
+from contextlib import contextmanager
 import psycopg2
 from psycopg2 import pool, sql
+from psycopg2.extras import execute_values
 import csv
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
 from dotenv import load_dotenv
 
 
+logger = logging.getLogger(__name__)
+
+
 class ConfigLoader:
     
     def __init__(self, env_path: str = None):
@@ -24,13 +33,21 @@ class ConfigLoader:
         return os.getenv(key, default)
 
 
+# Defaults; DB_POOL_MIN_CONN / DB_POOL_MAX_CONN override (size max to the API threadpool's DB concurrency)
+POOL_MIN_CONN = 1
+POOL_MAX_CONN = 10
+
+
 class DatabaseService:
     _connection_pool = None
+    # connect() keeps one pooled connection for the long-lived cursor; queries share the rest
+    _pool_slots = threading.BoundedSemaphore(POOL_MAX_CONN - 1)
     
     def __init__(self):
         self.config = ConfigLoader()
         self.connection = None
         self.cursor = None
+        self._lock = threading.Lock()
         self._load_db_config()
         self._init_pool()
     
@@ -45,17 +62,28 @@ class DatabaseService:
         """Initialize connection pool for better performance"""
         if DatabaseService._connection_pool is None:
             try:
-                DatabaseService._connection_pool = psycopg2.pool.SimpleConnectionPool(
-                    1,  # minconn
-                    10,  # maxconn
+                max_conn = max(2, int(self.config.get("DB_POOL_MAX_CONN", POOL_MAX_CONN)))
+                min_conn = min(max_conn, max(1, int(self.config.get("DB_POOL_MIN_CONN", POOL_MIN_CONN))))
+                # Threaded pool: query() is called concurrently from worker threads via aquery()
+                DatabaseService._connection_pool = psycopg2.pool.ThreadedConnectionPool(
+                    min_conn,
+                    max_conn,
                     host=self.db_host,
                     port=self.db_port,
                     database=self.db_name,
                     user=self.db_user,
                     password=self.db_password
                 )
+                DatabaseService._pool_slots = threading.BoundedSemaphore(max_conn - 1)
             except Exception as e:
-                print(f"Failed to create connection pool: {e}")
+                logger.warning("Failed to create connection pool: %s", e)
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Close every pooled connection; the next DatabaseService() builds a fresh pool."""
+        if cls._connection_pool is not None:
+            cls._connection_pool.closeall()
+            cls._connection_pool = None
     
     def connect(self) -> Dict[str, Any]:
         try:
@@ -203,64 +231,201 @@ class DatabaseService:
         
         return self.import_csv_to_table(str(csv_path), 'referrals', columns)
     
+    @contextmanager
+    def _borrow_connection(self):
+        """Connection for a single call: a pooled one when available, else the shared one under a lock."""
+        connection_pool = DatabaseService._connection_pool
+        if connection_pool is None:
+            with self._lock:
+                if not self.connection or not self.cursor:
+                    conn_result = self.connect()
+                    if not conn_result.get("success"):
+                        raise ConnectionError(conn_result.get("message", "Database connection failed"))
+                try:
+                    yield self.connection
+                except Exception:
+                    self._rollback_quietly(self.connection)
+                    raise
+            return
+        with DatabaseService._pool_slots:
+            conn = connection_pool.getconn()
+            try:
+                yield conn
+            except Exception:
+                # Roll back while the connection is still ours, before it goes back to the pool
+                self._rollback_quietly(conn)
+                raise
+            finally:
+                connection_pool.putconn(conn)
+
+    @staticmethod
+    def _rollback_quietly(conn) -> None:
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+    
     def query(self, sql_query: str, params: tuple = None) -> Dict[str, Any]:
         try:
-            # Ensure we have a connection
-            if not self.connection or not self.cursor:
-                conn_result = self.connect()
-                if not conn_result.get("success"):
+            with self._borrow_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql_query, params)
+                    
+                    if sql_query.strip().upper().startswith('SELECT'):
+                        results = cursor.fetchall()
+                        columns = [desc[0] for desc in cursor.description]
+                        
+                        data = [dict(zip(columns, row)) for row in results]
+                        
+                        return {
+                            "success": True,
+                            "data": data,
+                            "row_count": len(data)
+                        }
+                    else:
+                        conn.commit()
+                        return {
+                            "success": True,
+                            "message": "Query executed successfully",
+                            "rows_affected": cursor.rowcount
+                        }
+                
+        except ConnectionError as e:
+            return {
+                "success": False,
+                "message": str(e)
+            }
+        except Exception as e:
+            # _borrow_connection already rolled back before releasing the connection
+            return {
+                "success": False,
+                "message": f"Query failed: {str(e)}"
+            }
+    
+    def iter_query(self, sql_query: str, params: tuple = None, chunksize: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """Yield SELECT results as lists of row dicts, `chunksize` rows at a time, from a server-side cursor.
+
+        The borrowed connection is held until the generator is exhausted or closed; errors propagate.
+        Without a pool the shared connection's lock would be held across every yield (blocking all
+        other queries on a slow client), so that case fetches everything up front and chunks it.
+        """
+        if DatabaseService._connection_pool is None:
+            result = self.query(sql_query, params)
+            if not result.get("success"):
+                raise RuntimeError(result.get("message", "Query failed"))
+            data = result.get("data") or []
+            for start in range(0, len(data), chunksize):
+                yield data[start:start + chunksize]
+            return
+        with self._borrow_connection() as conn:
+            try:
+                with conn.cursor(name=f"healthops_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = chunksize
+                    cursor.execute(sql_query, params)
+                    columns = None
+                    while True:
+                        rows = cursor.fetchmany(chunksize)
+                        if not rows:
+                            break
+                        if columns is None:
+                            columns = [desc[0] for desc in cursor.description]
+                        yield [dict(zip(columns, row)) for row in rows]
+            finally:
+                # End the read transaction that backs the named cursor
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+    
+    async def aquery(self, sql_query: str, params: tuple = None) -> Dict[str, Any]:
+        """Awaitable query(): runs the blocking psycopg2 round-trip in a worker thread."""
+        return await asyncio.to_thread(self.query, sql_query, params)
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[tuple],
+        page_size: int = 100,
+        on_conflict_do_nothing: Optional[str] = None,
+        returning: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Insert `rows` in one transaction using multi-row VALUES (`page_size` rows per statement).
+
+        `on_conflict_do_nothing` names a unique column whose conflicting rows are skipped instead of
+        failing the batch; `returning` names a column whose values for the inserted rows come back
+        under "returned" (rows_affected then counts only those).
+        """
+        if not rows:
+            return {"success": True, "message": "Nothing to insert", "rows_affected": 0, "returned": []}
+        try:
+            with self._borrow_connection() as conn:
+                insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+                    sql.Identifier(table), sql.SQL(",").join(map(sql.Identifier, columns))
+                )
+                if on_conflict_do_nothing:
+                    insert_query += sql.SQL(" ON CONFLICT ({}) DO NOTHING").format(sql.Identifier(on_conflict_do_nothing))
+                if returning:
+                    insert_query += sql.SQL(" RETURNING {}").format(sql.Identifier(returning))
+                with conn.cursor() as cursor:
+                    fetched = execute_values(cursor, insert_query, rows, page_size=page_size, fetch=bool(returning))
+                conn.commit()
+                if returning:
+                    returned = [r[0] for r in fetched]
                     return {
-                        "success": False,
-                        "message": conn_result.get("message", "Database connection failed")
+                        "success": True,
+                        "message": f"Inserted {len(returned)} of {len(rows)} rows into {table}",
+                        "rows_affected": len(returned),
+                        "returned": returned,
                     }
-            
-            self.cursor.execute(sql_query, params)
-            
-            if sql_query.strip().upper().startswith('SELECT'):
-                results = self.cursor.fetchall()
-                columns = [desc[0] for desc in self.cursor.description]
-                
-                data = [dict(zip(columns, row)) for row in results]
-                
-                return {
-                    "success": True,
-                    "data": data,
-                    "row_count": len(data)
-                }
-            else:
-                self.connection.commit()
                 return {
                     "success": True,
-                    "message": "Query executed successfully",
-                    "rows_affected": self.cursor.rowcount
+                    "message": f"Inserted {len(rows)} rows into {table}",
+                    "rows_affected": len(rows)
                 }
-                
+        except ConnectionError as e:
+            return {
+                "success": False,
+                "message": str(e)
+            }
         except Exception as e:
-            if self.connection:
-                try:
-                    self.connection.rollback()
-                except Exception:
-                    pass
+            # _borrow_connection already rolled back before releasing the connection
             return {
                 "success": False,
-                "message": f"Query failed: {str(e)}"
+                "message": f"Bulk insert failed: {str(e)}"
             }
+
+    async def abulk_insert(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[tuple],
+        page_size: int = 100,
+        on_conflict_do_nothing: Optional[str] = None,
+        returning: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Awaitable bulk_insert()."""
+        return await asyncio.to_thread(
+            self.bulk_insert, table, columns, rows, page_size, on_conflict_do_nothing, returning
+        )
     
     def get_table_stats(self) -> Dict[str, Any]:
         stats = {}
         
         try:
-            self.cursor.execute("SELECT COUNT(*) FROM referrals")
-            stats['total_referrals'] = self.cursor.fetchone()[0]
-            
-            self.cursor.execute("SELECT COUNT(*) FROM caregivers")
-            stats['total_caregivers'] = self.cursor.fetchone()[0]
-            
-            self.cursor.execute("SELECT COUNT(*) FROM caregivers WHERE active = 'Y'")
-            stats['active_caregivers'] = self.cursor.fetchone()[0]
-            
-            self.cursor.execute("SELECT COUNT(*) FROM referrals WHERE service_complete = 'N'")
-            stats['active_referrals'] = self.cursor.fetchone()[0]
+            with self._borrow_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT COUNT(*) FROM referrals")
+                    stats['total_referrals'] = cursor.fetchone()[0]
+                    
+                    cursor.execute("SELECT COUNT(*) FROM caregivers")
+                    stats['total_caregivers'] = cursor.fetchone()[0]
+                    
+                    cursor.execute("SELECT COUNT(*) FROM caregivers WHERE active = 'Y'")
+                    stats['active_caregivers'] = cursor.fetchone()[0]
+                    
+                    cursor.execute("SELECT COUNT(*) FROM referrals WHERE service_complete = 'N'")
+                    stats['active_referrals'] = cursor.fetchone()[0]
             
             return {
                 "success": True,
@@ -272,6 +437,9 @@ class DatabaseService:
                 "success": False,
                 "message": f"Failed to get stats: {str(e)}"
             }
+    
+    async def aget_table_stats(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.get_table_stats)
 
 
 if __name__ == "__main__":
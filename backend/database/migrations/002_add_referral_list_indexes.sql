@@ -0,0 +1,9 @@
+-- Migration: Add composite indexes for the filtered referrals list
+-- Run this to update an existing database
+
+-- /api/v1/referrals filters on one of these columns and pages by
+-- ORDER BY referral_received_date DESC LIMIT/OFFSET; these let PostgreSQL
+-- walk the index in order and stop after the page instead of sorting all matches.
+CREATE INDEX IF NOT EXISTS idx_referrals_urgency_received ON referrals(urgency, referral_received_date DESC);
+CREATE INDEX IF NOT EXISTS idx_referrals_segment_received ON referrals(agent_segment, referral_received_date DESC);
+CREATE INDEX IF NOT EXISTS idx_referrals_status_received ON referrals(schedule_status, referral_received_date DESC);
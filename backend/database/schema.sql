@@ -93,6 +93,10 @@ CREATE INDEX idx_referrals_agent_segment ON referrals(agent_segment);
 CREATE INDEX idx_referrals_schedule_status ON referrals(schedule_status);
 CREATE INDEX idx_referrals_received_date ON referrals(referral_received_date);
 CREATE INDEX idx_referrals_payer ON referrals(payer);
+-- Filtered /api/v1/referrals pages: equality filter + ORDER BY received date DESC LIMIT
+CREATE INDEX idx_referrals_urgency_received ON referrals(urgency, referral_received_date DESC);
+CREATE INDEX idx_referrals_segment_received ON referrals(agent_segment, referral_received_date DESC);
+CREATE INDEX idx_referrals_status_received ON referrals(schedule_status, referral_received_date DESC);
 
 CREATE INDEX idx_caregivers_city ON caregivers(city);
 CREATE INDEX idx_caregivers_active ON caregivers(active);
@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+
+from src.models.schemas import ImageRequest, ImageResponse
+
+
+router = APIRouter(tags=["landingai"])
+
+
+def get_service(request: Request):
+    """LandingAIService created once in the app lifespan; None when it failed to initialize."""
+    return getattr(request.app.state, "landingai_service", None)
+
+
+@router.post("/process-image", response_model=ImageResponse)
+async def process_image(request: ImageRequest, landingai_service=Depends(get_service)):
+    try:
+        if not landingai_service:
+            raise HTTPException(
+                status_code=500,
+                detail="Landing AI service not initialized"
+            )
+        
+        result = await landingai_service.process_image(
+            image_data=request.image_data,
+            image_type=request.image_type,
+            task_type=request.task_type
+        )
+        
+        return ImageResponse(**result)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Image processing failed: {str(e)}"
+        )
+
+
+@router.post("/upload-image", response_model=ImageResponse)
+async def upload_image(
+    file: UploadFile = File(...),
+    image_type: str = None,
+    task_type: str = "defect_detection",
+    landingai_service=Depends(get_service),
+):
+    try:
+        if not landingai_service:
+            raise HTTPException(
+                status_code=500,
+                detail="Landing AI service not initialized"
+            )
+        
+        # Stream the spooled upload straight to the service instead of buffering it with
+        # `await file.read()`; Starlette already rolls large bodies over to disk.
+        result = await landingai_service.process_image_file(
+            image_file=file.file,
+            image_type=image_type,
+            task_type=task_type
+        )
+        
+        return ImageResponse(**result)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Image upload failed: {str(e)}"
+        )
+
+
+@router.post("/validate-predictions")
+async def validate_predictions(predictions: list, landingai_service=Depends(get_service)):
+    try:
+        if not landingai_service:
+            raise HTTPException(
+                status_code=500,
+                detail="Landing AI service not initialized"
+            )
+        
+        result = await landingai_service.validate_predictions(predictions)
+        return result
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Validation failed: {str(e)}"
+        )
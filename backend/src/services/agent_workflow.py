@@ -1,3 +1,4 @@
+import logging
 import os
 import yaml
 import requests
@@ -6,13 +7,15 @@ from datetime import datetime
 from dotenv import load_dotenv
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Try to import Google Generative AI
 try:
     import google.generativeai as genai
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
-    print("Warning: google-generativeai not installed. Using fallback logic.")
+    logger.warning("google-generativeai not installed. Using fallback logic.")
 
 
 class ConfigLoader:
@@ -39,7 +42,7 @@ class ConfigLoader:
             with open(full_path, 'r') as f:
                 self.yaml_config = yaml.safe_load(f)
         except FileNotFoundError:
-            print(f"Warning: Config file not found at {full_path}, using defaults")
+            logger.warning("Config file not found at %s, using defaults", full_path)
             self.yaml_config = {}
     
     @staticmethod
@@ -79,9 +82,9 @@ class ReferralValidationAgent:
             try:
                 genai.configure(api_key=self.google_api_key)
                 self.gemini_model = genai.GenerativeModel('gemini-2.0-flash')
-                print(f"[{self.agent_name}] Gemini AI initialized")
+                logger.info("[%s] Gemini AI initialized", self.agent_name)
             except Exception as e:
-                print(f"[{self.agent_name}] Gemini init failed: {e}")
+                logger.warning("[%s] Gemini init failed: %s", self.agent_name, e)
         
         # Load all scoring parameters from config
         self.insurance_penalty = self.config.get_yaml('validation_agent', 'scoring', 'insurance_inactive_penalty', default=30)
@@ -194,7 +197,7 @@ Respond with a clear action: PROCEED, HOLD, or BLOCK, followed by specific next
                 if response and response.text:
                     return response.text.strip()
             except Exception as e:
-                print(f"[{self.agent_name}] Gemini failed: {e}")
+                logger.warning("[%s] Gemini failed: %s", self.agent_name, e)
         
         # Fallback to rule-based
         if validation["status"] == "BLOCKED":
@@ -225,9 +228,9 @@ class CaregiverMatchingAgent:
             try:
                 genai.configure(api_key=self.google_api_key)
                 self.gemini_model = genai.GenerativeModel('gemini-2.0-flash')
-                print(f"[{self.agent_name}] Gemini AI initialized")
+                logger.info("[%s] Gemini AI initialized", self.agent_name)
             except Exception as e:
-                print(f"[{self.agent_name}] Gemini init failed: {e}")
+                logger.warning("[%s] Gemini init failed: %s", self.agent_name, e)
         
         # Load scoring parameters from config
         self.city_match_points = self.config.get_yaml('matching_agent', 'scoring', 'city_match_points', default=40)
@@ -331,14 +334,14 @@ Recommend which caregiver to assign and why. Be specific about the best match.""
 
                 response = self.gemini_model.generate_content(prompt)
                 recommendation = response.text.strip()
-                print(f"[{self.agent_name}] Gemini recommendation: {recommendation[:100]}...")
+                logger.info("[%s] Gemini recommendation: %s...", self.agent_name, recommendation[:100])
                 return recommendation
                 
             except Exception as e:
-                print(f"[{self.agent_name}] Gemini recommendation failed: {e}")
+                logger.warning("[%s] Gemini recommendation failed: %s", self.agent_name, e)
         
         # Fallback to rule-based only if Gemini unavailable
-        print(f"[{self.agent_name}] Using fallback rule-based recommendation")
+        logger.info("[%s] Using fallback rule-based recommendation", self.agent_name)
         if len(matches) >= 3:
             return f"EXCELLENT: Found {len(matches)} matching caregivers. Top match: {matches[0]['caregiver_id']} ({matches[0]['match_score']}%)"
         elif len(matches) > 0:
@@ -364,9 +367,9 @@ class SchedulingAgent:
             try:
                 genai.configure(api_key=self.google_api_key)
                 self.gemini_model = genai.GenerativeModel('gemini-2.0-flash')
-                print(f"[{self.agent_name}] Gemini AI initialized")
+                logger.info("[%s] Gemini AI initialized", self.agent_name)
             except Exception as e:
-                print(f"[{self.agent_name}] Gemini init failed: {e}")
+                logger.warning("[%s] Gemini init failed: %s", self.agent_name, e)
         
         # Load scheduling parameters from config
         self.max_units_per_week = self.config.get_yaml('scheduling_agent', 'limits', 'max_units_per_week', default=20)
@@ -501,14 +504,14 @@ Provide clear next steps for the coordinator."""
 
                 response = self.gemini_model.generate_content(prompt)
                 recommendation = response.text.strip()
-                print(f"[{self.agent_name}] Gemini recommendation: {recommendation[:100]}...")
+                logger.info("[%s] Gemini recommendation: %s...", self.agent_name, recommendation[:100])
                 return recommendation
                 
             except Exception as e:
-                print(f"[{self.agent_name}] Gemini recommendation failed: {e}")
+                logger.warning("[%s] Gemini recommendation failed: %s", self.agent_name, e)
         
         # Fallback to rule-based only if Gemini unavailable
-        print(f"[{self.agent_name}] Using fallback rule-based recommendation")
+        logger.info("[%s] Using fallback rule-based recommendation", self.agent_name)
         if action == "SCHEDULE_NOW":
             return f"SCHEDULE NOW [{priority}]: {rationale}"
         elif action == "HOLD":
@@ -542,7 +545,7 @@ class AgentWorkflow:
         }
         
         # Agent 1: Validate
-        print(f"\nAgent 1: Validating referral {referral.get('referral_id')}...")
+        logger.info("Agent 1: Validating referral %s...", referral.get('referral_id'))
         validation = self.validation_agent.validate_referral(referral)
         validation_rec = self.validation_agent.get_agent_recommendation(validation)
         
@@ -566,7 +569,7 @@ class AgentWorkflow:
             workflow_result["matches"] = []
             workflow_result["matching_recommendation"] = "SKIPPED: Home assessment pending - complete assessment first"
         else:
-            print(f"Agent 2: Finding matching caregivers...")
+            logger.info("Agent 2: Finding matching caregivers...")
             matches = self.matching_agent.match_caregivers(referral, caregivers)
             matching_rec = self.matching_agent.get_agent_recommendation(
                 referral.get("referral_id"), 
@@ -578,7 +581,7 @@ class AgentWorkflow:
             workflow_result["agents_executed"].append("CaregiverMatchingAgent")
         
         # Agent 3: Create schedule recommendation
-        print(f"Agent 3: Creating schedule recommendation...")
+        logger.info("Agent 3: Creating schedule recommendation...")
         top_match = matches[0] if matches else None
         schedule_rec = self.scheduling_agent.create_schedule_recommendation(
             referral, 
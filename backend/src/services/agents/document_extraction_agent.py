@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Any
 from ..agent_base import BaseAgent, AgentResult
-from ..landingai_service import LandingAIService
+from ..registry import get_landingai_service
 import asyncio
 
 
@@ -10,7 +10,7 @@ class DocumentExtractionAgent(BaseAgent):
     name = "DocumentExtractionAgent"
 
     def __init__(self):
-        self.service = LandingAIService()
+        self.service = get_landingai_service()
 
     def run(self, context: Dict[str, Any]) -> AgentResult:
         file_path = context.get("file_path")
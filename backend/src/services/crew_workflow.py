@@ -3,6 +3,7 @@ Crew AI Workflow for HealthOps Referral Processing
 Uses Crew AI framework to orchestrate healthcare referral agents
 """
 
+import logging
 import os
 from typing import Dict, Any, List
 from pathlib import Path
@@ -16,6 +17,8 @@ import json
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(env_path)
 
+logger = logging.getLogger(__name__)
+
 
 class HealthOpsCrewWorkflow:
     """
@@ -46,7 +49,7 @@ class HealthOpsCrewWorkflow:
             with open(config_path, 'r') as f:
                 return yaml.safe_load(f)
         except FileNotFoundError:
-            print(f"Warning: Config file not found at {config_path}")
+            logger.warning("Config file not found at %s", config_path)
             return {}
     
     def _get_swarms_llm(self) -> LLM:
@@ -226,25 +229,23 @@ class HealthOpsCrewWorkflow:
             "tasks_completed": []
         }
         
-        print(f"\n{'='*60}")
-        print(f"CREW AI WORKFLOW STARTED - Referral: {referral_id}")
-        print(f"{'='*60}\n")
+        logger.info("Crew AI workflow started - referral: %s", referral_id)
         
         # Create agents
-        print("Creating AI Agents...")
+        logger.info("Creating AI Agents...")
         validation_agent = self.create_referral_validation_agent()
         matching_agent = self.create_caregiver_matching_agent()
         compliance_agent = self.create_compliance_agent()
         execution_log["agents_executed"] = ["Validation", "Matching", "Compliance"]
         
         # Create tasks
-        print("Creating Tasks...")
+        logger.info("Creating Tasks...")
         validation_task = self.create_validation_task(validation_agent, referral_data)
         matching_task = self.create_matching_task(matching_agent, referral_data, caregivers)
         compliance_task = self.create_compliance_task(compliance_agent, referral_data)
         
         # Create crew with sequential process
-        print("Initializing Crew...\n")
+        logger.info("Initializing Crew...")
         crew = Crew(
             agents=[validation_agent, matching_agent, compliance_agent],
             tasks=[validation_task, matching_task, compliance_task],
@@ -254,7 +255,7 @@ class HealthOpsCrewWorkflow:
         
         # Execute the crew
         try:
-            print(f"Executing Crew Workflow for {referral_id}...\n")
+            logger.info("Executing Crew Workflow for %s...", referral_id)
             result = crew.kickoff()
             
             end_time = datetime.now()
@@ -271,9 +272,7 @@ class HealthOpsCrewWorkflow:
             # Add to history
             self._add_to_history(execution_log)
             
-            print(f"\n{'='*60}")
-            print(f"WORKFLOW COMPLETED - Duration: {duration:.2f}s")
-            print(f"{'='*60}\n")
+            logger.info("Crew workflow completed - duration: %.2fs", duration)
             
             return {
                 "success": True,
@@ -298,10 +297,7 @@ class HealthOpsCrewWorkflow:
             # Add to history
             self._add_to_history(execution_log)
             
-            print(f"\n{'='*60}")
-            print(f"WORKFLOW FAILED - Duration: {duration:.2f}s")
-            print(f"Error: {str(e)}")
-            print(f"{'='*60}\n")
+            logger.error("Crew workflow failed - duration: %.2fs, error: %s", duration, e)
             
             return {
                 "success": False,
@@ -3,6 +3,7 @@ Email Service for HealthOps
 Sends notifications using Gmail API for scheduling confirmations and workflow updates
 """
 
+import logging
 import os
 import smtplib
 from email.mime.text import MIMEText
@@ -15,6 +16,8 @@ import requests
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class EmailService:
     """
@@ -229,12 +232,7 @@ class EmailService:
             
             # Check if SMTP credentials are configured
             if not self.gmail_app_password:
-                print(f"\n{'='*60}")
-                print(f"EMAIL NOTIFICATION (NOT SENT - NO APP PASSWORD)")
-                print(f"{'='*60}")
-                print(f"To: {to_email}")
-                print(f"Subject: {subject}")
-                print(f"{'='*60}\n")
+                logger.warning("Email notification not sent (no app password) - to: %s, subject: %s", to_email, subject)
                 return {
                     "success": False,
                     "message": "Gmail App Password not configured",
@@ -249,12 +247,7 @@ class EmailService:
                 server.login(self.sender_email, self.gmail_app_password)
                 server.send_message(msg)
             
-            print(f"\n{'='*60}")
-            print(f"EMAIL SENT SUCCESSFULLY")
-            print(f"{'='*60}")
-            print(f"To: {to_email}")
-            print(f"Subject: {subject}")
-            print(f"{'='*60}\n")
+            logger.info("Email sent - to: %s, subject: %s", to_email, subject)
             
             return {
                 "success": True,
@@ -265,7 +258,7 @@ class EmailService:
             }
             
         except Exception as e:
-            print(f"\nEMAIL ERROR: {str(e)}\n")
+            logger.error("Email error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
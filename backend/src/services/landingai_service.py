@@ -1,16 +1,31 @@
+import asyncio
+import logging
 import os
 import yaml
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import base64
+import hashlib
 import io
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, BinaryIO
 from PIL import Image
 from dotenv import load_dotenv
 from fpdf import FPDF
 
 
+logger = logging.getLogger(__name__)
+
+# Successful parse results are reused for identical inputs (same bytes + type) within the TTL
+RESULT_CACHE_MAX_ENTRIES = 256
+RESULT_CACHE_TTL_SEC = 3600
+
+# Keep-alive connections kept open to the LandingAI API for concurrent parses
+HTTP_POOL_MAXSIZE = 8
+
+
 class ConfigLoader:
     
     def __init__(self, env_path: str = None):
@@ -59,6 +74,7 @@ class LandingAIService:
         self._initialize_client()
         self._load_prompts()
         self._load_extraction_rules()
+        self._result_cache: OrderedDict = OrderedDict()
     
     def _initialize_client(self):
         self.api_key = self.config.get("LANDING_AI_API_KEY")
@@ -70,6 +86,10 @@ class LandingAIService:
             "Authorization": f"Bearer {self.api_key}"
         }
         self.confidence_threshold = float(self.config.get("CONFIDENCE_THRESHOLD", "0.5"))
+        # One keep-alive session shared by all parse calls (they run concurrently in worker threads)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+        self._session.mount("https://", adapter)
     
     def _load_prompts(self):
         self.defect_detection_prompt = self.prompt_loader.load_prompt(
@@ -97,18 +117,21 @@ class LandingAIService:
             rules_path = current_dir / "data" / "extraction_rules.yaml"
             
             if not rules_path.exists():
-                print(f"Warning: Extraction rules file not found at {rules_path}")
+                logger.warning("Extraction rules file not found at %s", rules_path)
                 self.extraction_rules = {}
                 return
             
             with open(rules_path, 'r', encoding='utf-8') as f:
                 self.extraction_rules = yaml.safe_load(f)
             
-            print(f"Loaded extraction rules from {rules_path}")
-            print(f"Available document types: {list(self.extraction_rules.get('extraction_rules', {}).keys())}")
+            logger.info(
+                "Loaded extraction rules from %s; document types: %s",
+                rules_path,
+                list(self.extraction_rules.get('extraction_rules', {}).keys()),
+            )
             
         except Exception as e:
-            print(f"Error loading extraction rules: {e}")
+            logger.error("Error loading extraction rules: %s", e)
             self.extraction_rules = {}
     
     def get_document_type_from_text(self, text: str) -> str:
@@ -159,11 +182,74 @@ class LandingAIService:
         pdf.output(out)
         return out.getvalue()
     
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.time() - stored_at > RESULT_CACHE_TTL_SEC:
+            self._result_cache.pop(key, None)
+            return None
+        self._result_cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: tuple, result: Dict[str, Any]) -> None:
+        if not result.get("success"):
+            return
+        self._result_cache[key] = (time.time(), result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    @staticmethod
+    def _digest_file(fh: BinaryIO) -> str:
+        h = hashlib.blake2b(digest_size=20)
+        fh.seek(0)
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+        fh.seek(0)
+        return h.hexdigest()
+
     async def process_document(
         self, 
         file_path: str = None,
         file_bytes: bytes = None,
         document_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        cache_key = None
+        if file_bytes:
+            cache_key = ("document", hashlib.blake2b(file_bytes, digest_size=20).hexdigest(), document_type)
+        elif file_path:
+            try:
+                st = Path(file_path).stat()
+                cache_key = ("document", str(file_path), st.st_mtime_ns, st.st_size, document_type)
+            except OSError:
+                cache_key = None
+        if cache_key:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = await self._process_document(file_path=file_path, file_bytes=file_bytes, document_type=document_type)
+        if cache_key:
+            self._cache_put(cache_key, result)
+        return result
+
+    async def _process_document(
+        self, 
+        file_path: str = None,
+        file_bytes: bytes = None,
+        document_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        # Text-to-PDF conversion and the blocking HTTP call run in a worker thread so
+        # several documents can be parsed concurrently
+        return await asyncio.to_thread(self._process_document_sync, file_path, file_bytes, document_type)
+
+    def _process_document_sync(
+        self,
+        file_path: str = None,
+        file_bytes: bytes = None,
+        document_type: Optional[str] = None
     ) -> Dict[str, Any]:
         start_time = time.time()
         
@@ -188,7 +274,7 @@ class LandingAIService:
                     content_type = 'application/pdf' if suffix == '.pdf' else 'application/octet-stream'
                     files = {'document': (Path(file_path).name, content, content_type)}
 
-                response = requests.post(
+                response = self._session.post(
                     f"{self.base_url}/parse",
                     headers=self.headers,
                     files=files,
@@ -207,7 +293,7 @@ class LandingAIService:
                 else:
                     files = {'document': ('document.pdf', file_bytes, 'application/pdf')}
 
-                response = requests.post(
+                response = self._session.post(
                     f"{self.base_url}/parse",
                     headers=self.headers,
                     files=files,
@@ -269,6 +355,124 @@ class LandingAIService:
                 "processing_time": processing_time
             }
     
+    async def process_image(
+        self,
+        image_data: str,
+        image_type: Optional[str] = None,
+        task_type: str = "defect_detection"
+    ) -> Dict[str, Any]:
+        """Base64 entry point for JSON clients; decodes once and delegates to the raw-bytes path."""
+        try:
+            # Multi-MB payloads: decode off the event loop
+            image_bytes = await asyncio.to_thread(base64.b64decode, image_data)
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Invalid base64 image data: {str(e)}",
+                "image_type": image_type,
+                "task_type": task_type,
+                "processing_time": 0.0
+            }
+        return await self.process_image_bytes(image_bytes, image_type=image_type, task_type=task_type)
+
+    async def process_image_bytes(
+        self,
+        image_bytes: bytes,
+        image_type: Optional[str] = None,
+        task_type: str = "defect_detection"
+    ) -> Dict[str, Any]:
+        return await self.process_image_file(io.BytesIO(image_bytes or b""), image_type=image_type, task_type=task_type)
+
+    async def process_image_file(
+        self,
+        image_file: BinaryIO,
+        image_type: Optional[str] = None,
+        task_type: str = "defect_detection"
+    ) -> Dict[str, Any]:
+        """Send a seekable binary file (e.g. an upload's SpooledTemporaryFile) without copying it into memory first."""
+        digest = await asyncio.to_thread(self._digest_file, image_file)
+        cache_key = ("image", digest, image_type, task_type)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self._process_image_file(image_file, image_type=image_type, task_type=task_type)
+        self._cache_put(cache_key, result)
+        return result
+
+    async def _process_image_file(
+        self,
+        image_file: BinaryIO,
+        image_type: Optional[str] = None,
+        task_type: str = "defect_detection"
+    ) -> Dict[str, Any]:
+        # Format sniffing, reading the upload and the blocking HTTP call all run in a worker thread
+        return await asyncio.to_thread(self._process_image_file_sync, image_file, image_type, task_type)
+
+    def _process_image_file_sync(
+        self,
+        image_file: BinaryIO,
+        image_type: Optional[str] = None,
+        task_type: str = "defect_detection"
+    ) -> Dict[str, Any]:
+        start_time = time.time()
+
+        try:
+            image_file.seek(0, io.SEEK_END)
+            if image_file.tell() == 0:
+                raise ValueError("Image data must be provided")
+            image_file.seek(0)
+
+            try:
+                image_format = Image.open(image_file).format
+            except Exception:
+                image_format = None
+            image_file.seek(0)
+            content_type = Image.MIME.get(image_format, 'application/octet-stream')
+            extension = (image_format or "bin").lower()
+            files = {'document': (f"image.{extension}", image_file, content_type)}
+
+            response = self._session.post(
+                f"{self.base_url}/parse",
+                headers=self.headers,
+                files=files,
+                timeout=30
+            )
+
+            if response.status_code != 200:
+                raise Exception(f"API Error: {response.status_code} - {response.text}")
+
+            result = response.json()
+
+            predictions = []
+            for chunk in result.get("chunks", []):
+                grounding = chunk.get("grounding") or {}
+                predictions.append({
+                    "label": chunk.get("type") or "text",
+                    "confidence": float(chunk.get("confidence", 0.95)),
+                    "bounding_box": grounding.get("box"),
+                    "metadata": {"text": chunk.get("markdown", "")}
+                })
+
+            return {
+                "success": True,
+                "message": "Image processed successfully",
+                "predictions": predictions,
+                "total_detections": len(predictions),
+                "image_type": image_type,
+                "task_type": task_type,
+                "processing_time": time.time() - start_time
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Failed to process image: {str(e)}",
+                "image_type": image_type,
+                "task_type": task_type,
+                "processing_time": time.time() - start_time
+            }
+
     async def validate_extraction(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         try:
             # Get document type and extraction rules
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_landingai_service():
+    """Process-wide LandingAIService; construction failures are not cached, so a later call can retry."""
+    from .landingai_service import LandingAIService
+    return LandingAIService()
+
+
+@lru_cache(maxsize=1)
+def get_langchain_service():
+    """Process-wide LangChainService, imported lazily since langchain is an optional dependency."""
+    from .langchain_service import LangChainService
+    return LangChainService()
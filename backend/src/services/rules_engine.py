@@ -3,6 +3,7 @@ Rules Engine for AI Agent Scheduler
 Converts natural language rules to SQL WHERE clauses using LLM
 """
 
+import logging
 import os
 import yaml
 from pathlib import Path
@@ -16,6 +17,8 @@ except ModuleNotFoundError:
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class SchedulerRulesEngine:
     """
@@ -38,19 +41,19 @@ class SchedulerRulesEngine:
             with open(self.rules_file_path, 'r') as f:
                 return f.read()
         except Exception as e:
-            print(f"Error loading rules file: {e}")
+            logger.error("Error loading rules file: %s", e)
             return ""
     
     def _initialize_llm(self):
         """Initialize Google Gemini client"""
         if genai is None:
-            print("WARNING: google-generativeai not installed. AI features will use fallback.")
+            logger.warning("google-generativeai not installed. AI features will use fallback.")
             return None
 
         google_api_key = os.getenv('GOOGLE_API_KEY')
         
         if not google_api_key or google_api_key == 'your_google_api_key_here':
-            print("WARNING: GOOGLE_API_KEY not set. AI features will use fallback.")
+            logger.warning("GOOGLE_API_KEY not set. AI features will use fallback.")
             return None
         
         genai.configure(api_key=google_api_key)
@@ -113,7 +116,7 @@ WHERE: schedule_status NOT IN ('SCHEDULED', 'COMPLETED') AND auth_units_remainin
                     where_clause = line.replace('WHERE:', '').strip()
                     break
             
-            print(f"✓ AI generated WHERE clause: {where_clause}")
+            logger.info("AI generated WHERE clause: %s", where_clause)
             
             return {
                 "success": True,
@@ -122,7 +125,7 @@ WHERE: schedule_status NOT IN ('SCHEDULED', 'COMPLETED') AND auth_units_remainin
             }
             
         except Exception as e:
-            print(f"Error generating SQL from rules: {e}")
+            logger.warning("Error generating SQL from rules: %s", e)
             # Fallback to basic rules
             return {
                 "success": False,
@@ -3,6 +3,7 @@ AI Sorting Agent for Intelligent Referral Prioritization
 Uses Google Gemini LLM to intelligently sort and prioritize referrals
 """
 
+import logging
 import os
 from typing import List, Dict, Any
 from pathlib import Path
@@ -15,6 +16,8 @@ except ModuleNotFoundError:
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class SortingAgent:
     """
@@ -28,13 +31,13 @@ class SortingAgent:
     def _initialize_llm(self):
         """Initialize Google Gemini client"""
         if genai is None:
-            print("WARNING: google-generativeai not installed. AI sorting will use fallback.")
+            logger.warning("google-generativeai not installed. AI sorting will use fallback.")
             return None
 
         google_api_key = os.getenv('GOOGLE_API_KEY')
         
         if not google_api_key or google_api_key == 'your_google_api_key_here':
-            print("WARNING: GOOGLE_API_KEY not set. AI sorting will use fallback.")
+            logger.warning("GOOGLE_API_KEY not set. AI sorting will use fallback.")
             return None
         
         genai.configure(api_key=google_api_key)
@@ -53,9 +56,7 @@ class SortingAgent:
         if not referrals or len(referrals) <= 1:
             return referrals
         
-        print(f"\n{'='*60}")
-        print(f"AI SORTING AGENT - Prioritizing {len(referrals)} referrals")
-        print(f"{'='*60}")
+        logger.info("AI sorting agent - prioritizing %d referrals", len(referrals))
         
         # Extract key info for sorting decision
         referral_summaries = []
@@ -117,17 +118,19 @@ Your sorted indices:"""
             # Apply sorting
             sorted_referrals = [referrals[idx] for idx in sorted_indices]
             
-            print(f"✓ Sorted {len(sorted_referrals)} referrals by AI priority")
-            print(f"Top 3 priorities:")
-            for i, ref in enumerate(sorted_referrals[:3], 1):
-                print(f"  {i}. {ref.get('referral_id')} - {ref.get('urgency')} - {ref.get('contact_attempts', 0)} attempts")
-            print(f"{'='*60}\n")
+            logger.info(
+                "Sorted %d referrals by AI priority; top: %s",
+                len(sorted_referrals),
+                ", ".join(
+                    f"{ref.get('referral_id')} ({ref.get('urgency')}, {ref.get('contact_attempts', 0)} attempts)"
+                    for ref in sorted_referrals[:3]
+                ),
+            )
             
             return sorted_referrals
             
         except Exception as e:
-            print(f"AI Sorting failed: {e}")
-            print(f"Falling back to basic urgency sorting")
+            logger.warning("AI sorting failed: %s; falling back to basic urgency sorting", e)
             # Fallback: simple urgency-based sorting
             return sorted(
                 referrals,